@@ -5,8 +5,10 @@ ways.
 from __future__ import annotations
 
 import ast
+import asyncio
 import base64
 import contextlib
+import gc
 import importlib
 import logging
 import os
@@ -29,13 +31,16 @@ from bokeh.core.validation import silence
 from bokeh.core.validation.warnings import EMPTY_LAYOUT
 from bokeh.server.contexts import ApplicationContext
 from bokeh.settings import settings
-from tornado.ioloop import PeriodicCallback
+from tornado.ioloop import IOLoop, PeriodicCallback
 from tornado.web import StaticFileHandler
 
 from ..auth import BasicAuthProvider, OAuthProvider
 from ..config import config
+from ..io.blobs import blob_store
 from ..io.document import _cleanup_doc
+from ..io.downloads import download_store
 from ..io.liveness import LivenessHandler
+from ..io.metrics import _METRICS, MetricsHandler
 from ..io.reload import record_modules, watch
 from ..io.resources import DIST_DIR
 from ..io.rest import REST_PROVIDERS
@@ -290,9 +295,15 @@ class Serve(_BkServe):
         ('--setup', Argument(
             action  = 'store',
             type    = str,
-            help    = "Path to a setup script to run before server starts. If --num-procs is enabled it will be run in each process after the server has started.",
+            help    = ("Path to a setup script to run before server starts. If --num-procs is enabled it will be run "
+                       "in each process after the server has started, unless --prefork is enabled."),
             default = None
         )),
+        ('--prefork', Argument(
+            action  = 'store_true',
+            help    = ("Whether to run the setup script and warm up the applications once before forking the "
+                       "--num-procs worker processes, which share the loaded modules and data copy-on-write.")
+        )),
         ('--liveness', Argument(
             action  = 'store_true',
             help    = "Whether to add a liveness endpoint."
@@ -307,6 +318,12 @@ class Serve(_BkServe):
             action  = 'append',
             type    = str
         )),
+        ('--metrics-endpoint', Argument(
+            action  = 'store',
+            type    = str,
+            help    = "The endpoint to serve server metrics on in the Prometheus text format.",
+            default = None
+        )),
         ('--reuse-sessions', Argument(
             action  = 'store',
             help    = "Whether to reuse sessions when serving the initial request.",
@@ -314,6 +331,49 @@ class Serve(_BkServe):
             const   = True,
             nargs   = "?"
         )),
+        ('--session-pool', Argument(
+            action  = 'store',
+            type    = int,
+            help    = "The number of sessions of each application to create ahead of time.",
+            default = 0
+        )),
+        ('--max-sessions', Argument(
+            action  = 'store',
+            type    = int,
+            help    = "The maximum number of live sessions per process, beyond which new sessions are refused.",
+            default = None
+        )),
+        ('--max-loop-lag', Argument(
+            action  = 'store',
+            type    = float,
+            help    = "The maximum event loop lag (in seconds), beyond which new sessions are refused.",
+            default = None
+        )),
+        ('--max-thread-queue', Argument(
+            action  = 'store',
+            type    = int,
+            help    = "The maximum number of tasks waiting for a thread, beyond which new sessions are refused.",
+            default = None
+        )),
+        ('--max-memory', Argument(
+            action  = 'store',
+            type    = float,
+            help    = "The maximum memory usage (in MB) per process, beyond which new sessions are refused.",
+            default = None
+        )),
+        ('--waiting-room', Argument(
+            action  = 'store_true',
+            help    = "Whether to render a waiting room page, which retries periodically, when refusing new sessions.",
+        )),
+        ('--slow-callback-threshold', Argument(
+            action  = 'store',
+            type    = float,
+            help    = (
+                "The duration (in seconds) beyond which callbacks blocking the event loop are "
+                "logged, along with the session, component and stack."
+            ),
+            default = None
+        )),
         ('--global-loading-spinner', Argument(
             action  = 'store_true',
             help    = "Whether to add a global loading spinner to the application(s).",
@@ -377,6 +437,10 @@ class Serve(_BkServe):
             kwargs["ico_path"] = DIST_DIR / "images" / "favicon.ico"
         static_dirs = parse_vars(args.static_dirs) if args.static_dirs else {}
         patterns += get_static_routes(static_dirs)
+        if args.num_procs > 1:
+            # Blobs and downloads are held in memory by the process that
+            # registered them, while requests may be handled by any process
+            blob_store.serving = download_store.serving = False
 
         files = []
         for f in args.files:
@@ -421,6 +485,14 @@ class Serve(_BkServe):
 
         config.global_loading_spinner = args.global_loading_spinner
         config.reuse_sessions = args.reuse_sessions
+        config.session_pool = args.session_pool
+        for limit in ('max_sessions', 'max_loop_lag', 'max_thread_queue', 'max_memory'):
+            if getattr(args, limit) is not None:
+                setattr(config, limit, getattr(args, limit))
+        if args.waiting_room:
+            config.waiting_room = True
+        if args.slow_callback_threshold is not None:
+            config.slow_callback_threshold = args.slow_callback_threshold
 
         if args.root_path:
             root_path = args.root_path
@@ -437,6 +509,12 @@ class Serve(_BkServe):
             for f in files:
                 watch(f)
 
+        # Setup and warm up once in the parent process before forking
+        prefork = args.prefork and args.num_procs != 1
+        if prefork:
+            # Tasks are scheduled on the event loop of each worker
+            state._deferred_tasks = []
+
         if args.setup:
             module_name = 'panel_setup_module'
             module = ModuleType(module_name)
@@ -451,14 +529,14 @@ class Serve(_BkServe):
                 code = compile(nodes, filename=setup_path, mode='exec', dont_inherit=True)
                 exec(code, state._setup_module.__dict__)
 
-            if args.num_procs > 1:
+            if args.num_procs > 1 and not prefork:
                 # We will run the setup_file for each process
                 state._setup_file_callback = setup_file
             else:
                 state._setup_file_callback = None
                 setup_file()
 
-        if args.warm or config.autoreload:
+        if args.warm or config.autoreload or prefork:
             argvs = {f: args.args for f in files}
             applications = build_single_handler_applications(files, argvs)
             if config.autoreload:
@@ -478,6 +556,10 @@ class Serve(_BkServe):
             applications = build_single_handler_applications(files, argvs)
             patterns += [(rf"/{args.liveness_endpoint}", LivenessHandler, dict(applications=applications))]
 
+        if args.metrics_endpoint:
+            _METRICS.enable()
+            patterns += [(rf"/{args.metrics_endpoint.strip('/')}", MetricsHandler)]
+
         config.profiler = args.profiler
         if args.admin:
             from ..io.admin import admin_panel
@@ -765,8 +847,30 @@ class Serve(_BkServe):
         if config.cookie_secret:
             kwargs['cookie_secret'] = config.cookie_secret
 
+        if prefork:
+            self.prepare_fork()
+
         return kwargs
 
+    def prepare_fork(self):
+        '''Prepares the process to be forked into the worker processes,
+        which share the memory of the parent process copy-on-write.
+        '''
+        # Threads and the event loop of the parent cannot be used by
+        # the workers
+        if state._thread_pool is not None:
+            state._thread_pool.shutdown(wait=True, _shared=False)
+            state._thread_pool = None
+        loop = IOLoop.current(instance=False)
+        if loop is not None:
+            loop.close()
+            asyncio.set_event_loop(None)
+        # Move all objects into the permanent generation, so that
+        # garbage collection in the workers does not touch (and
+        # therefore copy) the memory pages holding them
+        gc.collect()
+        gc.freeze()
+
     def invoke(self, args: argparse.Namespace):
         # Autoreload must be enabled before the application(s) are executed
         # to avoid erroring out
@@ -137,6 +137,15 @@ class _config(_base_config):
     cache_path = param.Path(default="./cache", check_exists=False, doc="""
         Path the cache decorator will write to if diskcache is enabled.""")
 
+    cache_shared_path = param.Path(default=None, check_exists=False, doc="""
+        Path the cache decorator and pn.state.as_cached will write to
+        if the shared backend is used. Defaults to a directory of the
+        current user in shared memory (/dev/shm) if available or the
+        temporary directory. Since cached values are unpickled, the
+        directory must be owned by the user running the server and
+        must not be writable by other users, otherwise it is not
+        used.""")
+
     defer_load = param.Boolean(default=False, doc="""
         Whether to defer load of rendered functions.""")
 
@@ -180,6 +189,34 @@ class _config(_base_config):
     loading_max_height = param.Integer(default=300, doc="""
         Maximum height of the loading indicator.""")
 
+    max_update_rate = param.Number(default=None, bounds=(0, None), doc="""
+        The maximum rate (in Hz) at which property updates are sent to
+        each session. Updates made more frequently are coalesced and
+        only the latest value of each property is sent, e.g. a rate of
+        30 sends at most one update of a rapidly changing value every
+        33 milliseconds. By default updates are sent as they are made.""")
+
+    max_loop_lag = param.Number(default=None, bounds=(0, None), doc="""
+        The maximum lag (in seconds) of the event loop of a server
+        process, beyond which new sessions are refused.""")
+
+    max_memory = param.Number(default=None, bounds=(0, None), doc="""
+        The maximum memory usage (resident set size in MB) of a server
+        process, beyond which new sessions are refused.""")
+
+    max_sessions = param.Integer(default=None, bounds=(0, None), doc="""
+        The maximum number of live sessions of a server process,
+        beyond which new sessions are refused. Sessions created ahead
+        of time by the session_pool are only counted once claimed.""")
+
+    max_thread_queue = param.Integer(default=None, bounds=(0, None), doc="""
+        The maximum number of tasks waiting for a thread of the thread
+        pool (see nthreads), beyond which new sessions are refused.""")
+
+    offload_workers = param.Integer(default=None, bounds=(1, None), doc="""
+        The number of worker processes functions decorated with
+        pn.io.offload are run in. Defaults to the number of CPUs.""")
+
     notifications = param.Boolean(default=False, doc="""
         Whether to enable notifications functionality.""")
 
@@ -210,9 +247,27 @@ class _config(_base_config):
         the initial request arrives.""")  # type: ignore[assignment, ty:invalid-assignment]
 
     session_key_func = param.Callable(default=None, doc="""
-        Used in conjunction with the reuse_sessions option, the
-        session_key_func is given a tornado.httputil.HTTPServerRequest
-        and should return a key that uniquely captures a session.""")
+        Used in conjunction with the reuse_sessions and session_pool
+        options, the session_key_func is given a
+        tornado.httputil.HTTPServerRequest and should return a key that
+        uniquely captures a session.""")
+
+    session_pool = param.Integer(default=0, bounds=(0, None), doc="""
+        The number of sessions of each application to create ahead of
+        time, so that requests can be served by an initialized session
+        instead of waiting for the application to be executed. Since
+        the rendered content may depend on the request, sessions are
+        pooled separately for each combination of query arguments (or
+        session_key_func key) and, if a Panel auth provider is
+        configured, user that is requested. Otherwise sessions are
+        pooled without the headers and cookies of any request. Not
+        supported when autoreload is enabled.""")
+
+    slow_callback_threshold = param.Number(default=None, bounds=(0, None), doc="""
+        The duration (in seconds) beyond which a callback blocking
+        the event loop of a server process is recorded, along with
+        the session, component and a snapshot of the stack. Slow
+        callbacks are logged and listed in the admin panel.""")
 
     safe_embed = param.Boolean(default=False, doc="""
         Ensure all bokeh property changes trigger events which are
@@ -247,6 +302,12 @@ class _config(_base_config):
     throttled = param.Boolean(default=False, doc="""
         If sliders and inputs should be throttled until release of mouse.""")
 
+    waiting_room = param.Boolean(default=False, doc="""
+        Whether to render a waiting room page, which retries the
+        request periodically, when a new session is refused because
+        one of the server limits (e.g. max_sessions) is exceeded,
+        instead of responding with a plain 503 error.""")
+
     _admin = param.Boolean(default=False, doc="Whether the admin panel is enabled.")
 
     _admin_endpoint = param.String(default=None, doc="Name to use for the admin endpoint.")
@@ -257,6 +318,18 @@ class _config(_base_config):
         default='DEBUG', objects=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
         doc="Log level of the Admin Panel logger")  # type: ignore[assignment, ty:invalid-assignment]
 
+    _cache_max_bytes = param.Integer(default=None, bounds=(0, None), doc="""
+        The maximum estimated size in bytes of all values held by
+        the pn.cache decorator and pn.state.as_cached combined. When
+        exceeded, the least recently used values are evicted.""")
+
+    _cache_hash_backend = param.Selector(
+        default='auto', objects=['auto', 'blake3', 'md5', 'xxhash'], doc="""
+        The hashing backend used by the pn.cache decorator to hash
+        arguments. By default the fastest installed backend is used,
+        i.e. xxhash or blake3 if available and md5 otherwise. When
+        using md5, large arrays and DataFrames are sampled.""")
+
     _cdn_root = param.String(
         default="https://cdn.holoviz.org/panel/", doc="""
         The root path of the CDN. Configurable to support air-gapped and
@@ -373,7 +446,7 @@ class _config(_base_config):
 
     # Global parameters that are shared across all sessions
     _globals: t.ClassVar[set[str]] = {
-        'admin_plugins', 'autoreload', 'cdn_root', 'comms', 'cookie_path', 'cookie_secret',
+        'admin_plugins', 'autoreload', 'cache_hash_backend', 'cache_max_bytes', 'cdn_root', 'comms', 'cookie_path', 'cookie_secret',
         'nthreads', 'oauth_provider', 'oauth_expiry', 'oauth_key',
         'oauth_secret', 'oauth_jwt_user', 'oauth_redirect_uri',
         'oauth_encryption_key', 'oauth_extra_params', 'npm_cdn',
@@ -486,6 +559,11 @@ class _config(_base_config):
         from .io.admin import log_handler as admin_log_handler
         admin_log_handler.setLevel(self._log_level)
 
+    @param.depends('_cache_hash_backend', watch=True)
+    def _update_hash_backend(self):
+        from .io.cache import _set_hash_backend
+        _set_hash_backend(self.cache_hash_backend)
+
     @param.depends('_disable_validation', watch=True)
     def _configure_validation(self):
         set_bokeh_validation(not self.disable_validation)
@@ -543,6 +621,15 @@ class _config(_base_config):
         admin_log_level = os.environ.get('PANEL_ADMIN_LOG_LEVEL', self._admin_log_level)
         return admin_log_level.upper() if admin_log_level else None
 
+    @property
+    def cache_hash_backend(self):
+        return os.environ.get('PANEL_CACHE_HASH_BACKEND', self._cache_hash_backend)
+
+    @property
+    def cache_max_bytes(self):
+        max_bytes = os.environ.get('PANEL_CACHE_MAX_BYTES', self._cache_max_bytes)
+        return None if max_bytes is None else int(max_bytes)
+
     @property
     def cdn_root(self):
         return os.environ.get('PANEL_CDN_ROOT', self._cdn_root)
@@ -19,6 +19,7 @@ import param
 from param.parameterized import ParameterizedMetaclass
 
 from .config import config
+from .io.blobs import blob_store
 from .io.datamodel import construct_data_model
 from .io.document import freeze_doc, hold
 from .io.model import apply_changes_without_dispatch
@@ -495,6 +496,14 @@ class ReactiveESM(ReactiveCustomBase, metaclass=ReactiveESMMetaclass):
                 bundle_hash = hashlib.sha256(str(bundle_path).encode('utf-8')).hexdigest()
         else:
             bundle_hash = None
+        esm = self._render_esm(not config.autoreload, server=is_session)
+        dev = config.autoreload or getattr(self, '_debug', False)
+        esm_hash = None
+        if not (bundle_hash or dev) and doc is not None and blob_store.enabled(doc):
+            # Register the module once per class and Document so that
+            # instances reference the shared source by its content hash
+            esm_hash = blob_store.add(esm.encode('utf-8'), 'text/javascript', doc, cls)
+            esm = blob_store.url(esm_hash, doc)
         data_props['esm_constants'] = self._constants
         if cls._data_model__initialized:
             defs = []
@@ -507,8 +516,9 @@ class ReactiveESM(ReactiveCustomBase, metaclass=ReactiveESMMetaclass):
             'css_bundle': css_bundle,
             'class_name': cls.__name__,
             'data': self._data_model(**{p: v for p, v in data_props.items() if p not in ignored}),
-            'dev': config.autoreload or getattr(self, '_debug', False),
-            'esm': self._render_esm(not config.autoreload, server=is_session),
+            'dev': dev,
+            'esm': esm,
+            'esm_hash': esm_hash,
             'events': events,
             'importmap': importmap,
             'render_policy': self._render_policy,
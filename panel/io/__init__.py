@@ -18,6 +18,7 @@ from .notebook import (  # noqa
     _jupyter_server_extension_paths, block_comm, ipywidget, load_notebook,
     push, push_notebook,
 )
+from .offload import offload  # noqa
 from .profile import profile  # noqa
 from .resources import Resources  # noqa
 from .state import state  # noqa
@@ -39,6 +40,7 @@ __all__ = (
     "hold",
     "immediate_dispatch",
     "ipywidget",
+    "offload",
     "panel_logger",
     "profile",
     "push",
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime as dt
+import html
 import logging
 import os
 import sys
@@ -28,9 +29,10 @@ from ..widgets import (
     Button, MultiSelect, Tabulator, TextInput,
 )
 from ..widgets.indicators import Trend
+from .cache import _RENDER_CACHE
 from .logging import (
     LOG_SESSION_CREATED, LOG_SESSION_DESTROYED, LOG_SESSION_LAUNCHING,
-    panel_logger,
+    LOG_SLOW_CALLBACK, panel_logger,
 )
 from .notebook import push_notebook
 from .profile import profiling_tabs
@@ -173,7 +175,8 @@ EVENT_TYPES = {
     'rendering': 'Orange',
     'processing': 'DodgerBlue',
     'periodic': 'Violet',
-    'logging': 'white'
+    'logging': 'white',
+    'blocking': 'Crimson'
 }
 
 def get_timeline(doc=None):
@@ -242,6 +245,22 @@ def get_timeline(doc=None):
                 'type': [(index, etype)]
             }
             cds.patch(patch)
+        elif new.msg == LOG_SLOW_CALLBACK:
+            etype = 'blocking'
+            event = {
+                'x0': [(new.created-new.args[1])*1000],
+                'x1': [new.created*1000],
+                'y0': [(sid, -.25)],
+                'y1': [(sid, .25)],
+                'session': [sid],
+                'msg': [new.getMessage()],
+                'color': [EVENT_TYPES[etype]],
+                'line_color': ['black'],
+                'type': [etype]
+            }
+            if p.y_range.factors != sessions:
+                p.y_range.factors = list(sessions)
+            cds.stream(event)
         elif new.msg.endswith('rendered'):
             try:
                 index = cds.data['msg'].index(f'Session {sid} initializing')
@@ -358,6 +377,30 @@ def get_process_info():
     stats_cb.start()
     return memory, cpu
 
+def get_render_cache_html():
+    stats = _RENDER_CACHE.stats()
+    lookups = stats['hits'] + stats['misses']
+    ratio = stats['hits'] / lookups * 100 if lookups else 0
+    return f"""
+    <h4>
+    Render Cache:
+    </h4>
+    <code>
+    Hits: {stats['hits']} ({ratio:.1f}%)</br>
+    Misses: {stats['misses']}</br>
+    Entries: {stats['size']} / {stats['max_items']}</br>
+    Size: {stats['nbytes']/1024/1024:.2f} / {stats['max_bytes']/1024/1024:.0f} MB</br>
+    </code>"""
+
+def get_render_cache_info():
+    info = HTML(get_render_cache_html(), width=300, height=300, margin=(0, 5))
+    def update_stats():
+        info.object = get_render_cache_html()
+    stats_cb = state.add_periodic_callback(update_stats, period=1000, start=False)
+    stats_cb.log = False
+    stats_cb.start()
+    return info
+
 def get_session_data():
     durations, renders, sessions = [], [], []
     session_info = state.session_info['sessions']
@@ -418,16 +461,42 @@ def get_session_info(doc=None):
         doc.on_session_destroyed(_unwatch_session_info)
     return total, active, render, duration
 
+def get_slow_callback_data():
+    return pd.DataFrame([
+        (dt.datetime.fromtimestamp(stall['time']), round(stall['duration'], 3),
+         stall['session'], stall['component'], stall['callback'], stall['stack'])
+        for stall in state._slow_callbacks
+    ], columns=['time', 'duration', 'session', 'component', 'callback', 'stack'])
+
+def slow_callback_component():
+    table = Tabulator(
+        get_slow_callback_data(), theme='midnight', layout='fit_data_stretch',
+        show_index=False, disabled=True, hidden_columns=['stack'],
+        sorters=[{'field': 'time', 'dir': 'desc'}], pagination='local',
+        page_size=18, sizing_mode='stretch_both', min_height=400,
+        row_content=lambda row: HTML(f'<pre>{html.escape(row.stack)}</pre>')
+    )
+    latest = state._slow_callbacks[-1] if state._slow_callbacks else None
+    def update_table():
+        nonlocal latest
+        if state._slow_callbacks and state._slow_callbacks[-1] is not latest:
+            latest = state._slow_callbacks[-1]
+            table.value = get_slow_callback_data()
+    table_cb = state.add_periodic_callback(update_table, period=1000, start=False)
+    table_cb.log = False
+    table_cb.start()
+    return table
+
 def get_overview(doc=None):
     layout = FlexBox(*get_session_info(doc), margin=0, sizing_mode='stretch_width')
-    info = get_version_info()
+    info = [get_render_cache_info(), get_version_info()]
     try:
         import psutil  # noqa
     except Exception:
-        layout.append(info)
+        layout.extend(info)
         return layout
     else:
-        layout.extend([*get_process_info(), info])
+        layout.extend([*get_process_info(), *info])
         return layout
 
 
@@ -482,6 +551,8 @@ def admin_template(doc):
         ('User Profiling', profiling_tabs(state, None, r'^\/.*')),
         ('Logs', log_component())
     ])
+    if config.slow_callback_threshold is not None:
+        tabs.append(('Slow Callbacks', slow_callback_component()))
     tabs.extend([
         (name, plugin()) for name, plugin in config.admin_plugins
     ])
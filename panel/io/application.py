@@ -29,6 +29,7 @@ from .handlers import (
 )
 from .loading import LOADING_INDICATOR_CSS_CLASS
 from .logging import LOG_SESSION_DESTROYED, LOG_SESSION_LAUNCHING
+from .metrics import _METRICS
 from .state import set_curdoc, state
 
 if t.TYPE_CHECKING:
@@ -166,6 +167,8 @@ class Application(BkApplication):
 
     def initialize_document(self, doc):
         logger.info(LOG_SESSION_LAUNCHING, id(doc))
+        if _METRICS.enabled:
+            _METRICS.session_created(doc)
         # Claim the Document for the current thread before user code runs,
         # so APIs that behave differently when invoked off the Document's
         # thread (e.g. hold) can tell the two cases apart during the build.
@@ -178,6 +181,8 @@ class Application(BkApplication):
                 template.server_doc(title=template.title, location=True, doc=doc)
         def _log_session_destroyed(session_context):
             logger.info(LOG_SESSION_DESTROYED, id(doc))
+            if _METRICS.enabled:
+                _METRICS.session_destroyed(doc)
         doc.destroy = partial(_destroy_document, doc) # type: ignore
         doc.on_event('document_ready', partial(state._schedule_on_load, doc))
         doc.on_session_destroyed(_log_session_destroyed)
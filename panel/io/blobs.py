@@ -0,0 +1,170 @@
+"""
+A content-addressed store for binary data, e.g. the contents of image
+and media panes, which is served over HTTP, so that the data does not
+have to be inlined into the document as a base64 encoded data URI and
+may be cached by the browser.
+"""
+from __future__ import annotations
+
+import base64
+import hashlib
+import threading
+import typing as t
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+from weakref import WeakKeyDictionary, ref
+
+from .state import state
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import param
+
+    from bokeh.document import Document
+
+BLOB_PATH = "blobs/"
+
+# The Document the properties of a component are being computed for
+_RENDER_DOC: ContextVar[Document | None] = ContextVar('_RENDER_DOC', default=None)
+
+@contextmanager
+def _rendering(doc: Document | None) -> Iterator[None]:
+    token = _RENDER_DOC.set(doc)
+    try:
+        yield
+    finally:
+        _RENDER_DOC.reset(token)
+
+
+class BlobStore:
+    """
+    Holds binary data keyed by the hash of its contents.
+
+    Each blob is registered on behalf of an owner (e.g. a pane) on a
+    Document and is held as long as it is the current blob of an owner
+    on a live Document. Registering a new blob for an owner releases
+    the previous one and all blobs registered on a Document are
+    released once its session is destroyed.
+    """
+
+    def __init__(self):
+        self.serving = False
+        self._blobs: dict[str, tuple[bytes, str]] = {}
+        self._refs: dict[str, int] = {}
+        self._owners: WeakKeyDictionary[Document, dict[int, str]] = WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._blobs
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(len(data) for data, _ in self._blobs.values())
+
+    def enabled(self, doc: Document | None) -> bool:
+        """
+        Whether blobs can be served to the Document, i.e. whether it
+        belongs to a session on a server which serves the blobs.
+        """
+        return self.serving and doc is not None and doc.session_context is not None
+
+    def get(self, key: str) -> tuple[bytes, str] | None:
+        """
+        Returns the data and the mime type of the blob.
+        """
+        return self._blobs.get(key)
+
+    def add(self, data: bytes, mime_type: str, doc: Document, owner: t.Any) -> str:
+        """
+        Registers the data on behalf of the owner and returns the key
+        of the blob.
+        """
+        key = hashlib.blake2b(data, digest_size=16).hexdigest()
+        with self._lock:
+            if doc not in self._owners:
+                self._owners[doc] = {}
+                doc.on_session_destroyed(partial(self._release_doc, ref(doc)))
+            owners = self._owners[doc]
+            previous = owners.get(id(owner))
+            if previous == key:
+                return key
+            owners[id(owner)] = key
+            self._blobs[key] = (data, mime_type)
+            self._refs[key] = self._refs.get(key, 0) + 1
+            if previous is not None:
+                self._release(previous)
+        return key
+
+    def url(self, key: str, doc: Document) -> str:
+        """
+        Returns the URL of the blob relative to the page the Document
+        is rendered on.
+        """
+        rel_path = state._rel_paths.get(doc, state._rel_path)
+        return f"{rel_path}/{BLOB_PATH}{key}" if rel_path else f"{BLOB_PATH}{key}"
+
+    def _release(self, key: str) -> None:
+        self._refs[key] -= 1
+        if not self._refs[key]:
+            del self._refs[key]
+            del self._blobs[key]
+
+    def _release_doc(self, doc_ref: ref[Document], session_context) -> None:
+        doc = doc_ref()
+        if doc is None:
+            return
+        with self._lock:
+            for key in self._owners.pop(doc, {}).values():
+                self._release(key)
+
+
+blob_store = BlobStore()
+
+
+class BlobMixin:
+    """
+    Mixin for components which reference their data via `data_url`,
+    which makes the Document their properties are computed for known,
+    so the data is served as a blob to server sessions.
+    """
+
+    def _get_properties(self, doc: Document | None) -> dict[str, t.Any]:
+        with _rendering(doc):
+            return super()._get_properties(doc)  # type: ignore[misc]
+
+    def _update_properties(self, *events: param.parameterized.Event, doc: Document) -> dict[str, t.Any]:
+        with _rendering(doc):
+            return super()._update_properties(*events, doc=doc)  # type: ignore[misc]
+
+
+def data_url(data: bytes, mime_type: str, owner: t.Any, embed: bool = False) -> str:
+    """
+    Returns a URL for the data, i.e. the URL of a blob served by the
+    server if the properties of the owner are being computed for a
+    Document belonging to a server session, or a base64 encoded data
+    URI otherwise, e.g. in a notebook or when exporting a static file.
+
+    Arguments
+    ---------
+    data: bytes
+      The data to reference.
+    mime_type: str
+      The mime type of the data.
+    owner: object
+      The object the data is registered on behalf of, replacing any
+      data previously registered by the owner.
+    embed: bool
+      Whether to always embed the data as a data URI.
+    """
+    doc = _RENDER_DOC.get()
+    if data and not embed and doc is not None and blob_store.enabled(doc):
+        key = blob_store.add(data, mime_type, doc, owner)
+        return blob_store.url(key, doc)
+    b64 = base64.b64encode(data).decode('utf-8')
+    return f"data:{mime_type};base64,{b64}"
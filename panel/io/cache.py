@@ -3,21 +3,30 @@ Implements memoization for functions with arbitrary arguments
 """
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
 import functools
 import hashlib
 import inspect
 import io
+import logging
+import mmap
 import os
 import pathlib
 import pickle
+import stat
 import sys
+import tempfile
 import threading
 import time
 import typing as t
 import unittest.mock
+import weakref
 
-from contextlib import contextmanager
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from concurrent.futures import Future
+from contextlib import contextmanager, suppress
 
 import param
 
@@ -40,16 +49,25 @@ if t.TYPE_CHECKING:
         def clear(self, func_hashes: list[str | None]=[None]) -> None:
             pass
 
+        def stats(self) -> dict[str, int]:
+            pass
+
         __call__: _CallableT
 
+log = logging.getLogger('panel.io.cache')
+
 _CYCLE_PLACEHOLDER = b"panel-93KZ39Q-floatingdangeroushomechose-CYCLE"
 
 _FFI_TYPE_NAMES = ("_cffi_backend.FFI", "builtins.CompiledFFI",)
 
-_HASH_MAP: dict[Hashable, str] = {}
-
 _INDETERMINATE = type('INDETERMINATE', (object,), {})()
 
+_MEMORY_LOCK = threading.RLock()
+
+# Resolves an in-flight computation which was interrupted rather than
+# failed, signalling the coalesced callers to re-run it
+_RETRY = type('RETRY', (object,), {})()
+
 _NATIVE_TYPES = (
     bytes, str, float, int, bool, bytearray, type(None)
 )
@@ -62,11 +80,64 @@ _DATAFRAME_ROWS_LARGE = 100_000
 
 _DATAFRAME_SAMPLE_SIZE = 100_000
 
+_SIZEOF_SAMPLE_SIZE = 100
+
+_SHARED_ALIGNMENT = 64
+
+_SHARED_MAGIC = b'PNSHARED'
+
 if sys.platform == 'win32':
     _TIME_FN = time.perf_counter
 else:
     _TIME_FN = time.monotonic
 
+def _xxhash_factory():
+    import xxhash
+    return xxhash.xxh3_128
+
+def _blake3_factory():
+    import blake3
+    return blake3.blake3
+
+# Hashing backends given as factories returning a hashlib-style
+# constructor and whether they are fast enough to hash large
+# buffers in full instead of sampling them.
+_HASH_BACKENDS: dict[str, tuple[Callable[[], Callable[[], t.Any]], bool]] = {
+    'xxhash': (_xxhash_factory, True),
+    'blake3': (_blake3_factory, True),
+    'md5': (lambda: functools.partial(hashlib.new, 'md5'), False),
+}
+
+_HASH_BACKEND: list[t.Any] = [None, False]
+
+def _set_hash_backend(name: str) -> str:
+    """
+    Sets the backend used to hash objects. If 'auto' the first
+    importable backend (xxhash, blake3, md5) is used.
+    """
+    candidates = list(_HASH_BACKENDS) if name == 'auto' else [name]
+    for candidate in candidates:
+        factory, fast = _HASH_BACKENDS[candidate]
+        try:
+            hasher = factory()
+        except ImportError:
+            if name != 'auto':
+                raise ImportError(
+                    f'The {name!r} hash backend requires the {name} '
+                    'package to be installed.'
+                ) from None
+            continue
+        break
+    _HASH_BACKEND[:] = [hasher, fast]
+    # Memoized hashes are only valid for the backend they were computed with
+    if '_HASH_MAP' in globals():
+        _HASH_MAP.clear()
+        _BUFFER_HASHES.clear()
+    return candidate
+
+def _new_hasher():
+    return _HASH_BACKEND[0]()
+
 class _Stack:
 
     def __init__(self):
@@ -99,7 +170,7 @@ def _is_native_tuple(obj: t.Any) -> bool:
     return isinstance(obj, tuple) and all(_is_native_tuple(v) for v in obj)
 
 def _container_hash(obj: t.Any) -> bytes:
-    h = hashlib.new("md5")
+    h = _new_hasher()
     h.update(_generate_hash(f'__{type(obj).__name__}'))
     for item in (obj.items() if isinstance(obj, dict) else obj):
         h.update(_generate_hash(item))
@@ -109,31 +180,105 @@ def _slice_hash(x: slice) -> bytes:
     return _container_hash([x.start, x.step, x.stop])
 
 def _partial_hash(obj: t.Any) -> bytes:
-    h = hashlib.new("md5")
+    h = _new_hasher()
     h.update(_generate_hash(obj.args))
     h.update(_generate_hash(obj.func))
     h.update(_generate_hash(obj.keywords))
     return h.digest()
 
-def _pandas_hash(obj: t.Any) -> bytes:
+def _buffer_hash(arr, hash_values=None) -> bytes:
+    """
+    Hashes the data of a numpy array directly from its buffer,
+    sampling the data if it is large and the hash backend is slow.
+
+    Digests of read-only buffers, e.g. memory-mapped or Arrow-backed
+    data, are memoized on the identity of the memory backing the
+    array, allowing them to be reused for other arrays (e.g. the
+    columns of another DataFrame) viewing the same memory. Writeable
+    buffers may be modified in place and are therefore always hashed.
+
+    For arrays of Python objects a hash_values function returning
+    an array of hashes for the values must be provided.
+    """
+    import numpy as np
+
+    root = arr
+    while isinstance(root.base, np.ndarray):
+        root = root.base
+    if root.flags.writeable:
+        key = None
+    else:
+        key = (
+            '__buffer', id(root), arr.__array_interface__['data'][0],
+            arr.shape, arr.strides, arr.dtype.str
+        )
+        digest = _BUFFER_HASHES.get(key)
+        if digest is not None:
+            return digest
+    start = _TIME_FN()
+    h = _new_hasher()
+    h.update(arr.dtype.str.encode())
+    h.update(_generate_hash(arr.shape))
+    values = arr if hash_values is None else hash_values()
+    if values.size >= _ARRAY_SIZE_LARGE and not _HASH_BACKEND[1]:
+        state = np.random.RandomState(0)
+        values = state.choice(values.reshape(-1), size=_ARRAY_SAMPLE_SIZE)
+    # Avoids copying unless the array is not contiguous
+    h.update(np.ascontiguousarray(values).reshape(-1).view(np.uint8))
+    digest = h.digest()
+    if key is not None:
+        _BUFFER_HASHES.set(key, digest, _TIME_FN()-start, [root])
+    return digest
+
+def _pandas_values_hash(obj) -> bytes:
+    """
+    Hashes the values of a pandas Series or Index.
+    """
+    import numpy as np
     import pandas as pd
 
-    if not isinstance(obj, (pd.Series, pd.DataFrame)):
-        obj = pd.Series(obj)
+    if isinstance(obj.dtype, np.dtype) and obj.dtype.kind != 'O':
+        return _buffer_hash(obj.to_numpy(copy=False))
+
+    def hash_values():
+        sample = obj
+        if len(obj) >= _DATAFRAME_ROWS_LARGE and not _HASH_BACKEND[1]:
+            sample = pd.Series(obj).sample(n=_DATAFRAME_SAMPLE_SIZE, random_state=0)
+        return pd.util.hash_pandas_object(sample, index=False).to_numpy()
 
-    if len(obj) >= _DATAFRAME_ROWS_LARGE:
-        obj = obj.sample(n=_DATAFRAME_SAMPLE_SIZE, random_state=0)
     try:
-        if isinstance(obj, pd.DataFrame):
-            return ((b"%s" % pd.util.hash_pandas_object(obj).sum())
-                + (b"%s" % pd.util.hash_pandas_object(obj.columns).sum())
-            )
-        return b"%s" % pd.util.hash_pandas_object(obj).sum()
+        if isinstance(obj.dtype, np.dtype):
+            return _buffer_hash(obj.to_numpy(copy=False), hash_values)
+        # Extension arrays, e.g. categorical, nullable or Arrow data
+        return str(obj.dtype).encode() + _buffer_hash(hash_values())
     except TypeError:
         # Use pickle if pandas cannot hash the object for example if
         # it contains unhashable objects.
         return b"%s" % pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
 
+def _pandas_hash(obj: t.Any) -> bytes:
+    """
+    Hashes pandas objects column by column, allowing the digests of
+    columns shared between objects to be reused.
+    """
+    import pandas as pd
+
+    if isinstance(obj, pd.RangeIndex):
+        return _slice_hash(obj)
+    h = _new_hasher()
+    h.update(type(obj).__name__.encode())
+    if isinstance(obj, pd.Index):
+        h.update(_pandas_values_hash(obj))
+        return h.digest()
+    h.update(_pandas_hash(obj.index))
+    if isinstance(obj, pd.DataFrame):
+        h.update(_pandas_hash(obj.columns))
+        for i in range(obj.shape[1]):
+            h.update(_pandas_values_hash(obj.iloc[:, i]))
+    else:
+        h.update(_pandas_values_hash(obj))
+    return h.digest()
+
 def _polars_combine_hash_expr(columns):
     """
     Inspired by pd.core.util.hashing.combine_hash_arrays,
@@ -184,7 +329,9 @@ def _polars_hash(obj):
     return hash_type + hash_data + hash_columns
 
 def _numpy_hash(obj):
-    h = hashlib.new("md5")
+    if obj.dtype.kind != 'O':
+        return _buffer_hash(obj)
+    h = _new_hasher()
     h.update(_generate_hash(obj.shape))
     if obj.size >= _ARRAY_SIZE_LARGE:
         import numpy as np
@@ -194,7 +341,7 @@ def _numpy_hash(obj):
     return h.digest()
 
 def _io_hash(obj):
-    h = hashlib.new("md5")
+    h = _new_hasher()
     h.update(_generate_hash(obj.tell()))
     h.update(_generate_hash(obj.getvalue()))
     return h.digest()
@@ -243,19 +390,88 @@ _hash_funcs: dict[str | type[t.Any] | tuple[type, ...] | Callable[[t.Any], bool]
 for name in _FFI_TYPE_NAMES:
     _hash_funcs[name] = b'0'
 
-def _find_hash_func(obj):
+def _find_func(obj, funcs):
     fqn_type = _get_fqn(obj)
-    if fqn_type in _hash_funcs:
-        return _hash_funcs[fqn_type]
-    for otype, hash_func in _hash_funcs.items():
+    if fqn_type in funcs:
+        return funcs[fqn_type]
+    for otype, func in funcs.items():
         if isinstance(otype, str):
             if otype == fqn_type:
-                return hash_func
+                return func
         elif inspect.isfunction(otype):
             if otype(obj):
-                return hash_func
+                return func
         elif isinstance(obj, otype):
-            return hash_func
+            return func
+
+def _find_hash_func(obj):
+    return _find_func(obj, _hash_funcs)
+
+def _pandas_sizeof(obj):
+    import pandas as pd
+
+    from pandas.api.types import is_object_dtype
+
+    if isinstance(obj, pd.Index):
+        nbytes = obj.memory_usage(deep=False)
+        values = [obj] if is_object_dtype(obj.dtype) else []
+    elif isinstance(obj, pd.Series):
+        nbytes = obj.memory_usage(index=True, deep=False)
+        values = [obj] if is_object_dtype(obj.dtype) else []
+    else:
+        nbytes = obj.memory_usage(index=True, deep=False).sum()
+        values = [obj.iloc[:, i] for i, dtype in enumerate(obj.dtypes) if is_object_dtype(dtype)]
+    # Estimate the size of Python objects from a small sample
+    # instead of measuring every value as deep=True would
+    for col in values:
+        n = len(col)
+        if not n:
+            continue
+        sample = col.iloc[:_SIZEOF_SAMPLE_SIZE] if isinstance(col, pd.Series) else col[:_SIZEOF_SAMPLE_SIZE]
+        nbytes += sum(sys.getsizeof(v) for v in sample) * n // len(sample)
+    return int(nbytes)
+
+def _container_sizeof(obj):
+    items = obj.items() if isinstance(obj, dict) else obj
+    nbytes = sys.getsizeof(obj)
+    for item in items:
+        nbytes += _sizeof(item)
+    return nbytes
+
+_size_funcs: dict[str | type[t.Any] | tuple[type, ...], Callable[[t.Any], int]] = {
+    (list, tuple, set, frozenset, dict): _container_sizeof,
+    memoryview                 : lambda obj: obj.nbytes,
+    'numpy.ndarray'            : lambda obj: obj.nbytes,
+    'pandas.DataFrame'         : _pandas_sizeof,
+    'pandas.Series'            : _pandas_sizeof,
+    'pandas.Index'             : _pandas_sizeof,
+    'pandas.core.series.Series': _pandas_sizeof,
+    'pandas.core.frame.DataFrame': _pandas_sizeof,
+    'pandas.core.indexes.base.Index': _pandas_sizeof,
+    'polars.series.series.Series': lambda obj: obj.estimated_size(),
+    'polars.dataframe.frame.DataFrame': lambda obj: obj.estimated_size(),
+    'pyarrow.lib.Table'        : lambda obj: obj.nbytes,
+    'pyarrow.lib.RecordBatch'  : lambda obj: obj.nbytes,
+    'pyarrow.lib.ChunkedArray' : lambda obj: obj.nbytes,
+}
+
+def _sizeof(obj) -> int:
+    """
+    Cheaply estimates the memory held by an object in bytes.
+    """
+    hash_stack = state._current_stack
+    if obj in hash_stack:
+        return 0
+    size_func = _find_func(obj, _size_funcs)
+    if size_func is None:
+        return sys.getsizeof(obj)
+    hash_stack.push(obj)
+    try:
+        return int(size_func(obj))
+    except Exception:
+        return sys.getsizeof(obj)
+    finally:
+        hash_stack.pop()
 
 def _generate_hash_inner(obj):
     hash_func = _find_hash_func(obj)
@@ -269,7 +485,7 @@ def _generate_hash_inner(obj):
             ) from e
         return output
     if hasattr(obj, '__reduce__') and inspect.isclass(obj):
-        h = hashlib.new("md5")
+        h = _new_hasher()
         try:
             reduce_data = obj.__reduce__()
         except BaseException:
@@ -291,46 +507,687 @@ def _generate_hash(obj):
         hash_stack.pop()
     return hash_value
 
-def _key(obj):
-    if obj is None:
-        return None
-    elif _is_native(obj) or _is_native_tuple(obj):
-        return obj
-    elif isinstance(obj, list):
-        if all(_is_native(item) for item in obj):
-            return ('__list', *obj)
+def _is_readonly_array(obj) -> bool:
+    """
+    Whether obj is a NumPy array whose data cannot be modified, i.e.
+    neither the array nor any array it is a view of is writeable.
+    """
+    if _get_fqn(obj) != 'numpy.ndarray':
+        return False
+    while _get_fqn(obj) == 'numpy.ndarray':
+        if obj.flags.writeable:
+            return False
+        obj = obj.base
+    return obj is None or isinstance(obj, bytes)
+
+def _key(obj, refs):
+    """
+    Returns a key identifying an argument without hashing its
+    contents, or _INDETERMINATE if no such key can be derived.
+    Objects that are identified by their id are appended to refs
+    so they can be weakly referenced. Since the contents of an object
+    identified by its id must not change, mutable containers (e.g.
+    DataFrames) are never identified by their id.
+    """
+    if _is_native(obj):
+        return (type(obj), obj)
+    elif isinstance(obj, (list, tuple)) and all(_is_native(item) for item in obj):
+        return (type(obj), *((type(item), item) for item in obj))
     elif (
-        _get_fqn(obj) == "pandas.core.frame.DataFrame"
-        or _get_fqn(obj) == "numpy.ndarray"
+        _is_readonly_array(obj)
         or inspect.isbuiltin(obj)
-        or inspect.isroutine(obj)
+        or inspect.isfunction(obj)
         or inspect.iscode(obj)
     ):
-        return id(obj)
+        refs.append(obj)
+        return ('__id', id(obj))
     return _INDETERMINATE
 
-def _cleanup_cache(cache, policy, max_items, time):
+class _HashMemo:
+    """
+    Bounded LRU memo mapping the keys of the arguments to a function
+    onto the hash computed by compute_hash.
+
+    Arguments identified by their id are weakly referenced, ensuring
+    that entries are dropped once the arguments are garbage collected
+    and are never returned for a new object that reuses the same id.
+    """
+
+    def __init__(self, max_items: int = 10_000):
+        self.max_items = max_items
+        self.hits = 0
+        self.misses = 0
+        self.saved = 0.
+        self._dead: list[Hashable] = []
+        self._entries: OrderedDict[Hashable, tuple[str, float, tuple[weakref.ref, ...]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _purge(self):
+        # Entries are removed lazily since weakref callbacks may
+        # fire at any point, including while the lock is held.
+        while self._dead:
+            self._entries.pop(self._dead.pop(), None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._dead.clear()
+
+    def miss(self) -> None:
+        """
+        Records a lookup of arguments which cannot be memoized.
+        """
+        with self._lock:
+            self.misses += 1
+
+    def get(self, key: Hashable) -> str | None:
+        with self._lock:
+            self._purge()
+            entry = self._entries.get(key)
+            if entry is None or any(ref() is None for ref in entry[2]):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self.saved += entry[1]
+            return entry[0]
+
+    def set(self, key: Hashable, hash_value: str, duration: float, objs: list[t.Any]):
+        dead = self._dead
+        try:
+            refs = tuple(weakref.ref(obj, lambda _, key=key: dead.append(key)) for obj in objs)
+        except TypeError:
+            return
+        with self._lock:
+            self._purge()
+            self._entries[key] = (hash_value, duration, refs)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_items:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> dict[str, t.Any]:
+        """
+        Returns the number of hits and misses, the current size and
+        the total time in seconds saved by not rehashing arguments.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits, 'misses': self.misses, 'size': len(self._entries),
+                'max_items': self.max_items, 'saved': self.saved
+            }
+
+_HASH_MAP = _HashMemo()
+
+# Digests of array buffers, e.g. the columns of a DataFrame
+_BUFFER_HASHES = _HashMemo(max_items=100_000)
+
+class _RenderCache:
+    """
+    Bounded LRU cache shared by all sessions, mapping a key that
+    identifies an object and the options it is rendered with onto the
+    output of rendering it, e.g. the HTML rendered from Markdown text.
+
+    The cache is bounded both by the number of entries and by the
+    combined length of the cached outputs and the strings in the keys.
     """
-    Deletes items in the cache if the exceed the number of items or
-    their TTL (time-to-live) has expired.
+
+    def __init__(self, max_items: int = 1_000, max_bytes: int = 64 * 2**20):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._entries: OrderedDict[Hashable, tuple[str, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def render(self, key: Hashable, func: Callable[[], str]) -> str:
+        """
+        Returns the cached output for the key, calling the function to
+        render it on a miss. If the key is not hashable the output is
+        always rendered.
+        """
+        try:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+                self.misses += 1
+        except TypeError:
+            return func()
+        output = func()
+        keys = key if isinstance(key, tuple) else (key,)
+        nbytes = len(output) + sum(len(k) for k in keys if isinstance(k, str))
+        if nbytes > self.max_bytes:
+            return output
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._entries[key][1]
+            self._entries[key] = (output, nbytes)
+            self._entries.move_to_end(key)
+            self.nbytes += nbytes
+            while len(self._entries) > self.max_items or self.nbytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+        return output
+
+    def stats(self) -> dict[str, t.Any]:
+        """
+        Returns the number of hits and misses, the number of entries
+        and their estimated size in bytes.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits, 'misses': self.misses, 'size': len(self._entries),
+                'max_items': self.max_items, 'nbytes': self.nbytes, 'max_bytes': self.max_bytes
+            }
+
+# Rendered output of panes, e.g. Markdown and DataFrame HTML
+_RENDER_CACHE = _RenderCache()
+
+def _exact_hash(obj: t.Any) -> bytes | None:
+    """
+    Returns a hash of a pandas DataFrame or Series, including the
+    names of its axes, if it is computed from all of its values, i.e.
+    the data is not sampled, and None otherwise.
+    """
+    if 'pandas' not in sys.modules:
+        return None
+    import pandas as pd
+    if type(obj) not in (pd.DataFrame, pd.Series):
+        return None
+    elif len(obj) >= min(_DATAFRAME_ROWS_LARGE, _ARRAY_SIZE_LARGE) and not _HASH_BACKEND[1]:
+        return None
+    # The hash of pandas objects does not include the names of the axes
+    names = (list(obj.index.names), list(obj.columns.names) if isinstance(obj, pd.DataFrame) else obj.name)
+    h = _new_hasher()
+    h.update(_generate_hash(obj))
+    h.update(repr(names).encode())
+    return h.digest()
+
+_set_hash_backend(config.cache_hash_backend)
+
+class _PolicyCache(MutableMapping):
+    """
+    Wraps a cache store, i.e. a dict or a diskcache Index, holding
+    (ret, ts, count, last) tuples and tracks the order in which keys
+    should be evicted under the given policy, ensuring that lookups,
+    insertions and evictions are all amortized O(1).
+
+    Every hit is recorded by re-assigning the key with an incremented
+    count and updated last access time, therefore all bookkeeping
+    happens when an item is set or deleted:
+
+      - FIFO: keys are kept in insertion order (which is also used
+        to expire items when a TTL is set)
+      - LRU: keys are moved to the end whenever they are accessed
+      - LFU: keys are kept in buckets of equal access count and the
+        lowest non-empty bucket is tracked
+
+    If sized is enabled the estimated size of each cached value is
+    tracked as well, allowing the cache to be bounded by memory.
+    """
+
+    def __init__(self, store, policy='LRU', sized=False):
+        self._store = store
+        self._policy = policy.lower()
+        self._lock = threading.RLock()
+        self._inserted: OrderedDict[Hashable, float] = OrderedDict()
+        self._order: OrderedDict[Hashable, None] = OrderedDict()
+        self._last: dict[Hashable, float] = {}
+        self._counts: dict[Hashable, int] = {}
+        self._buckets: dict[int, OrderedDict[Hashable, None]] = {}
+        self._min_count: int | None = None
+        self._sizes: dict[Hashable, int] = {}
+        self.sized = sized
+        self.nbytes = 0
+        # Rebuild bookkeeping for persisted (e.g. on disk) items
+        items = sorted(store.items(), key=lambda item: item[1][1])
+        if self._policy == 'lru':
+            items = sorted(items, key=lambda item: item[1][3])
+        for key, value in items:
+            self._track(key, value)
+
+    def __getattr__(self, attr):
+        if attr.startswith('_'):
+            raise AttributeError(attr)
+        return getattr(self._store, attr)
+
+    def __contains__(self, key):
+        with self._lock:
+            if key not in self._store:
+                return False
+            elif key not in self._inserted:
+                # Track items added to a shared store by another process
+                self._track(key, self._store[key])
+            return True
+
+    def __getitem__(self, key):
+        return self._store[key]
+
+    def __setitem__(self, key, value):
+        self.insert(key, value)
+
+    def __delitem__(self, key):
+        with self._lock:
+            del self._store[key]
+            self._untrack(key)
+
+    def __iter__(self):
+        return iter(self._store)
+
+    def __len__(self):
+        return len(self._store)
+
+    def _track(self, key, value, nbytes=None):
+        _, ts, count, last = value
+        if key not in self._inserted:
+            self._inserted[key] = ts
+        self._last[key] = last
+        if self.sized and key not in self._sizes:
+            self._sizes[key] = nbytes = _sizeof(value[0]) if nbytes is None else nbytes
+            self.nbytes += nbytes
+        if self._policy == 'fifo':
+            return
+        elif self._policy == 'lru':
+            self._order[key] = None
+            self._order.move_to_end(key)
+            return
+        prev = self._counts.get(key)
+        if prev == count:
+            return
+        was_min = prev is not None and prev == self._min_count
+        if prev is not None:
+            self._remove_from_bucket(key, prev)
+        self._counts[key] = count
+        if count not in self._buckets:
+            self._buckets[count] = OrderedDict()
+        self._buckets[count][key] = None
+        if self._min_count is None:
+            # Counts only ever increase by one so if the previous
+            # bucket was the lowest the new one is the lowest now
+            if len(self._buckets) == 1 or count == 0 or (was_min and count == prev + 1):
+                self._min_count = count
+        elif count < self._min_count:
+            self._min_count = count
+
+    def _remove_from_bucket(self, key, count):
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if count == self._min_count:
+                self._min_count = None
+
+    def _untrack(self, key):
+        self._inserted.pop(key, None)
+        self._last.pop(key, None)
+        self.nbytes -= self._sizes.pop(key, 0)
+        if self._policy == 'lru':
+            self._order.pop(key, None)
+        elif key in self._counts:
+            self._remove_from_bucket(key, self._counts.pop(key))
+
+    def clear(self):
+        with self._lock:
+            self._store.clear()
+            self._inserted.clear()
+            self._order.clear()
+            self._last.clear()
+            self._counts.clear()
+            self._buckets.clear()
+            self._sizes.clear()
+            self._min_count = None
+            self.nbytes = 0
+
+    def expired(self, ttl, time):
+        """
+        Returns the keys inserted longer than ttl seconds ago.
+        """
+        expired = []
+        with self._lock:
+            for key, ts in self._inserted.items():
+                if (time-ts) <= ttl:
+                    break
+                expired.append(key)
+        return expired
+
+    def insert(self, key, value, nbytes=None):
+        """
+        Inserts a value, optionally providing its precomputed size.
+        """
+        with self._lock:
+            self._store[key] = value
+            self._track(key, value, nbytes)
+
+    def last_access(self, key):
+        return self._last[key]
+
+    def sizeof(self, key):
+        return self._sizes.get(key, 0)
+
+    def victim(self):
+        """
+        Returns the key that should be evicted next under the policy.
+        """
+        with self._lock:
+            if self._policy == 'fifo':
+                return next(iter(self._inserted))
+            elif self._policy == 'lru':
+                return next(iter(self._order))
+            if self._min_count is None:
+                self._min_count = min(self._buckets)
+            return next(iter(self._buckets[self._min_count]))
+
+def _shared_cache_path() -> str:
+    """
+    Returns the directory values cached with backend='shared' are
+    written to, defaulting to a directory of the current user in
+    shared memory where available.
+    """
+    if config.cache_shared_path:
+        return os.fspath(config.cache_shared_path)
+    root = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+    if hasattr(os, 'getuid'):
+        return os.path.join(root, f'panel-cache-{os.getuid()}')
+    return os.path.join(root, 'panel-cache')
+
+# Shared cache directories which were refused, to warn only once
+_UNSAFE_SHARED_PATHS: set[str] = set()
+
+def _is_private(st: os.stat_result) -> bool:
+    if not hasattr(os, 'getuid'):
+        return True
+    return st.st_uid == os.getuid() and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+def _private_directory(directory: str, root: str, create: bool = False) -> bool:
+    """
+    Whether the directory and all directories between it and the
+    root of the shared cache are owned by the current user and not
+    writable by any other user. Since shared values are unpickled,
+    values must never be read from (or written to) a directory other
+    users can plant files in. If create is set, missing directories
+    are created accessible only to the current user.
+    """
+    root = os.path.abspath(root)
+    rel = os.path.relpath(os.path.abspath(directory), root)
+    parts = [] if rel == os.curdir else rel.split(os.sep)
+    if os.pardir in parts:
+        return False
+    path = root
+    try:
+        if create:
+            os.makedirs(os.path.dirname(root), exist_ok=True)
+        for part in [None, *parts]:
+            if part is not None:
+                path = os.path.join(path, part)
+            if create:
+                with suppress(FileExistsError):
+                    os.mkdir(path, 0o700)
+            st = os.stat(path)
+            if not stat.S_ISDIR(st.st_mode) or not _is_private(st):
+                break
+        else:
+            return True
+    except OSError:
+        return False
+    if path not in _UNSAFE_SHARED_PATHS:
+        _UNSAFE_SHARED_PATHS.add(path)
+        log.warning(
+            "Refusing to use the shared cache directory %r since it is not "
+            "owned by the current user or is writable by other users.", path
+        )
+    return False
+
+def _shared_value_path(cache_key: Hashable) -> str:
+    """
+    Returns the file a value cached with pn.state.as_cached using the
+    shared backend is written to.
+    """
+    name = hashlib.sha256(_generate_hash(cache_key)).hexdigest()
+    return os.path.join(_shared_cache_path(), 'as_cached', name)
+
+def _align(offset: int) -> int:
+    return -(-offset // _SHARED_ALIGNMENT) * _SHARED_ALIGNMENT
+
+def _shared_write(path: str, value: t.Any, root: str | None = None) -> bool:
+    """
+    Atomically writes a value to a file, storing the buffers of NumPy
+    and Arrow backed data (e.g. DataFrame columns) uncompressed and
+    aligned so they can be memory-mapped by _shared_read. Returns
+    False if the value cannot be pickled or the directory below the
+    root of the shared cache (by default _shared_cache_path) is not
+    private to the current user.
+    """
+    buffers: list[pickle.PickleBuffer] = []
+    try:
+        payload = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+    except Exception:
+        return False
+    views, extents, offset = [], [], 0
+    for buf in buffers:
+        try:
+            view = buf.raw()
+        except BufferError:
+            # Non-contiguous buffers have to be copied
+            view = memoryview(memoryview(buf).tobytes())
+        offset = _align(offset)
+        extents.append((offset, view.nbytes))
+        views.append(view)
+        offset += view.nbytes
+    header = pickle.dumps((payload, extents, time.time()), protocol=5)
+    start = _align(len(_SHARED_MAGIC) + 8 + len(header))
+    if not _private_directory(os.path.dirname(path), root or _shared_cache_path(), create=True):
+        return False
+    tmp = f'{path}.{os.getpid()}-{threading.get_ident()}.tmp'
+    try:
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o600)
+        with open(fd, 'wb') as f:
+            f.write(_SHARED_MAGIC)
+            f.write(len(header).to_bytes(8, 'little'))
+            f.write(header)
+            pos = len(_SHARED_MAGIC) + 8 + len(header)
+            for (offset, nbytes), view in zip(extents, views):
+                f.write(b'\0' * (start + offset - pos))
+                f.write(view)
+                pos = start + offset + nbytes
+        os.replace(tmp, path)
+    except OSError:
+        with suppress(OSError):
+            os.remove(tmp)
+        return False
+    return True
+
+def _shared_read(path: str, root: str | None = None) -> tuple[t.Any, float]:
+    """
+    Reads a value written by _shared_write, returning the value and
+    the (wall clock) time it was written. Buffers are memory-mapped
+    read-only, therefore arrays are shared by all processes reading
+    the same file rather than copied. Raises a KeyError if the file
+    does not exist, is not a valid value or if it, or the directory
+    below the root of the shared cache, is not private to the current
+    user.
+    """
+    if not os.path.exists(path):
+        raise KeyError(path)
+    elif not _private_directory(os.path.dirname(path), root or _shared_cache_path()):
+        raise KeyError(path)
+    try:
+        with open(path, 'rb') as f:
+            if not _is_private(os.fstat(f.fileno())):
+                raise KeyError(path)
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        raise KeyError(path) from None
+    view = memoryview(mm)
+    offset = len(_SHARED_MAGIC) + 8
+    if view[:len(_SHARED_MAGIC)] != _SHARED_MAGIC:
+        raise KeyError(path)
+    size = int.from_bytes(view[len(_SHARED_MAGIC):offset], 'little')
+    payload, extents, written = pickle.loads(view[offset:offset+size])
+    start = _align(offset + size)
+    buffers = [view[start+o:start+o+n] for o, n in extents]
+    return pickle.loads(payload, buffers=buffers), written
+
+class _SharedStore(MutableMapping):
+    """
+    Cache store holding (ret, ts, count, last) tuples which writes
+    each value to a file in a directory shared between processes,
+    e.g. the workers launched with `panel serve --num-procs`.
+
+    Values are attached, i.e. memory-mapped, on first access, after
+    which lookups are served from memory. Only attached keys are
+    iterated over and counted, so limits such as max_items apply per
+    process, while deleting a key removes it for all processes.
+    Values written longer than ttl seconds ago are never attached.
+    """
+
+    def __init__(self, directory, ttl=None, root=None):
+        self.directory = os.fspath(directory)
+        self.root = os.fspath(root) if root is not None else self.directory
+        self._ttl = ttl
+        self._attached: dict[Hashable, tuple[t.Any, float, int, float]] = {}
+        self._lock = threading.RLock()
+
+    def _path(self, key):
+        return os.path.join(self.directory, str(key))
+
+    def _attach(self, key):
+        if key in self._attached:
+            return True
+        path = self._path(key)
+        try:
+            ret, written = _shared_read(path, self.root)
+        except KeyError:
+            return False
+        age = time.time() - written
+        if self._ttl is not None and age > self._ttl:
+            with suppress(OSError):
+                os.remove(path)
+            return False
+        ts = _TIME_FN() - age
+        self._attached[key] = (ret, ts, 0, ts)
+        return True
+
+    def __contains__(self, key):
+        with self._lock:
+            return self._attach(key)
+
+    def __getitem__(self, key):
+        with self._lock:
+            if not self._attach(key):
+                raise KeyError(key)
+            return self._attached[key]
+
+    def __setitem__(self, key, value):
+        ret, ts, count, last = value
+        with self._lock:
+            current = self._attached.get(key)
+            if current is not None and current[0] is ret:
+                self._attached[key] = value
+                return
+            path = self._path(key)
+            if _shared_write(path, ret, self.root):
+                # Replace the value with the memory-mapped copy so
+                # the memory is shared with the other processes
+                self._attached.pop(key, None)
+                if self._attach(key):
+                    self._attached[key] = (self._attached[key][0], ts, count, last)
+                    return
+            self._attached[key] = value
+
+    def __delitem__(self, key):
+        with self._lock:
+            value = self._attached.pop(key, None)
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                if value is None:
+                    raise KeyError(key) from None
+
+    def __iter__(self):
+        return iter(list(self._attached))
+
+    def __len__(self):
+        return len(self._attached)
+
+    def clear(self):
+        with self._lock:
+            self._attached.clear()
+            if not os.path.isdir(self.directory):
+                return
+            for name in os.listdir(self.directory):
+                with suppress(OSError):
+                    os.remove(os.path.join(self.directory, name))
+
+def _cleanup_cache(cache, max_items):
+    """
+    Deletes items in the cache if the exceed the number of items.
     """
     while len(cache) >= max_items:
-        if policy.lower() == 'fifo':
-            key = list(cache.keys())[0]
-        elif policy.lower() == 'lru':
-            key = sorted(((k, time-t) for k, (_, _, _, t) in cache.items()),
-                         key=lambda o: o[1])[-1][0]
-        elif policy.lower() == 'lfu':
-            key = sorted(cache.items(), key=lambda o: o[1][2])[0][0]
-        del cache[key]
+        del cache[cache.victim()]
+
+def _cleanup_bytes(cache, max_bytes):
+    """
+    Deletes items in the cache until their total size fits max_bytes.
+    """
+    while len(cache) and cache.nbytes > max_bytes:
+        del cache[cache.victim()]
+
+def _cleanup_memory(max_bytes):
+    """
+    Evicts items across all sized pn.cache stores and the values
+    cached with pn.state.as_cached until their total estimated size
+    fits within max_bytes. On each iteration the least recently
+    accessed of the candidates nominated by each cache is evicted.
+    """
+    with _MEMORY_LOCK:
+        caches = [
+            cache for cache in state._memoize_cache.values()
+            if isinstance(cache, _PolicyCache) and cache.sized
+        ]
+        usage = state._cache_usage
+        total = sum(cache.nbytes for cache in caches) + sum(n for n, _ in usage.values())
+        while total > max_bytes:
+            candidates = []
+            for cache in caches:
+                if not len(cache):
+                    continue
+                key = cache.victim()
+                candidates.append((cache.last_access(key), cache, key))
+            if usage:
+                key = next(iter(usage))
+                candidates.append((usage[key][1], None, key))
+            if not candidates:
+                break
+            _, cache, key = min(candidates, key=lambda c: c[0])
+            if cache is None:
+                nbytes, _ = usage.pop(key)
+                state.cache.pop(key, None)
+            else:
+                nbytes = cache.sizeof(key)
+                with suppress(KeyError):
+                    del cache[key]
+            total -= nbytes
 
 def _cleanup_ttl(cache, ttl, time):
     """
     Deletes items in the cache if their TTL (time-to-live) has expired.
     """
-    for key, (_, ts, _, _) in list(cache.items()):
-        if (time-ts) > ttl:
-            del cache[key]
+    for key in cache.expired(ttl, time):
+        del cache[key]
 
 @contextmanager
 def _override_hash_funcs(hash_funcs):
@@ -361,18 +1218,32 @@ def compute_hash(func, hash_funcs, args, kwargs):
     kwargs: dict
         Keyword arguments to hash
     """
-    key = (func, _key(args), _key(kwargs))
-    if _INDETERMINATE not in key and key in _HASH_MAP:
-        return _HASH_MAP[key]
-    hasher = hashlib.new("md5")
+    refs: list[t.Any] = []
+    key = (
+        func,
+        tuple(_key(arg, refs) for arg in args),
+        tuple((k, _key(v, refs)) for k, v in kwargs.items())
+    )
+    memoize = (
+        all(k is not _INDETERMINATE for k in key[1]) and
+        all(v is not _INDETERMINATE for _, v in key[2])
+    )
+    if memoize:
+        hash_value = _HASH_MAP.get(key)
+        if hash_value is not None:
+            return hash_value
+    else:
+        _HASH_MAP.miss()
+    start = _TIME_FN()
+    hasher = _new_hasher()
     with _override_hash_funcs(hash_funcs):
         if args:
             hasher.update(_generate_hash(args))
         if kwargs:
             hasher.update(_generate_hash(kwargs))
     hash_value = hasher.hexdigest()
-    if _INDETERMINATE not in key:
-        _HASH_MAP[key] = hash_value
+    if memoize:
+        _HASH_MAP.set(key, hash_value, _TIME_FN()-start, refs)
     return hash_value
 
 @t.overload
@@ -385,6 +1256,9 @@ def cache(
     to_disk: bool = ...,
     cache_path: str | os.PathLike | None = ...,
     per_session: bool = ...,
+    single_flight: bool = ...,
+    max_bytes: int | None = ...,
+    backend: t.Literal['memory', 'disk', 'shared'] | None = ...,
 ) -> Callable[[Callable[_P, _R]], _CachedFunc[Callable[_P, _R]]]:
     ...
 
@@ -398,6 +1272,9 @@ def cache(
     to_disk: bool = ...,
     cache_path: str | os.PathLike | None = ...,
     per_session: bool = ...,
+    single_flight: bool = ...,
+    max_bytes: int | None = ...,
+    backend: t.Literal['memory', 'disk', 'shared'] | None = ...,
 ) -> _CachedFunc[Callable[_P, _R]]:
     ...
 
@@ -409,7 +1286,10 @@ def cache(
     ttl: float | None = None,
     to_disk: bool = False,
     cache_path: str | os.PathLike | None = None,
-    per_session: bool = False
+    per_session: bool = False,
+    single_flight: bool = False,
+    max_bytes: int | None = None,
+    backend: t.Literal['memory', 'disk', 'shared'] | None = None
 ) -> _CachedFunc[Callable[_P, _R]] | Callable[[Callable[_P, _R]], _CachedFunc[Callable[_P, _R]]]:
     """
     Memoizes functions for a user session. Can be used as function annotation or just directly.
@@ -436,20 +1316,50 @@ def cache(
         The number of seconds to keep an item in the cache, or None if
         the cache should not expire. The default is None.
     to_disk: bool
-        Whether to cache to disk using diskcache.
+        Whether to cache to disk using diskcache, equivalent to
+        backend='disk'.
     cache_path: str
         Directory to cache to on disk (if not provided default will be
-        inherited from config.cache_path).
+        inherited from config.cache_path or for the shared backend
+        from config.cache_shared_path).
     per_session: bool
         Whether to cache data only for the current session.
+    single_flight: bool
+        Whether concurrent calls with the same arguments should be
+        coalesced, i.e. only the first caller computes the result
+        while all other callers wait for and share its result. The
+        number of coalesced calls is reported by the `stats` method
+        of the cached function.
+    max_bytes: int or None
+        The maximum estimated size in bytes of all items kept in the
+        cache. When exceeded, items are evicted according to the
+        policy. Items larger than max_bytes are not cached at all.
+        A global budget across all caches may be set with
+        `config.cache_max_bytes`.
+    backend: str or None
+        Where to store cached values, must be one of:
+          - memory: In the memory of the current process (default)
+          - disk: On disk using diskcache
+          - shared: In files (by default in shared memory) which are
+            memory-mapped by all processes, e.g. the workers of
+            `panel serve --num-procs`. NumPy and Arrow backed data,
+            including pandas DataFrames, is stored once and shared
+            zero-copy. Shared values are read-only.
     """
     if policy.lower() not in ('fifo', 'lru', 'lfu'):
         raise ValueError(
             f"Cache policy must be one of 'FIFO', 'LRU' or 'LFU', not {policy}."
         )
 
+    if backend is None:
+        backend = 'disk' if to_disk else 'memory'
+    elif backend not in ('memory', 'disk', 'shared'):
+        raise ValueError(
+            f"Cache backend must be one of 'memory', 'disk' or 'shared', not {backend}."
+        )
+
     if cache_path is None:
-        cache_path = config.cache_path
+        cache_path = _shared_cache_path() if backend == 'shared' else config.cache_path
 
     hash_funcs = hash_funcs or {}
     if func is None:
@@ -458,16 +1368,24 @@ def cache(
                 func=func,
                 hash_funcs=hash_funcs,
                 max_items=max_items,
+                policy=policy,
                 ttl=ttl,
                 to_disk=to_disk,
                 cache_path=cache_path,
                 per_session=per_session,
+                single_flight=single_flight,
+                max_bytes=max_bytes,
+                backend=backend,
             )
         return decorator
     func_hashes = [None] # noqa
 
     lock = threading.RLock()
 
+    # Computations currently in progress when single_flight is enabled
+    in_flight: dict[tuple[str, str], Future] = {}
+    func_stats = {'hits': 0, 'misses': 0, 'coalesced': 0}
+
     def hash_func(*args, **kwargs):
         # Handle param.depends method by adding parameters to arguments
         func_name = func.__name__
@@ -501,49 +1419,126 @@ def cache(
         func_cache = state._memoize_cache.get(func_hash)
 
         if func_cache is None:
-            if to_disk:
+            if backend == 'disk':
                 from diskcache import Index
                 cache = Index(os.path.join(cache_path, func_hash))
+            elif backend == 'shared':
+                cache = _SharedStore(os.path.join(cache_path, func_hash), ttl, root=cache_path)
             else:
                 cache = {}
+            sized = max_bytes is not None or bool(config.cache_max_bytes)
+            if max_items is not None or ttl is not None or sized:
+                cache = _PolicyCache(cache, policy, sized=sized)
             state._memoize_cache[func_hash] = func_cache = cache
 
-        if ttl is not None:
-            _cleanup_ttl(func_cache, ttl, time)
+        with lock:
+            if ttl is not None:
+                _cleanup_ttl(func_cache, ttl, time)
 
-        if hash_value in func_cache:
-            return func_cache, hash_value, time
+            if hash_value in func_cache:
+                return func_cache, func_hash, hash_value, time
 
-        if max_items is not None:
-            _cleanup_cache(func_cache, policy, max_items, time)
+            if max_items is not None:
+                _cleanup_cache(func_cache, max_items)
 
-        return func_cache, hash_value, time
+        return func_cache, func_hash, hash_value, time
+
+    def lookup(func_cache, func_hash, hash_value, time):
+        """
+        Returns a tuple of the cached value (or _INDETERMINATE on a miss)
+        and, in single_flight mode, the Future of the in-flight
+        computation and whether the caller is responsible for it.
+        """
+        with lock:
+            if hash_value in func_cache:
+                func_stats['hits'] += 1
+                ret, ts, count, _ = func_cache[hash_value]
+                func_cache[hash_value] = (ret, ts, count+1, time)
+                return ret, None, False
+            if not single_flight:
+                func_stats['misses'] += 1
+                return _INDETERMINATE, None, True
+            key = (func_hash, hash_value)
+            future = in_flight.get(key)
+            if future is None:
+                func_stats['misses'] += 1
+                in_flight[key] = future = Future()
+                return _INDETERMINATE, future, True
+            func_stats['coalesced'] += 1
+            return _INDETERMINATE, future, False
+
+    def store(func_cache, func_hash, hash_value, time, ret, future):
+        sized = isinstance(func_cache, _PolicyCache) and func_cache.sized
+        nbytes = _sizeof(ret) if sized else None
+        max_total = config.cache_max_bytes if sized else None
+        with lock:
+            if not sized:
+                func_cache[hash_value] = (ret, time, 0, time)
+            elif (max_bytes is None or nbytes <= max_bytes) and (not max_total or nbytes <= max_total):
+                # Values exceeding the budget are never cached
+                if max_bytes is not None:
+                    _cleanup_bytes(func_cache, max_bytes-nbytes)
+                if max_total:
+                    _cleanup_memory(max_total-nbytes)
+                func_cache.insert(hash_value, (ret, time, 0, time), nbytes)
+            if future is not None:
+                in_flight.pop((func_hash, hash_value), None)
+        if future is not None:
+            future.set_result(ret)
+
+    def abort(func_hash, hash_value, future, exc):
+        with lock:
+            in_flight.pop((func_hash, hash_value), None)
+        if isinstance(exc, (asyncio.CancelledError, KeyboardInterrupt)):
+            # The owning call (e.g. of a destroyed session) was
+            # interrupted, so one of the waiting calls takes over
+            future.set_result(_RETRY)
+        else:
+            future.set_exception(exc)
 
     if iscoroutinefunction(func):
         @functools.wraps(func)
         async def wrapped_func(*args: _P.args, **kwargs: _P.kwargs) -> _R:
-            func_cache, hash_value, time = hash_func(*args, **kwargs)
-            if hash_value in func_cache:
-                with lock:
-                    ret, ts, count, _ = func_cache[hash_value]
-                    func_cache[hash_value] = (ret, ts, count+1, time)
-            else:
+            func_cache, func_hash, hash_value, time = hash_func(*args, **kwargs)
+            while True:
+                ret, future, owner = lookup(func_cache, func_hash, hash_value, time)
+                if ret is not _INDETERMINATE or owner:
+                    break
+                # Shielded so that cancelling a waiting call does not
+                # cancel the computation shared with the other calls
+                ret = await asyncio.shield(asyncio.wrap_future(future))
+                if ret is not _RETRY:
+                    return ret
+            if ret is not _INDETERMINATE:
+                return ret
+            try:
                 ret = await t.cast("Awaitable[t.Any]", func(*args, **kwargs))
-                with lock:
-                    func_cache[hash_value] = (ret, time, 0, time)
+            except BaseException as e:
+                if future is not None:
+                    abort(func_hash, hash_value, future, e)
+                raise
+            store(func_cache, func_hash, hash_value, time, ret, future)
             return ret
     else:
         @functools.wraps(func)
         def wrapped_func(*args: _P.args, **kwargs: _P.kwargs) -> _R:
-            func_cache, hash_value, time = hash_func(*args, **kwargs)
-            if hash_value in func_cache:
-                with lock:
-                    ret, ts, count, _ = func_cache[hash_value]
-                    func_cache[hash_value] = (ret, ts, count+1, time)
-            else:
+            func_cache, func_hash, hash_value, time = hash_func(*args, **kwargs)
+            while True:
+                ret, future, owner = lookup(func_cache, func_hash, hash_value, time)
+                if ret is not _INDETERMINATE or owner:
+                    break
+                ret = future.result()
+                if ret is not _RETRY:
+                    return ret
+            if ret is not _INDETERMINATE:
+                return ret
+            try:
                 ret = func(*args, **kwargs)
-                with lock:
-                    func_cache[hash_value] = (ret, time, 0, time)
+            except BaseException as e:
+                if future is not None:
+                    abort(func_hash, hash_value, future, e)
+                raise
+            store(func_cache, func_hash, hash_value, time, ret, future)
             return ret
 
     def clear(func_hashes=func_hashes):
@@ -554,7 +1549,16 @@ def cache(
         if cache:
             cache.clear()
 
+    def stats():
+        """
+        Returns the number of cache hits, misses and, in single_flight
+        mode, the number of calls coalesced into an in-flight computation.
+        """
+        with lock:
+            return dict(func_stats, in_flight=len(in_flight))
+
     wrapped_func.clear = clear  # type: ignore[attr-defined]
+    wrapped_func.stats = stats  # type: ignore[attr-defined]
 
     if per_session and state.curdoc and state.curdoc.session_context:
         def server_clear(session_context, clear=clear):
@@ -21,13 +21,14 @@ from bokeh.application.application import SessionContext
 from bokeh.document.document import Document
 from bokeh.document.events import (
     DocumentChangedEvent, DocumentPatchedEvent, MessageSentEvent,
-    SessionCallbackAdded, SessionCallbackRemoved,
+    ModelChangedEvent, SessionCallbackAdded, SessionCallbackRemoved,
 )
 from bokeh.model.util import visit_immediate_value_references
 from bokeh.models import CustomJS
 
 from ..config import config
 from .loading import LOADING_INDICATOR_CSS_CLASS
+from .metrics import _METRICS
 from .model import monkeypatch_events  # noqa: F401 API import
 from .state import state
 
@@ -58,6 +59,9 @@ _WRITE_FUTURES: WeakKeyDictionary[Document, list[Future]] = WeakKeyDictionary()
 _WRITE_EVENTS: WeakKeyDictionary[Document, list[EventBatch]] = WeakKeyDictionary()
 _WRITE_BLOCK: WeakKeyDictionary[Document, bool] = WeakKeyDictionary()
 _UNCONNECTED_EVENTS: WeakKeyDictionary[Document, list[DocumentChangedEvent]] = WeakKeyDictionary()
+_THROTTLED_EVENTS: WeakKeyDictionary[Document, list[DocumentPatchedEvent]] = WeakKeyDictionary()
+_LAST_WRITE: WeakKeyDictionary[Document, float] = WeakKeyDictionary()
+_DROPPED_UPDATES: WeakKeyDictionary[Document, int] = WeakKeyDictionary()
 
 _panel_last_cleanup = None
 _write_tasks: WeakKeyDictionary[Document, list[asyncio.Task]] = WeakKeyDictionary()
@@ -286,6 +290,90 @@ async def _dispatch_msgs(doc):
     await asyncio.sleep(0.01)
     _dispatch_write_task(doc, _dispatch_msgs, doc)
 
+def _is_value_update(doc: Document, event: DocumentChangedEvent) -> bool:
+    """
+    Whether the event only updates the value of a property on a model
+    the client has already been sent, i.e. neither defines nor
+    references any models and may therefore be delayed or dropped in
+    favor of a later update without affecting any other message.
+    """
+    if type(event) is not ModelChangedEvent or event.model in doc.models._new_models:
+        return False
+    references: list[HasProps] = []
+    visit_immediate_value_references(event.new, references.append)
+    return not references
+
+def _coalesce_events(doc: Document, pending: list[DocumentPatchedEvent], events: list[DocumentPatchedEvent]) -> None:
+    """
+    Adds the events to the pending property updates, keeping only the
+    latest update of each property and counting the dropped updates.
+    """
+    combined = pending + events
+    seen, coalesced = set(), []
+    for event in reversed(combined):
+        key = (event.model.id, event.attr)  # type: ignore[attr-defined]
+        if key not in seen:
+            seen.add(key)
+            coalesced.append(event)
+    pending[:] = coalesced[::-1]
+    if dropped := len(combined) - len(pending):
+        _DROPPED_UPDATES[doc] = count = _DROPPED_UPDATES.get(doc, 0) + dropped
+        session_context = doc.session_context
+        session_info = state.session_info['sessions'].get(session_context.id) if session_context else None
+        if session_info is not None:
+            session_info['dropped_updates'] = count
+
+def _flush_throttled_events(doc: Document, session: ServerSession, pending: list[DocumentPatchedEvent]) -> None:
+    """
+    Writes the property updates that were deferred by ``_throttle_events``
+    unless they have already been flushed ahead of another event.
+    """
+    if _THROTTLED_EVENTS.get(doc) is not pending:
+        return
+    del _THROTTLED_EVENTS[doc]
+    _LAST_WRITE[doc] = time.monotonic()
+    if pending:
+        schedule_write_events(doc, session._subscribed_connections, pending)
+
+def _throttle_events(
+    doc: Document, session: ServerSession, events: list[DocumentChangedEvent]
+) -> list[DocumentChangedEvent]:
+    """
+    Limits the rate at which patches are written to the sessions to
+    ``config.max_update_rate`` by deferring property updates made
+    within the minimum interval after the last write, coalescing all
+    updates to the same property until they are flushed. Returns the
+    events which should be dispatched immediately.
+
+    Only updates to the values of properties are deferred. Any other
+    patch may define or reference models, which later messages may rely
+    on, so the pending updates are flushed ahead of it and the order of
+    the events is preserved.
+    """
+    patches = [e for e in events if isinstance(e, DocumentPatchedEvent)]
+    if not patches:
+        return events
+    deferrable = all(_is_value_update(doc, event) for event in patches)
+    pending = _THROTTLED_EVENTS.get(doc)
+    now = time.monotonic()
+    if pending is None:
+        interval = 1 / config.max_update_rate
+        elapsed = now - _LAST_WRITE.get(doc, -interval)
+        if not deferrable or elapsed >= interval:
+            _LAST_WRITE[doc] = now
+            return events
+        _THROTTLED_EVENTS[doc] = pending = []
+        doc.add_timeout_callback(
+            partial(_flush_throttled_events, doc, session, pending),
+            int(max(interval - elapsed, 0) * 1000)
+        )
+    if deferrable:
+        _coalesce_events(doc, pending, patches)
+        return [e for e in events if not isinstance(e, DocumentPatchedEvent)]
+    del _THROTTLED_EVENTS[doc]
+    _LAST_WRITE[doc] = now
+    return pending + events
+
 def _garbage_collect():
     if (new_time:= time.monotonic()-_panel_last_cleanup) < GC_DEBOUNCE:
         at = dt.datetime.now() + dt.timedelta(seconds=new_time)
@@ -330,6 +418,9 @@ def _destroy_document(self, session):
     _WRITE_EVENTS.pop(self, None)
     _WRITE_BLOCK.pop(self, None)
     _UNCONNECTED_EVENTS.pop(self, None)
+    _THROTTLED_EVENTS.pop(self, None)
+    _LAST_WRITE.pop(self, None)
+    _DROPPED_UPDATES.pop(self, None)
     for future in _WRITE_FUTURES.pop(self, []):
         future.cancel()
     for task in _write_tasks.pop(self, []):
@@ -387,6 +478,10 @@ def write_events(
         return []
 
     msg = connections[0].protocol.create('PATCH-DOC', events)
+    if _METRICS.enabled:
+        nbytes = len(msg.header_json) + len(msg.metadata_json) + len(msg.content_json)
+        nbytes += sum(memoryview(buffer.data).nbytes for buffer in msg._buffers)
+        _METRICS.message_written(doc, nbytes, len(connections))
 
     futures: list[Future] = []
     for conn in connections:
@@ -590,6 +685,10 @@ def _flush_events(curdoc: Document, session: ServerSession) -> None:
     curdoc.callbacks._held_events = []
     monkeypatch_events(events)
 
+    # Coalesce property updates made faster than the configured rate
+    if config.max_update_rate:
+        events = _throttle_events(curdoc, session, events)
+
     # If we cannot write the events ourselves we let bokeh dispatch them,
     # as long as it is inside a locked callback and will therefore write
     # them before the callback returns. Deferring the write ourselves
@@ -0,0 +1,243 @@
+"""
+A store of short-lived, token protected downloads, e.g. of the files
+provided to the FileDownload widget, which are streamed to the browser
+over HTTP, so that the files do not have to be read into memory and
+transferred over the websocket as base64 encoded data URIs.
+"""
+from __future__ import annotations
+
+import os
+import re
+import secrets
+import threading
+import time
+import typing as t
+
+from collections.abc import Iterator
+from functools import partial
+from pathlib import Path
+from urllib.parse import quote
+from weakref import WeakKeyDictionary, ref
+
+from .state import state
+
+if t.TYPE_CHECKING:
+    from bokeh.document import Document
+
+DOWNLOAD_PATH = "downloads/"
+
+# The size of the chunks downloads are streamed in
+CHUNK_SIZE = 1_048_576
+
+# The number of seconds a download may be requested after it was
+# registered or last requested
+DOWNLOAD_TTL = 600
+
+_RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def content_disposition(filename: str) -> str:
+    """
+    Returns a Content-Disposition header value prompting the browser
+    to save the response under the filename.
+    """
+    return f"attachment; filename*=UTF-8''{quote(filename)}"
+
+
+def parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """
+    Parses a single byte range of a Range header.
+
+    Arguments
+    ---------
+    header: str
+      The value of the Range header.
+    size: int
+      The size of the requested resource.
+
+    Returns
+    -------
+    The start and (exclusive) end of the range or None if the range is
+    not satisfiable. Ranges which are not supported, e.g. multiple
+    ranges, span the whole resource.
+    """
+    match = _RANGE_RE.match(header.strip())
+    if not match or match.groups() == ('', ''):
+        return 0, size
+    start, end = match.groups()
+    if not start:
+        start, end = max(size - int(end), 0), size
+    else:
+        start, end = int(start), min(int(end) + 1, size) if end else size
+    if start >= end:
+        return None
+    return start, end
+
+
+class Download:
+    """
+    A file, file-like object or iterable of chunks to be downloaded.
+    """
+
+    def __init__(self, source: t.Any, filename: str, mime_type: str):
+        self.source = source
+        self.filename = filename
+        self.mime_type = mime_type
+        self.expires = time.monotonic() + DOWNLOAD_TTL
+        self._lock = threading.Lock()
+        self._consumed = False
+
+    @property
+    def consumed(self) -> bool:
+        """
+        Whether the download was streamed from an iterator, which
+        cannot be streamed again.
+        """
+        return self._consumed
+
+    @property
+    def size(self) -> int | None:
+        """
+        The size of the download in bytes, if known in advance.
+        """
+        if isinstance(self.source, Path):
+            return self.source.stat().st_size
+        elif isinstance(self.source, bytes):
+            return len(self.source)
+        elif isinstance(self.source, str):
+            return len(self.source.encode('utf-8'))
+        elif hasattr(self.source, 'read') and hasattr(self.source, 'seek'):
+            with self._lock:
+                try:
+                    if isinstance(self.source.read(0), str):
+                        return None
+                    return self.source.seek(0, os.SEEK_END)
+                except OSError:
+                    return None
+        return None
+
+    def iter_chunks(self, start: int = 0, end: int | None = None) -> Iterator[bytes]:
+        """
+        Yields the bytes of the download from start up to end in chunks.
+        Downloads of unknown size are always streamed completely.
+        """
+        if isinstance(self.source, str):
+            self.source = self.source.encode('utf-8')
+        if isinstance(self.source, bytes):
+            end = len(self.source) if end is None else end
+            for i in range(start, end, CHUNK_SIZE):
+                yield self.source[i:min(i+CHUNK_SIZE, end)]
+        elif isinstance(self.source, Path):
+            with open(self.source, 'rb') as f:
+                yield from self._read(f, start, end)
+        elif hasattr(self.source, 'read'):
+            yield from self._read(self.source, start, end)
+        else:
+            if isinstance(self.source, Iterator):
+                self._consumed = True
+            for chunk in self.source:
+                yield chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+
+    def _read(self, f: t.IO, start: int, end: int | None) -> Iterator[bytes]:
+        # Text files are always read completely
+        text = isinstance(f.read(0), str)
+        if text and hasattr(f, 'seek'):
+            f.seek(0)
+        offset = start
+        while end is None or offset < end:
+            with self._lock:
+                if not text and hasattr(f, 'seek'):
+                    # The file may be read by concurrent requests
+                    f.seek(offset)
+                chunk = f.read(CHUNK_SIZE if end is None else min(CHUNK_SIZE, end-offset))
+            if not chunk:
+                break
+            offset += len(chunk)
+            yield chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+
+
+class DownloadStore:
+    """
+    Holds downloads keyed by a random token.
+
+    Each download is registered on behalf of an owner (e.g. a widget)
+    on a Document and is held until it expires, the owner registers
+    a new download or the session of the Document is destroyed.
+    """
+
+    def __init__(self):
+        self.serving = False
+        self._downloads: dict[str, Download] = {}
+        self._owners: WeakKeyDictionary[Document, dict[int, str]] = WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def __contains__(self, token: str) -> bool:
+        return token in self._downloads
+
+    def __len__(self) -> int:
+        return len(self._downloads)
+
+    def enabled(self, doc: Document | None) -> bool:
+        """
+        Whether downloads can be served to the Document, i.e. whether
+        it belongs to a session on a server which serves downloads.
+        """
+        return self.serving and doc is not None and doc.session_context is not None
+
+    def add(self, source: t.Any, filename: str, mime_type: str, doc: Document, owner: t.Any) -> str:
+        """
+        Registers the file, file-like object or iterable of chunks on
+        behalf of the owner and returns the token of the download.
+        """
+        token = secrets.token_urlsafe(32)
+        with self._lock:
+            self._expire()
+            if doc not in self._owners:
+                self._owners[doc] = {}
+                doc.on_session_destroyed(partial(self._release_doc, ref(doc)))
+            owners = self._owners[doc]
+            previous = owners.get(id(owner))
+            if previous is not None:
+                self._downloads.pop(previous, None)
+            owners[id(owner)] = token
+            self._downloads[token] = Download(source, filename, mime_type)
+        return token
+
+    def get(self, token: str) -> Download | None:
+        """
+        Returns the download if it has not expired, extending its expiry.
+        """
+        with self._lock:
+            download = self._downloads.get(token)
+            if download is None:
+                return None
+            now = time.monotonic()
+            if download.expires < now:
+                del self._downloads[token]
+                return None
+            download.expires = now + DOWNLOAD_TTL
+        return download
+
+    def url(self, token: str, doc: Document) -> str:
+        """
+        Returns the URL of the download relative to the page the
+        Document is rendered on.
+        """
+        rel_path = state._rel_paths.get(doc, state._rel_path)
+        return f"{rel_path}/{DOWNLOAD_PATH}{token}" if rel_path else f"{DOWNLOAD_PATH}{token}"
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        for token in [k for k, d in self._downloads.items() if d.expires < now]:
+            del self._downloads[token]
+
+    def _release_doc(self, doc_ref: ref[Document], session_context) -> None:
+        doc = doc_ref()
+        if doc is None:
+            return
+        with self._lock:
+            for token in self._owners.pop(doc, {}).values():
+                self._downloads.pop(token, None)
+
+
+download_store = DownloadStore()
@@ -12,7 +12,12 @@ import tornado
 
 from ..config import config
 from .application import build_applications
+from .blobs import BLOB_PATH, blob_store
 from .document import _cleanup_doc, extra_socket_handlers
+from .downloads import (
+    DOWNLOAD_PATH, content_disposition, download_store, parse_range,
+)
+from .metrics import _METRICS, CONTENT_TYPE
 from .resources import COMPONENT_PATH
 from .server import (
     ComponentResourceHandler, _sanitize_route_context, _strip_prefixed_path,
@@ -30,7 +35,9 @@ try:
     from fastapi import (
         FastAPI, HTTPException, Query, Request,
     )
-    from fastapi.responses import FileResponse
+    from fastapi.responses import (
+        FileResponse, PlainTextResponse, Response, StreamingResponse,
+    )
     from tornado.httputil import HTTPHeaders, HTTPServerRequest
     from tornado.ioloop import IOLoop
 except ImportError as e:
@@ -232,6 +239,13 @@ def add_liveness_handler(app, endpoint: str, applications: dict[str, BkApplicati
         else:
             return {str(request.url.path): True}
 
+def add_metrics_handler(app, endpoint: str, application: BokehFastAPI):
+    @app.get(endpoint, response_class=PlainTextResponse, include_in_schema=False)
+    async def metrics_handler():
+        return PlainTextResponse(
+            _METRICS.expose(application._applications), media_type=CONTENT_TYPE
+        )
+
 def add_history_handler(app, endpoint):
     @app.get(endpoint, response_model=dict[str, int | dict[str, t.Any]])
     async def history_handler(request: Request):
@@ -249,6 +263,7 @@ def add_applications(
     admin: bool = False,
     session_history: int | None = None,
     liveness: bool | str = False,
+    metrics: bool | str = False,
     **kwargs
 ):
     """
@@ -278,6 +293,11 @@ def add_applications(
       Whether to add a liveness endpoint. If a string is provided
       then this will be used as the endpoint, otherwise the endpoint
       will be hosted at /liveness.
+    metrics: bool | str (optional, default=False)
+      Whether to add an endpoint serving metrics of the server in the
+      Prometheus text format. If a string is provided then this will
+      be used as the endpoint, otherwise the endpoint will be hosted
+      at /metrics.
     **kwargs:
         Additional keyword arguments to pass to the BokehFastAPI application
     """
@@ -305,6 +325,12 @@ def add_applications(
         add_liveness_handler(
             application.app, endpoint=_prefix_path(liveness_endpoint, prefix), applications=apps
         )
+    if metrics:
+        _METRICS.enable()
+        metrics_endpoint = metrics if isinstance(metrics, str) else '/metrics'
+        add_metrics_handler(
+            application.app, endpoint=_prefix_path(metrics_endpoint, prefix), application=application
+        )
 
     @application.app.get(
         _prefix_path(f"/{COMPONENT_PATH.rstrip('/')}" + "/{path:path}", prefix),
@@ -318,6 +344,55 @@ def add_applications(
         resolved_path = ComponentResourceHandler.parse_url_path(self_, path)
         return FileResponse(resolved_path)
 
+    @application.app.get(
+        _prefix_path(f"/{BLOB_PATH}" + "{key}", prefix),
+        include_in_schema=False
+    )
+    def get_blob(key: str, request: Request):
+        blob = blob_store.get(key)
+        if blob is None:
+            raise HTTPException(status_code=404, detail="Blob not found")
+        headers = {
+            'Cache-Control': 'public, max-age=31536000, immutable',
+            'ETag': f'"{key}"'
+        }
+        if request.headers.get('if-none-match') == headers['ETag']:
+            return Response(status_code=304, headers=headers)
+        data, mime_type = blob
+        return Response(content=data, media_type=mime_type, headers=headers)
+
+    @application.app.get(
+        _prefix_path(f"/{DOWNLOAD_PATH}" + "{token}", prefix),
+        include_in_schema=False
+    )
+    def get_download(token: str, request: Request):
+        download = download_store.get(token)
+        if download is None or download.consumed:
+            raise HTTPException(status_code=404, detail="Download not found or expired")
+        headers = {
+            'Content-Disposition': content_disposition(download.filename),
+            'Cache-Control': 'no-store'
+        }
+        size = download.size
+        start, end, status = 0, size, 200
+        if size is not None:
+            headers['Accept-Ranges'] = 'bytes'
+            request_range = request.headers.get('range')
+            byte_range = parse_range(request_range, size) if request_range else (0, size)
+            if byte_range is None:
+                headers['Content-Range'] = f'bytes */{size}'
+                return Response(status_code=416, headers=headers)
+            start, end = byte_range
+            if request_range:
+                status = 206
+                headers['Content-Range'] = f'bytes {start}-{end-1}/{size}'
+            headers['Content-Length'] = str(end - start)
+        return StreamingResponse(
+            download.iter_chunks(start, end), status_code=status,
+            media_type=download.mime_type, headers=headers
+        )
+    blob_store.serving = download_store.serving = True
+
     return application
 
 
@@ -400,6 +475,11 @@ def get_server(
       Whether to add a liveness endpoint. If a string is provided
       then this will be used as the endpoint, otherwise the endpoint
       will be hosted at /liveness.
+    metrics: bool | str (optional, default=False)
+      Whether to add an endpoint serving metrics of the server in the
+      Prometheus text format. If a string is provided then this will
+      be used as the endpoint, otherwise the endpoint will be hosted
+      at /metrics.
     session_history: int (optional, default=None)
       The amount of session history to accumulate. If set to non-zero
       and non-None value will launch a REST endpoint at
@@ -478,6 +558,7 @@ def serve(
     admin: bool = False,
     session_history: int | None = None,
     liveness: bool | str = False,
+    metrics: bool | str = False,
     **kwargs
 ) -> StoppableThread | Server:
     """
@@ -526,6 +607,11 @@ def serve(
       Whether to add a liveness endpoint. If a string is provided
       then this will be used as the endpoint, otherwise the endpoint
       will be hosted at /liveness.
+    metrics: bool | str (optional, default=False)
+      Whether to add an endpoint serving metrics of the server in the
+      Prometheus text format. If a string is provided then this will
+      be used as the endpoint, otherwise the endpoint will be hosted
+      at /metrics.
     session_history: int (optional, default=None)
       The amount of session history to accumulate. If set to non-zero
       and non-None value will launch a REST endpoint at
@@ -540,7 +626,7 @@ def serve(
         port=port, address=address, websocket_origin=websocket_origin,
         loop=loop, show=show, start=start, title=title,
         location=location, admin=admin, liveness=liveness,
-        session_history=session_history
+        metrics=metrics, session_history=session_history
     ))
     if threaded:
         # To ensure that we have correspondence between state._threads and state._servers
@@ -1,6 +1,7 @@
 from tornado import web
 
 from .document import _cleanup_doc
+from .state import state
 
 
 class LivenessHandler(web.RequestHandler):
@@ -14,7 +15,17 @@ class LivenessHandler(web.RequestHandler):
         if endpoint is not None and endpoint not in self.applications:
             raise web.HTTPError(400, f"Endpoint {endpoint!r} does not exist.")
         elif endpoint is None:
-            self.write({self.request.path: True})
+            response = {self.request.path: True}
+            monitor = state._load_monitors.get(self.application)
+            if monitor is not None:
+                # Report the load, so a load balancer can route around
+                # servers which refuse new sessions (see ?ready)
+                overloaded = monitor.overloaded(self.application)
+                response['ready'] = overloaded is None
+                response['load'] = monitor.signals(self.application)
+                if overloaded and self.get_argument("ready", default=None) is not None:
+                    self.set_status(503)
+            self.write(response)
             return
 
         app = self.applications[endpoint]
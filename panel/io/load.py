@@ -0,0 +1,276 @@
+"""
+Monitors the load of a server process, so that new sessions can be
+refused while the process is saturated and load balancers can route
+requests to other processes, and records the callbacks which block
+the event loop.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+import typing as t
+
+from collections import deque
+
+from ..config import config
+from ..util import function_name
+from .logging import LOG_SLOW_CALLBACK
+from .state import state
+
+if t.TYPE_CHECKING:
+    import asyncio
+
+    from types import FrameType
+
+    from bokeh.server.tornado import BokehTornado
+
+log = logging.getLogger('panel.io.load')
+
+# The interval (in seconds) at which the event loop lag is sampled
+LAG_INTERVAL = 0.5
+
+# The number of samples the reported event loop lag is the maximum of
+LAG_SAMPLES = 10
+
+# Packages whose frames are skipped when determining the callback
+# which blocked the event loop from the stack
+LIBRARY_MODULES = (
+    'asyncio', 'bokeh', 'concurrent', 'contextlib', 'functools', 'panel',
+    'param', 'threading', 'tornado'
+)
+
+# The number of seconds clients are asked to wait before retrying
+# a request which was refused because the server is overloaded
+RETRY_AFTER = 5
+
+
+def memory_usage() -> float | None:
+    """
+    Returns the resident set size of the process in MB, if it can be
+    determined.
+    """
+    try:
+        import psutil
+    except ImportError:
+        pass
+    else:
+        return psutil.Process(os.getpid()).memory_info().rss / 1024**2
+    if sys.platform.startswith('linux'):
+        try:
+            with open('/proc/self/statm') as f:
+                pages = int(f.read().split()[1])
+        except (OSError, ValueError, IndexError):
+            return None
+        return pages * os.sysconf('SC_PAGE_SIZE') / 1024**2
+    return None
+
+
+class LoadMonitor:
+    """
+    Samples the lag of an event loop, i.e. the delay with which
+    callbacks scheduled on the loop are run, and reports it along with
+    the other load signals of the server the loop belongs to.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+        self._lags: deque[float] = deque(maxlen=LAG_SAMPLES)
+        self._handle: asyncio.TimerHandle | None = None
+        self._watchdog: LoopWatchdog | None = None
+
+    @property
+    def lag(self) -> float:
+        """
+        The maximum lag of the event loop (in seconds) over the recent
+        samples.
+        """
+        return max(self._lags, default=0)
+
+    def start(self) -> None:
+        if self._handle is None:
+            self._schedule()
+        if config.slow_callback_threshold is not None and self._watchdog is None:
+            self._watchdog = LoopWatchdog(self._loop, config.slow_callback_threshold)
+            self._watchdog.start()
+
+    def stop(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._watchdog is not None:
+            self._watchdog.stop()
+            self._watchdog = None
+        self._lags.clear()
+
+    def _schedule(self) -> None:
+        expected = self._loop.time() + LAG_INTERVAL
+        self._handle = self._loop.call_later(LAG_INTERVAL, self._sample, expected)
+
+    def _sample(self, expected: float) -> None:
+        self._lags.append(max(self._loop.time() - expected, 0))
+        self._schedule()
+
+    def signals(self, tornado: BokehTornado) -> dict[str, float | int | None]:
+        """
+        Returns the load signals of the server, i.e. the number of
+        live sessions (excluding unclaimed pooled sessions), the event
+        loop lag (in seconds), the number of tasks waiting for a thread
+        and the memory usage (in MB).
+        """
+        sessions = 0
+        for context in tornado._applications.values():
+            session_pool = state._session_pools.get(context)
+            sessions += len(context.sessions) - (session_pool.pooled if session_pool else 0)
+        pool = state._thread_pool
+        return {
+            'sessions': sessions,
+            'loop_lag': round(self.lag, 4),
+            'thread_queue': pool._work_queue.qsize() if pool is not None else 0,
+            'memory': memory_usage(),
+        }
+
+    def overloaded(self, tornado: BokehTornado) -> str | None:
+        """
+        Returns a description of the first configured limit the server
+        exceeds, if any.
+        """
+        limits = {
+            'sessions': config.max_sessions,
+            'loop_lag': config.max_loop_lag,
+            'thread_queue': config.max_thread_queue,
+            'memory': config.max_memory,
+        }
+        if all(limit is None for limit in limits.values()):
+            return None
+        signals = self.signals(tornado)
+        for signal, limit in limits.items():
+            value = signals[signal]
+            if limit is not None and value is not None and value >= limit:
+                return f'{signal} {value} exceeds the limit of {limit}'
+        return None
+
+
+def _describe_stack(frame: FrameType) -> dict[str, t.Any]:
+    """
+    Determines the session, component and callback a stack of the
+    event loop thread belongs to.
+    """
+    from bokeh.document import Document
+    from param.parameterized import Watcher
+
+    from ..reactive import Syncable
+    from .callbacks import PeriodicCallback
+
+    doc = component = callback = entry = None
+    current: FrameType | None = frame
+    while current is not None:
+        # Frames are walked from the innermost to the outermost, so the
+        # callback is the innermost one dispatched while the document
+        # and component are the outermost ones being processed
+        local = current.f_locals
+        obj = local.get('self')
+        if callback is None:
+            watcher = local.get('watcher')
+            if isinstance(watcher, Watcher):
+                callback = function_name(watcher.fn)
+            elif isinstance(obj, PeriodicCallback):
+                callback = function_name(obj.callback)
+        if isinstance(obj, Syncable):
+            component = f'{type(obj).__name__}(name={obj.name!r})'
+        if isinstance(local.get('doc'), Document):
+            doc = local['doc']
+        elif isinstance(obj, PeriodicCallback) and obj._doc:
+            doc = obj._doc
+        module = current.f_globals.get('__name__', '')
+        if module.split('.')[0] not in LIBRARY_MODULES:
+            entry = getattr(current.f_code, 'co_qualname', current.f_code.co_name)
+        current = current.f_back
+    return {
+        'session': None if doc is None else id(doc),
+        'component': component,
+        'callback': callback or entry,
+        'stack': ''.join(traceback.format_list(traceback.extract_stack(frame)))
+    }
+
+
+class LoopWatchdog:
+    """
+    Watches an event loop from a separate thread and records the
+    callbacks which block it for longer than a threshold, along with
+    the session and component they belong to and a snapshot of the
+    stack taken while the loop was blocked.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, threshold: float):
+        self.threshold = threshold
+        self._loop = loop
+        self._loop_thread: int | None = None
+        self._thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        """
+        Starts watching the event loop, must be called from the thread
+        running the loop.
+        """
+        if self._thread is not None:
+            return
+        self._loop_thread = threading.get_ident()
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._watch, name='panel-loop-watchdog', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread = None
+
+    def _watch(self) -> None:
+        interval = min(self.threshold, LAG_INTERVAL)
+        while not self._stopped.wait(interval):
+            beat = threading.Event()
+            started = time.monotonic()
+            try:
+                self._loop.call_soon_threadsafe(beat.set)
+            except RuntimeError:
+                # The loop was closed
+                return
+            if beat.wait(self.threshold):
+                continue
+            frame = sys._current_frames().get(self._loop_thread)  # type: ignore[arg-type]
+            if frame is None:
+                continue
+            try:
+                stall = _describe_stack(frame)
+            except Exception as e:
+                log.debug('Could not describe the blocked event loop: %s', e)
+                continue
+            finally:
+                del frame
+            while not beat.wait(interval):
+                if self._stopped.is_set():
+                    return
+            duration = time.monotonic() - started
+            stall.update(time=time.time() - duration, duration=duration)
+            try:
+                self._loop.call_soon_threadsafe(self._report, stall)
+            except RuntimeError:
+                return
+
+    def _report(self, stall: dict[str, t.Any]) -> None:
+        # Reported on the event loop, since log handlers (e.g. of the
+        # admin panel) may update documents
+        state._slow_callbacks.append(stall)
+        description = stall['callback'] or 'unknown callback'
+        if stall['component']:
+            description = f'{description} of {stall["component"]}'
+        if stall['session'] is None:
+            log.warning('Event loop blocked for %.3fs in %s', stall['duration'], description)
+        else:
+            log.warning(LOG_SLOW_CALLBACK, stall['session'], stall['duration'], description)
+        log.debug('Event loop blocked at:\n%s', stall['stack'])
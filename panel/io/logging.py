@@ -10,6 +10,7 @@ LOG_SESSION_CREATED = 'Session %s created'
 LOG_SESSION_DESTROYED = 'Session %s destroyed'
 LOG_SESSION_LAUNCHING = 'Session %s launching'
 LOG_SESSION_RENDERED = 'Session %s rendered'
+LOG_SLOW_CALLBACK = 'Session %s blocked the event loop for %.3fs in %s'
 
 # Set up logger
 panel_logger = logging.getLogger('panel')
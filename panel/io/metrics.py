@@ -0,0 +1,345 @@
+"""
+Collects metrics of a Panel server process, which may be scraped from
+the metrics endpoint in the Prometheus text exposition format.
+
+The instrumentation is disabled until a metrics endpoint is added, once
+enabled recording a sample only increments a few numbers, while the
+gauges (e.g. the number of live sessions) are only computed when the
+endpoint is requested.
+"""
+from __future__ import annotations
+
+import gc
+import threading
+import time
+import typing as t
+
+from bisect import bisect_left
+from collections import deque
+from weakref import WeakKeyDictionary
+
+from tornado import web
+
+if t.TYPE_CHECKING:
+    from bokeh.document import Document
+    from bokeh.server.contexts import ApplicationContext
+
+    from .load import LoadMonitor
+
+# The upper bounds (in seconds) of the buckets of duration histograms
+DURATION_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30
+)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+LabelValues: t.TypeAlias = tuple[str, ...]
+
+
+def _format_labels(names: tuple[str, ...], values: LabelValues, **extra: str) -> str:
+    labels = [*zip(names, values), *extra.items()]
+    if not labels:
+        return ''
+    escaped = (
+        (name, str(value).replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"'))
+        for name, value in labels
+    )
+    return '{' + ','.join(f'{name}="{value}"' for name, value in escaped) + '}'
+
+
+def _app_label(doc: Document | None) -> str:
+    """
+    Returns the URL of the application the document was created by.
+    """
+    session_context = doc.session_context if doc is not None else None
+    try:
+        return session_context.server_context.application_context.url  # type: ignore
+    except AttributeError:
+        return ''
+
+
+class Metric:
+    """
+    Base class for a metric with a set of labels.
+    """
+
+    kind: t.ClassVar[str]
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self._lock = threading.Lock()
+
+    def expose(self) -> list[str]:
+        return [
+            f'# HELP {self.name} {self.documentation}',
+            f'# TYPE {self.name} {self.kind}',
+            *self._samples()
+        ]
+
+    def _samples(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """
+    A monotonically increasing count.
+    """
+
+    kind = 'counter'
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, value: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + value
+
+    def _samples(self) -> list[str]:
+        return [
+            f'{self.name}{_format_labels(self.labels, labels)} {value}'
+            for labels, value in list(self._values.items())
+        ]
+
+
+class Gauge(Counter):
+    """
+    A value which may go up and down.
+    """
+
+    kind = 'gauge'
+
+    def set(self, value: float, *labels: str) -> None:
+        self._values[labels] = value
+
+
+class Histogram(Metric):
+    """
+    Counts observations (e.g. durations) in configurable buckets and
+    records their sum.
+    """
+
+    kind = 'histogram'
+
+    def __init__(
+        self, name: str, documentation: str, labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DURATION_BUCKETS
+    ):
+        super().__init__(name, documentation, labels)
+        self.buckets = buckets
+        self._counts: dict[LabelValues, list[int]] = {}
+        self._sums: dict[LabelValues, float] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        with self._lock:
+            if labels not in self._counts:
+                self._counts[labels] = [0] * (len(self.buckets) + 1)
+                self._sums[labels] = 0
+            self._counts[labels][bisect_left(self.buckets, value)] += 1
+            self._sums[labels] += value
+
+    def _samples(self) -> list[str]:
+        samples = []
+        with self._lock:
+            observed = [(labels, list(counts), self._sums[labels]) for labels, counts in self._counts.items()]
+        for labels, counts, total in observed:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, '+Inf'), counts):
+                cumulative += count
+                samples.append(
+                    f'{self.name}_bucket{_format_labels(self.labels, labels, le=str(bound))} {cumulative}'
+                )
+            samples.append(f'{self.name}_sum{_format_labels(self.labels, labels)} {total}')
+            samples.append(f'{self.name}_count{_format_labels(self.labels, labels)} {cumulative}')
+        return samples
+
+
+class Metrics:
+    """
+    The metrics recorded by the instrumentation of a Panel server
+    process.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.sessions_created = Counter(
+            'panel_sessions_created_total', 'Sessions created.', ('app',)
+        )
+        self.sessions_destroyed = Counter(
+            'panel_sessions_destroyed_total', 'Sessions destroyed.', ('app',)
+        )
+        self.session_render = Histogram(
+            'panel_session_render_seconds',
+            'Time from the creation of a session until it was first rendered.', ('app',)
+        )
+        self.callback_duration = Histogram(
+            'panel_callback_duration_seconds',
+            'Duration of the callbacks processing the events of a session.', ('app',)
+        )
+        self.messages = Counter(
+            'panel_patch_messages_total',
+            'PATCH-DOC messages written to the websocket connections.', ('app',)
+        )
+        self.message_bytes = Counter(
+            'panel_patch_message_bytes_total',
+            'Bytes of the PATCH-DOC messages written to the websocket connections.', ('app',)
+        )
+        self.gc_duration = Histogram(
+            'panel_gc_duration_seconds', 'Duration of the garbage collection pauses.',
+            ('generation',)
+        )
+        self._created: WeakKeyDictionary[Document, float] = WeakKeyDictionary()
+        self._gc_start: float | None = None
+        self._gc_pauses: deque[tuple[float, str]] = deque(maxlen=10000)
+
+    def enable(self) -> None:
+        """
+        Enables the instrumentation.
+        """
+        if self.enabled:
+            return
+        self.enabled = True
+        gc.callbacks.append(self._gc_callback)
+
+    def disable(self) -> None:
+        if not self.enabled:
+            return
+        self.enabled = False
+        gc.callbacks.remove(self._gc_callback)
+
+    def _gc_callback(self, phase: str, info: dict[str, int]) -> None:
+        # A collection may be triggered while a metric is locked, so
+        # the pauses are only observed when the metrics are exposed
+        if phase == 'start':
+            self._gc_start = time.perf_counter()
+        elif self._gc_start is not None:
+            self._gc_pauses.append((time.perf_counter() - self._gc_start, str(info['generation'])))
+            self._gc_start = None
+
+    #----------------------------------------------------------------
+    # Instrumentation
+    #----------------------------------------------------------------
+
+    def session_created(self, doc: Document) -> None:
+        self._created[doc] = time.monotonic()
+        self.sessions_created.inc(_app_label(doc))
+
+    def session_claimed(self, doc: Document) -> None:
+        self._created[doc] = time.monotonic()
+
+    def session_rendered(self, doc: Document) -> None:
+        created = self._created.pop(doc, None)
+        if created is not None:
+            self.session_render.observe(time.monotonic() - created, _app_label(doc))
+
+    def session_destroyed(self, doc: Document) -> None:
+        self._created.pop(doc, None)
+        self.sessions_destroyed.inc(_app_label(doc))
+
+    def callback_finished(self, doc: Document | None, duration: float) -> None:
+        self.callback_duration.observe(duration, _app_label(doc))
+
+    def message_written(self, doc: Document | None, nbytes: int, connections: int) -> None:
+        app = _app_label(doc)
+        self.messages.inc(app, value=connections)
+        self.message_bytes.inc(app, value=nbytes * connections)
+
+    #----------------------------------------------------------------
+    # Exposition
+    #----------------------------------------------------------------
+
+    def _collect(
+        self, applications: dict[str, ApplicationContext], monitor: LoadMonitor | None
+    ) -> list[Metric]:
+        from .cache import _RENDER_CACHE
+        from .document import _WRITE_EVENTS, _WRITE_FUTURES
+        from .load import memory_usage
+        from .state import state
+
+        while self._gc_pauses:
+            self.gc_duration.observe(*self._gc_pauses.popleft())
+
+        live = Gauge('panel_sessions_live', 'Live sessions (including pooled sessions).', ('app',))
+        pool_hits = Counter('panel_session_pool_hits_total', 'Requests served by a pooled session.', ('app',))
+        pool_misses = Counter('panel_session_pool_misses_total', 'Requests not served by a pooled session.', ('app',))
+        for context in applications.values():
+            live.set(len(context.sessions), context.url)
+            pool = state._session_pools.get(context)
+            if pool is not None:
+                pool_hits.inc(context.url, value=pool.hits)
+                pool_misses.inc(context.url, value=pool.misses)
+
+        queued = Gauge('panel_write_queue_batches', 'Batches of events waiting to be written to a websocket.')
+        queued.set(sum(len(batches) for batches in list(_WRITE_EVENTS.values())))
+        pending = Gauge('panel_write_pending', 'Websocket writes which have not completed.')
+        pending.set(sum(len(futures) for futures in list(_WRITE_FUTURES.values())))
+
+        workers = Gauge('panel_thread_pool_workers', 'Threads in the thread pool.')
+        busy = Gauge('panel_thread_pool_busy', 'Threads in the thread pool running a task.')
+        waiting = Gauge('panel_thread_pool_queue', 'Tasks waiting for a thread of the thread pool.')
+        executor = state._thread_pool
+        if executor is not None:
+            threads = len(executor._threads)
+            workers.set(executor._max_workers)
+            busy.set(max(threads - executor._idle_semaphore._value, 0))
+            waiting.set(executor._work_queue.qsize())
+
+        stats = _RENDER_CACHE.stats()
+        cache_hits = Counter('panel_render_cache_hits_total', 'Lookups of the render cache which were hits.')
+        cache_hits.inc(value=stats['hits'])
+        cache_misses = Counter('panel_render_cache_misses_total', 'Lookups of the render cache which were misses.')
+        cache_misses.inc(value=stats['misses'])
+        cache_bytes = Gauge('panel_render_cache_bytes', 'Size of the entries in the render cache.')
+        cache_bytes.set(stats['nbytes'])
+
+        memory = Gauge('panel_memory_bytes', 'Resident set size of the process.')
+        rss = memory_usage()
+        if rss is not None:
+            memory.set(round(rss * 1024**2))
+        lag = Gauge('panel_event_loop_lag_seconds', 'Maximum lag of the event loop over the recent samples.')
+        if monitor is not None:
+            lag.set(round(monitor.lag, 6))
+
+        return [
+            self.sessions_created, self.sessions_destroyed, live, self.session_render,
+            pool_hits, pool_misses, self.callback_duration, self.messages,
+            self.message_bytes, queued, pending, workers, busy, waiting,
+            cache_hits, cache_misses, cache_bytes, self.gc_duration, memory, lag
+        ]
+
+    def expose(
+        self, applications: dict[str, ApplicationContext], monitor: LoadMonitor | None = None
+    ) -> str:
+        """
+        Renders the metrics in the Prometheus text exposition format.
+
+        Arguments
+        ---------
+        applications: dict[str, ApplicationContext]
+            The contexts of the applications served by the server.
+        monitor: LoadMonitor | None
+            The load monitor of the server, if any.
+        """
+        lines = []
+        for metric in self._collect(applications, monitor):
+            lines.extend(metric.expose())
+        return '\n'.join(lines) + '\n'
+
+
+_METRICS = Metrics()
+
+
+class MetricsHandler(web.RequestHandler):
+    """
+    Serves the metrics of the server process in the Prometheus text
+    exposition format.
+    """
+
+    def get(self):
+        from .state import state
+        self.set_header('Content-Type', CONTENT_TYPE)
+        self.write(_METRICS.expose(
+            self.application._applications, state._load_monitors.get(self.application)
+        ))
@@ -0,0 +1,313 @@
+"""
+Offloads CPU-bound functions to a pool of worker processes, so that
+callbacks which do not release the GIL do not block the event loop and
+the callbacks of all other sessions served by the same process.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import importlib
+import pickle
+import sys
+import threading
+import typing as t
+
+from collections import OrderedDict
+from functools import partial, wraps
+from weakref import WeakKeyDictionary, ref
+
+from ..config import config
+from .state import state
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
+    from concurrent.futures import Future, ProcessPoolExecutor
+
+    from bokeh.document import Document
+
+    _P = t.ParamSpec("_P")
+    _R = t.TypeVar("_R")
+
+# The number of unpickled functions each worker process keeps around
+MAX_FUNCTIONS = 32
+
+# Arrays of at least this size are transferred via shared memory
+SHARED_MEMORY_THRESHOLD = 1_048_576
+
+_POOL: ProcessPoolExecutor | None = None
+
+_POOL_LOCK = threading.Lock()
+
+# Futures awaiting the tasks submitted on behalf of a Document
+_FUTURES: WeakKeyDictionary[Document, set[asyncio.Future]] = WeakKeyDictionary()
+
+# Functions unpickled by a worker process, keyed by the digest of their
+# pickled bytes and ordered from least to most recently used
+_FUNCTIONS: OrderedDict[bytes, Callable[..., t.Any]] = OrderedDict()
+
+
+class _SharedArray(t.NamedTuple):
+    """
+    Reference to a NumPy array held in a shared memory block.
+    """
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+def _is_shareable(obj: t.Any) -> bool:
+    if 'numpy' not in sys.modules:
+        return False
+    import numpy as np
+    return (
+        isinstance(obj, np.ndarray) and obj.dtype.kind not in 'OV' and
+        obj.nbytes >= SHARED_MEMORY_THRESHOLD
+    )
+
+
+def _share(obj: t.Any, blocks: list) -> t.Any:
+    """
+    Copies large arrays (including those directly contained in a tuple,
+    list or dict) into shared memory blocks, replacing them with
+    references to the blocks.
+    """
+    if type(obj) in (tuple, list):
+        return type(obj)(_share(o, blocks) for o in obj)
+    elif type(obj) is dict:
+        return {k: _share(v, blocks) for k, v in obj.items()}
+    elif not _is_shareable(obj):
+        return obj
+    from multiprocessing.shared_memory import SharedMemory
+
+    import numpy as np
+    shm = SharedMemory(create=True, size=obj.nbytes)
+    blocks.append(shm)
+    np.ndarray(obj.shape, dtype=obj.dtype, buffer=shm.buf)[...] = obj
+    return _SharedArray(shm.name, obj.shape, obj.dtype.str)
+
+
+def _unshare(obj: t.Any, blocks: list, copy: bool = False) -> t.Any:
+    """
+    Replaces references to shared memory blocks with arrays, which are
+    views of the blocks unless a copy is requested.
+    """
+    if isinstance(obj, _SharedArray):
+        from multiprocessing.shared_memory import SharedMemory
+
+        import numpy as np
+        shm = SharedMemory(name=obj.name)
+        blocks.append(shm)
+        array = np.ndarray(obj.shape, dtype=np.dtype(obj.dtype), buffer=shm.buf)
+        return array.copy() if copy else array
+    elif type(obj) in (tuple, list):
+        return type(obj)(_unshare(o, blocks, copy) for o in obj)
+    elif type(obj) is dict:
+        return {k: _unshare(v, blocks, copy) for k, v in obj.items()}
+    return obj
+
+
+def _release(blocks: list, unlink: bool = False) -> None:
+    for shm in blocks:
+        try:
+            shm.close()
+        except BufferError:
+            # Views of the block are still alive, the mapping is
+            # released once they are garbage collected
+            pass
+        if unlink:
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+    blocks.clear()
+
+
+def _dumps_function(func: Callable[..., t.Any]) -> bytes:
+    # Functions defined in served scripts cannot be imported by the
+    # workers and are therefore pickled by value if possible
+    try:
+        import cloudpickle
+    except ImportError:
+        pass
+    else:
+        return cloudpickle.dumps(func)
+    try:
+        return pickle.dumps(func)
+    except (pickle.PicklingError, AttributeError):
+        # Decorated functions are looked up by name and unwrapped
+        return pickle.dumps((func.__module__, func.__qualname__))
+
+
+def _loads_function(func_bytes: bytes) -> Callable[..., t.Any]:
+    func = pickle.loads(func_bytes)
+    if isinstance(func, tuple):
+        module, qualname = func
+        func = importlib.import_module(module)
+        for attr in qualname.split('.'):
+            func = getattr(func, attr)
+        func = getattr(func, '__wrapped__', func)
+    return func
+
+
+def _cached_function(func_bytes: bytes) -> Callable[..., t.Any]:
+    # Closures are pickled by value and may therefore produce
+    # different bytes on every call, so the cache is bounded
+    key = hashlib.sha256(func_bytes).digest()
+    func = _FUNCTIONS.get(key)
+    if func is None:
+        func = _FUNCTIONS[key] = _loads_function(func_bytes)
+        while len(_FUNCTIONS) > MAX_FUNCTIONS:
+            _FUNCTIONS.popitem(last=False)
+    else:
+        _FUNCTIONS.move_to_end(key)
+    return func
+
+
+def _run(func_bytes: bytes, args: tuple, kwargs: dict) -> t.Any:
+    """
+    Runs the function in a worker process.
+    """
+    func = _cached_function(func_bytes)
+    inputs: list = []
+    args, kwargs = _unshare((args, kwargs), inputs)
+    try:
+        result = func(*args, **kwargs)
+        outputs: list = []
+        try:
+            shared = _share(result, outputs)
+        finally:
+            # The blocks are unlinked by the parent process
+            _release(outputs)
+        return shared
+    finally:
+        del args, kwargs
+        _release(inputs)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _POOL
+    import multiprocessing
+
+    from concurrent.futures import ProcessPoolExecutor
+    with _POOL_LOCK:
+        if _POOL is None:
+            # Forking a process running an event loop and threads is not
+            # safe, so workers are always spawned
+            _POOL = ProcessPoolExecutor(
+                max_workers=config.offload_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return _POOL
+
+
+def _shutdown_pool() -> None:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.shutdown(wait=False, cancel_futures=True)
+        _POOL = None
+
+
+def _discard_result(future: Future) -> None:
+    if future.cancelled() or future.exception() is not None:
+        return
+    outputs: list = []
+    _unshare(future.result(), outputs)
+    _release(outputs, unlink=True)
+
+
+def _cancel_doc(doc_ref: ref[Document], session_context) -> None:
+    doc = doc_ref()
+    if doc is None:
+        return
+    for future in _FUTURES.pop(doc, set()):
+        future.get_loop().call_soon_threadsafe(future.cancel)
+
+
+def _track(future: asyncio.Future, doc: Document | None) -> None:
+    if doc is None:
+        return
+    if doc not in _FUTURES:
+        _FUTURES[doc] = set()
+        doc.on_session_destroyed(partial(_cancel_doc, ref(doc)))
+    futures = _FUTURES[doc]
+    futures.add(future)
+    future.add_done_callback(futures.discard)
+
+
+async def run_in_process(func: Callable[..., _R], *args: t.Any, **kwargs: t.Any) -> _R:
+    """
+    Runs the function with the supplied arguments in a worker process
+    and returns the result.
+
+    Large NumPy arrays passed as arguments or returned as the result
+    (including those directly contained in a tuple, list or dict) are
+    transferred via shared memory rather than being pickled. All other
+    arguments and the result must be picklable.
+
+    When the session a task was submitted from is destroyed, or the
+    coroutine awaiting it is cancelled, the task is cancelled if it
+    has not started yet and its result is discarded otherwise.
+
+    Arguments
+    ---------
+    func: Callable
+      The function to run, which must be picklable.
+    *args: any
+      Positional arguments to pass to the function.
+    **kwargs: any
+      Keyword arguments to pass to the function.
+
+    Returns
+    -------
+    The return value of the function.
+    """
+    from concurrent.futures.process import BrokenProcessPool
+    func_bytes = _dumps_function(func)
+    blocks: list = []
+    try:
+        shared_args, shared_kwargs = _share((args, kwargs), blocks)
+        try:
+            future = _get_pool().submit(_run, func_bytes, shared_args, shared_kwargs)
+        except BrokenProcessPool:
+            _shutdown_pool()
+            future = _get_pool().submit(_run, func_bytes, shared_args, shared_kwargs)
+        awaited = asyncio.wrap_future(future)
+        _track(awaited, state.curdoc)
+        try:
+            result = await awaited
+        except asyncio.CancelledError:
+            # Pending tasks are cancelled, the shared memory of the
+            # results of running tasks is released once they finish
+            future.add_done_callback(_discard_result)
+            raise
+        outputs: list = []
+        try:
+            return _unshare(result, outputs, copy=True)
+        finally:
+            _release(outputs, unlink=True)
+    finally:
+        _release(blocks, unlink=True)
+
+
+def offload(func: Callable[_P, _R]) -> Callable[_P, Coroutine[t.Any, t.Any, _R]]:
+    """
+    A decorator which runs the decorated function in a pool of worker
+    processes, turning it into a coroutine function, e.g. to avoid
+    blocking the server with CPU-bound callbacks:
+
+    >>> @pn.io.offload
+    ... def compute(data, n):
+    ...     return expensive(data, n)
+    >>> pn.bind(compute, data, slider)
+
+    The number of worker processes is controlled by
+    `config.offload_workers`. See `run_in_process` for details on how
+    arguments are transferred and how tasks are cancelled.
+    """
+    @wraps(func)
+    async def wrapped(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+        return await run_in_process(func, *args, **kwargs)
+    return wrapped
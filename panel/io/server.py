@@ -65,12 +65,18 @@ from ..config import config
 from ..util import HTML_SANITIZER, edit_readonly, fullpath
 from ..util.warnings import warn
 from .application import build_applications
+from .blobs import BLOB_PATH, blob_store
 from .document import (  # noqa
     _cleanup_doc, init_doc, unlocked, with_lock,
 )
+from .downloads import (
+    DOWNLOAD_PATH, content_disposition, download_store, parse_range,
+)
 from .liveness import LivenessHandler
+from .load import RETRY_AFTER, LoadMonitor
 from .loading import LOADING_INDICATOR_CSS_CLASS
 from .logging import LOG_SESSION_CREATED
+from .metrics import _METRICS, MetricsHandler
 from .reload import record_modules
 from .resources import (
     BASE_TEMPLATE, CDN_DIST, COMPONENT_PATH, DIST_DIR, ERROR_TEMPLATE,
@@ -426,16 +432,38 @@ class Server(BokehServer):
         # eligible Document initialization) through Panel's bounded thread
         # pool so --num-threads bounds it.
         state._install_thread_pool(self._loop.asyncio_loop)
+        state._load_monitors[self._tornado] = monitor = LoadMonitor(self._loop.asyncio_loop)
+        self._loop.add_callback(monitor.start)
         if state._admin_context:
             self._loop.add_callback(state._admin_context.run_load_hook)
+        if config.session_pool and not config.autoreload:
+            self._start_session_pools()
         if state._setup_module and state._setup_file_callback:
             self._loop.add_callback(state._setup_file_callback)
+        if state._deferred_tasks is not None:
+            deferred, state._deferred_tasks = state._deferred_tasks, None
+            for schedule in deferred:
+                self._loop.add_callback(schedule)
         if config.autoreload:
             from .reload import setup_autoreload_watcher
             self._autoreload_stop_event = stop_event = asyncio.Event()
             self._autoreload_task = self._loop.asyncio_loop.create_task(setup_autoreload_watcher(stop_event))
 
+    def _start_session_pools(self) -> None:
+        from .session_pool import SessionPool
+        for path, context in self._tornado._applications.items():
+            state._session_pools[context] = pool = SessionPool(
+                self._tornado, context, config.session_pool
+            )
+            if RootHandler._is_concrete_route(path):
+                self._loop.add_callback(pool.start, f'{self.prefix}{path}')
+
     def stop(self, wait: bool = True) -> None:
+        if self._tornado in state._load_monitors:
+            state._load_monitors.pop(self._tornado).stop()
+        for context in self._tornado._applications.values():
+            if context in state._session_pools:
+                state._session_pools.pop(context).stop()
         if self._autoreload_stop_event:
             # For the stop event to be processed we have to restart
             # the IOLoop briefly, ensuring an orderly cleanup
@@ -623,6 +651,34 @@ class DocHandler(LoginUrlMixin, BkDocHandler):
             logger.warning(auth_error)
         return authorized, auth_error
 
+    def _admit(self) -> bool:
+        """
+        Determine if the server has the capacity to serve a new session,
+        responding with a 503 error (or a waiting room page) otherwise.
+        """
+        monitor = state._load_monitors.get(self.application)
+        overloaded = monitor.overloaded(self.application) if monitor else None
+        if overloaded is None:
+            return True
+        logger.warning('Refusing new session to %s, %s.', self.request.path, overloaded)
+        self.set_status(503)
+        self.set_header('Retry-After', str(RETRY_AFTER))
+        if config.waiting_room:
+            page = ERROR_TEMPLATE.render(
+                npm_cdn=config.npm_cdn,
+                title='Panel: Server Busy',
+                error_type='Server Busy',
+                error='The server is currently at capacity.',
+                error_msg='You will be connected as soon as capacity becomes available.',
+                refresh=RETRY_AFTER
+            )
+            self.set_header("Content-Type", 'text/html')
+            self.write(page)
+        else:
+            self.set_header("Content-Type", 'text/plain')
+            self.write('Server is at capacity, retry later.')
+        return False
+
     def _render_auth_error(self, auth_error: str) -> str:
         if config.auth_template:
             with open(config.auth_template) as f:
@@ -652,6 +708,10 @@ class DocHandler(LoginUrlMixin, BkDocHandler):
             return
         _set_request_route_context(self, *args, **kwargs)
 
+        # Refuse new sessions while the server is overloaded
+        if not self._admit():
+            return
+
         # Run global authorization callback
         payload = self._generate_token_payload()
         if config.authorize_callback:
@@ -670,9 +730,11 @@ class DocHandler(LoginUrlMixin, BkDocHandler):
                 return
 
         app = self.application
+        pool = state._session_pools.get(self.application_context)
+        pooled = pool.claim(self, payload) if pool else None
         key_func = state._session_key_funcs.get(self.request.path, lambda r: r.path)
-        old_request = key_func(self.request) in state._sessions
-        session = await self.get_session()
+        old_request = pooled is None and key_func(self.request) in state._sessions
+        session = pooled or await self.get_session()
         if old_request and state._sessions.get(key_func(self.request)) is session:
             session_id = generate_session_id(
                 secret_key=self.application.secret_key,
@@ -717,6 +779,8 @@ class DocHandler(LoginUrlMixin, BkDocHandler):
 
         self.set_header("Content-Type", 'text/html')
         self.write(page)
+        if pool:
+            pool.fill(session)
 
 # Patch Bokeh Autoload handler
 class AutoloadJsHandler(BkAutoloadJsHandler):
@@ -1028,6 +1092,80 @@ class ComponentResourceHandler(StaticFileHandler):
         return absolute_path
 
 
+class BlobHandler(AuthenticatedStaticFileHandler):
+    """
+    A handler that serves the blobs registered with the blob store,
+    e.g. the contents of image and media panes. Blobs are addressed by
+    the hash of their contents and may therefore be cached indefinitely.
+
+    /<endpoint>/<key>
+    """
+
+    def initialize(self):
+        pass
+
+    @authenticated
+    async def get(self, key: str, include_body: bool = True):
+        blob = blob_store.get(key)
+        if blob is None:
+            raise HTTPError(404, 'Blob not found')
+        data, mime_type = blob
+        self.set_header('Content-Type', mime_type)
+        self.set_header('Cache-Control', 'public, max-age=31536000, immutable')
+        self.set_header('ETag', f'"{key}"')
+        if self.check_etag_header():
+            self.set_status(304)
+            return
+        if include_body:
+            self.write(data)
+
+
+class DownloadHandler(AuthenticatedStaticFileHandler):
+    """
+    A handler that streams the downloads registered with the download
+    store, e.g. the files of FileDownload widgets, in chunks. Downloads
+    of known size are sent with a Content-Length and support range
+    requests, all other downloads use chunked transfer encoding.
+
+    /<endpoint>/<token>
+    """
+
+    def initialize(self):
+        pass
+
+    @authenticated
+    async def get(self, token: str, include_body: bool = True):
+        download = download_store.get(token)
+        if download is None or download.consumed:
+            raise HTTPError(404, 'Download not found or expired')
+        self.set_header('Content-Type', download.mime_type)
+        self.set_header('Content-Disposition', content_disposition(download.filename))
+        self.set_header('Cache-Control', 'no-store')
+        size = download.size
+        start, end = 0, size
+        if size is not None:
+            self.set_header('Accept-Ranges', 'bytes')
+            request_range = self.request.headers.get('Range')
+            byte_range = parse_range(request_range, size) if request_range else (0, size)
+            if byte_range is None:
+                self.set_status(416)
+                self.set_header('Content-Range', f'bytes */{size}')
+                return
+            start, end = byte_range
+            if request_range:
+                self.set_status(206)
+                self.set_header('Content-Range', f'bytes {start}-{end-1}/{size}')
+            self.set_header('Content-Length', end - start)
+        if not include_body:
+            return
+        for chunk in download.iter_chunks(start, end):
+            self.write(chunk)
+            await self.flush()
+
+    async def head(self, token: str):
+        await self.get(token, include_body=False)
+
+
 def serve(
     panels: TViewableFuncOrPath | dict[str, TViewableFuncOrPath],
     port: int = 0,
@@ -1152,6 +1290,9 @@ def get_static_routes(static_dirs):
     patterns.append((
         f'/{COMPONENT_PATH}(.*)', ComponentResourceHandler, {}
     ))
+    patterns.append((f'/{BLOB_PATH}([0-9a-f]+)', BlobHandler, {}))
+    patterns.append((f'/{DOWNLOAD_PATH}([A-Za-z0-9_-]+)', DownloadHandler, {}))
+    blob_store.serving = download_store.serving = True
     return patterns
 
 def get_server(
@@ -1188,6 +1329,7 @@ def get_server(
     logout_template: str | None = None,
     session_history: str | None = None,
     liveness: bool | str = False,
+    metrics: bool | str = False,
     warm: bool = False,
     **kwargs
 ) -> Server:
@@ -1282,6 +1424,11 @@ def get_server(
       Whether to add a liveness endpoint. If a string is provided
       then this will be used as the endpoint, otherwise the endpoint
       will be hosted at /liveness.
+    metrics: bool | str (optional, default=False)
+      Whether to add an endpoint serving metrics of the server in the
+      Prometheus text format. If a string is provided then this will
+      be used as the endpoint, otherwise the endpoint will be hosted
+      at /metrics.
     warm: bool (optional, default=False)
       Whether to run the applications before serving them to ensure
       all imports and caches are fully warmed up before serving the app.
@@ -1358,12 +1505,21 @@ def get_server(
         liveness_endpoint = 'liveness' if isinstance(liveness, bool) else liveness
         extra_patterns += [(rf"/{liveness_endpoint}", LivenessHandler, dict(applications=apps))]
 
+    if metrics:
+        _METRICS.enable()
+        metrics_endpoint = 'metrics' if isinstance(metrics, bool) else metrics.strip('/')
+        extra_patterns += [(rf"/{metrics_endpoint}", MetricsHandler)]
+
     opts = dict(kwargs)
     if loop:
         asyncio.set_event_loop(loop.asyncio_loop)
         opts['io_loop'] = loop
     elif opts.get('num_procs', 1) == 1:
         opts['io_loop'] = IOLoop.current()
+    if opts.get('num_procs', 1) != 1:
+        # Blobs and downloads are held in memory by the process that
+        # registered them, while requests may be handled by any process
+        blob_store.serving = download_store.serving = False
 
     if 'index' not in opts:
         opts['index'] = INDEX_HTML
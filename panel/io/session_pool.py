@@ -0,0 +1,285 @@
+"""
+A pool of sessions created ahead of time, so that requests to an
+application can be served by a fully initialized session instead of
+waiting for the application to be executed.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import typing as t
+
+from collections import OrderedDict
+
+from bokeh.server.session import current_time
+from bokeh.util.token import generate_jwt_token, generate_session_id
+from tornado.httputil import HTTPHeaders, HTTPServerRequest
+
+from ..config import config
+from .metrics import _METRICS
+
+if t.TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from bokeh.server.contexts import ApplicationContext
+    from bokeh.server.session import ServerSession
+    from bokeh.server.tornado import BokehTornado
+    from tornado.web import RequestHandler
+
+    from .server import TokenPayload
+
+log = logging.getLogger('panel.io.session_pool')
+
+# The number of seconds the pool waits for the sessions it served to
+# be connected to before creating new sessions
+CONNECT_TIMEOUT = 5
+
+
+def _template_request(request: HTTPServerRequest, private: bool = False) -> HTTPServerRequest:
+    """
+    Copies the request line of a request, so that it may be used to
+    create sessions without holding on to its connection. Unless the
+    sessions are private to the user of the request its headers
+    (including the cookies) are omitted, since they may identify the
+    client which made the request.
+    """
+    headers = HTTPHeaders(request.headers) if private else HTTPHeaders()
+    copy = HTTPServerRequest(
+        method=request.method, uri=request.uri, version=request.version,
+        headers=headers, host=request.host
+    )
+    for attr in ('route_params', 'app_path'):
+        if hasattr(request, attr):
+            setattr(copy, attr, getattr(request, attr))
+    return copy
+
+
+class SessionPool:
+    """
+    Holds sessions of an application which are created in the
+    background before they are requested.
+
+    Since an application may render differently depending on the
+    request, the pooled sessions are grouped by a key, which is
+    derived from the request path, the `config.session_key_func` (or
+    the query arguments if no function is defined) and the user. A
+    request is only served by a pooled session created for the same
+    key. The first request with a new key is therefore served by a
+    newly created session, after which sessions for the key are
+    pooled, using the request as a template.
+
+    The user is only part of the key if a Panel auth provider is
+    configured. Otherwise the template omits the headers and cookies
+    of the request, so that the pooled sessions never run with those
+    of another client, and they only become available to the session
+    once it has been claimed.
+
+    A claimed session is re-keyed to the claiming request, i.e. its
+    token and request are replaced with those of the claiming request.
+    """
+
+    # The maximum number of keys sessions are pooled for, the sessions
+    # of the least recently requested key are released when exceeded
+    max_keys: t.ClassVar[int] = 16
+
+    def __init__(self, tornado: BokehTornado, context: ApplicationContext, size: int):
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._tornado = tornado
+        self._context = context
+        self._sessions: OrderedDict[Hashable, list[ServerSession]] = OrderedDict()
+        self._templates: dict[Hashable, tuple[HTTPServerRequest, TokenPayload]] = {}
+        self._served: list[tuple[ServerSession, float]] = []
+        self._task: asyncio.Task | None = None
+
+    @property
+    def hit_rate(self) -> float | None:
+        """
+        The fraction of requests served by a pooled session.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else None
+
+    @property
+    def pooled(self) -> int:
+        """
+        The number of pooled sessions which have not been claimed.
+        """
+        return sum(
+            not session.destroyed for sessions in self._sessions.values()
+            for session in sessions
+        )
+
+    @property
+    def _authenticated(self) -> bool:
+        provider = self._tornado.auth_provider
+        return provider.get_user is not None or provider.get_user_async is not None
+
+    def key(self, request: HTTPServerRequest, user: t.Any = None) -> Hashable:
+        """
+        Returns the key of the sessions which may serve the request.
+        """
+        if config.session_key_func:
+            key = config.session_key_func(request)
+        else:
+            key = tuple(sorted(
+                (arg, tuple(values)) for arg, values in request.arguments.items()
+                if not arg.startswith('bokeh-')
+            ))
+        return (request.path, key, user if self._authenticated else None)
+
+    def start(self, path: str) -> None:
+        """
+        Starts filling the pool for anonymous requests without query
+        arguments to the application served at the path.
+        """
+        if self._authenticated:
+            return
+        request = HTTPServerRequest(method='GET', uri=path, headers=HTTPHeaders())
+        payload: TokenPayload = {'headers': {}, 'cookies': {}, 'arguments': {}}
+        self._register(self.key(request), request, payload)
+        self.fill()
+
+    def claim(self, handler: RequestHandler, payload: TokenPayload) -> ServerSession | None:
+        """
+        Claims a pooled session for the request of the handler and
+        re-keys it to the request, returning None if there is no
+        pooled session for the request. In either case the request is
+        used as the template for the sessions pooled for its key,
+        omitting its headers and cookies unless the key includes the
+        user.
+        """
+        request = handler.request
+        key = self.key(request, handler.current_user)
+        sessions = self._sessions.get(key, [])
+        session = None
+        while sessions and session is None:
+            session = sessions.pop(0)
+            if session.destroyed:
+                session = None
+        if session is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._rekey(session, request, payload)
+        log.debug(
+            "Session pool for %s %s (hit rate %.2f).", self._context.url,
+            'miss' if session is None else 'hit', self.hit_rate
+        )
+        if self._authenticated:
+            self._register(key, _template_request(request, private=True), payload)
+        else:
+            anonymous: TokenPayload = {'headers': {}, 'cookies': {}, 'arguments': payload['arguments']}
+            self._register(key, _template_request(request), anonymous)
+        return session
+
+    def _rekey(self, session: ServerSession, request: HTTPServerRequest, payload: TokenPayload) -> None:
+        from bokeh.server.contexts import _RequestProxy
+        app = self._tornado
+        token = generate_jwt_token(
+            session.id,
+            secret_key=app.secret_key,
+            signed=app.sign_sessions,
+            expiration=app.session_token_expiration,
+            extra_payload=payload
+        )
+        headers = dict(payload.get('headers', {}))
+        cookies = payload.get('cookies', {})
+        if cookies and 'Cookie' not in headers:
+            # Restore Cookie header from cookies dictionary
+            headers['Cookie'] = '; '.join([f'{k}={v}' for k, v in cookies.items()])
+        session_context = session.document.session_context
+        session_context._request = _RequestProxy(  # type: ignore[union-attr]
+            request, arguments=payload.get('arguments'), cookies=cookies, headers=headers
+        )
+        session_context._token = token  # type: ignore[union-attr]
+        session._token = token
+        # The session may have been pooled for longer than the unused
+        # session lifetime, which is measured from this point on
+        session._last_unsubscribe_time = current_time()
+        session.unblock_expiration()
+        if _METRICS.enabled:
+            # Time to render is measured from the claim of the session
+            _METRICS.session_claimed(session.document)
+
+    def _register(self, key: Hashable, request: HTTPServerRequest, payload: TokenPayload) -> None:
+        self._templates[key] = (request, payload)
+        if key not in self._sessions:
+            self._sessions[key] = []
+        self._sessions.move_to_end(key)
+        while len(self._sessions) > self.max_keys:
+            stale, sessions = self._sessions.popitem(last=False)
+            del self._templates[stale]
+            for session in sessions:
+                # Unclaimed sessions are discarded by the unused session cleanup
+                session.unblock_expiration()
+
+    def fill(self, served: ServerSession | None = None) -> None:
+        """
+        Fills the pool in the background once the session served to
+        the last request (if any) has been connected to.
+        """
+        if served is not None:
+            self._served.append((served, current_time()))
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._fill())
+
+    async def _await_served(self) -> None:
+        # Creating a session usually blocks the event loop, which
+        # should not delay the connection of the sessions just served
+        while self._served:
+            session, served = self._served[0]
+            if (session.connection_count or session.destroyed or
+                current_time() - served > CONNECT_TIMEOUT * 1000):
+                self._served.pop(0)
+            else:
+                await asyncio.sleep(0.1)
+
+    async def _fill(self) -> None:
+        # Sessions are created one at a time, since executing an
+        # application usually blocks the event loop
+        while True:
+            await self._await_served()
+            pending = [key for key, sessions in self._sessions.items() if len(sessions) < self.size]
+            if not pending:
+                break
+            key = pending[-1]
+            request, payload = self._templates[key]
+            try:
+                session = await self._create_session(request, payload)
+            except Exception as e:
+                log.error("Session pool for %s failed to create a session: %s", self._context.url, e)
+                break
+            if key in self._sessions:
+                self._sessions[key].append(session)
+            else:
+                session.unblock_expiration()
+
+    async def _create_session(self, request: HTTPServerRequest, payload: TokenPayload) -> ServerSession:
+        app = self._tornado
+        session_id = generate_session_id(secret_key=app.secret_key, signed=app.sign_sessions)
+        token = generate_jwt_token(
+            session_id,
+            secret_key=app.secret_key,
+            signed=app.sign_sessions,
+            expiration=app.session_token_expiration,
+            extra_payload=payload
+        )
+        session = await self._context.create_session_if_needed(session_id, request, token)
+        session.block_expiration()
+        return session
+
+    def stop(self) -> None:
+        """
+        Stops filling the pool and releases the pooled sessions.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        for sessions in self._sessions.values():
+            for session in sessions:
+                session.unblock_expiration()
+        self._sessions.clear()
+        self._templates.clear()
+        self._served.clear()
@@ -14,7 +14,9 @@ import threading
 import time
 import typing as t
 
-from collections import Counter, defaultdict
+from collections import (
+    Counter, OrderedDict, defaultdict, deque,
+)
 from collections.abc import (
     Callable, Coroutine, Hashable, Iterator, Iterator as TIterator,
 )
@@ -33,6 +35,7 @@ from pyviz_comms import CommManager as _CommManager
 
 from ..util import decode_token, edit_readonly, parse_timedelta
 from .logging import LOG_SESSION_RENDERED, LOG_USER_MSG
+from .metrics import _METRICS
 
 _state_logger = logging.getLogger('panel.state')
 
@@ -43,8 +46,9 @@ if t.TYPE_CHECKING:
     from bokeh.document import Document
     from bokeh.model import Model
     from bokeh.models import ImportedStyleSheet
-    from bokeh.server.contexts import BokehSessionContext
+    from bokeh.server.contexts import ApplicationContext, BokehSessionContext
     from bokeh.server.session import ServerSession
+    from bokeh.server.tornado import BokehTornado
     from IPython.display import DisplayHandle
     from param.parameterized import Event, Parameterized
     from pyviz_comms import Comm
@@ -57,9 +61,11 @@ if t.TYPE_CHECKING:
     from .browser import BrowserInfo
     from .cache import _Stack
     from .callbacks import PeriodicCallback
+    from .load import LoadMonitor
     from .location import Location
     from .notifications import NotificationAreaBase
     from .server import StoppableThread
+    from .session_pool import SessionPool
 
     T = t.TypeVar("T")
     K = t.TypeVar('K', bound=Hashable)
@@ -216,6 +222,10 @@ class _state(param.Parameterized):
 
     # Scheduled callbacks
     _scheduled: t.ClassVar[dict[str, tuple[TIterator[int] | None, Callable[[], None]]]] = {}
+
+    # Tasks scheduled before the server processes are forked, which
+    # are scheduled once each process has started
+    _deferred_tasks: t.ClassVar[list[Callable[[], None]] | None] = None
     _periodic: t.ClassVar[WeakKeyDictionary[Document, list[PeriodicCallback]]] = WeakKeyDictionary()
     _change_callbacks: t.ClassVar[WeakKeyDictionary[Document, dict[str, Callable[[], Coroutine[t.Any, t.Any, None]]]]] = WeakKeyDictionary()
 
@@ -238,9 +248,24 @@ class _state(param.Parameterized):
     # Locks
     _cache_locks: t.ClassVar[dict[str | tuple[t.Any, ...], threading.Lock]] = {'main': threading.Lock()}
 
+    # Estimated size and last access time of values cached with
+    # as_cached, in order of access (if config.cache_max_bytes is set)
+    _cache_usage: t.ClassVar[OrderedDict[tuple[t.Any, ...], tuple[int, float]]] = OrderedDict()
+
+    # Keys of values cached with as_cached being refreshed in the background
+    _cache_refreshing: t.ClassVar[set[tuple[t.Any, ...]]] = set()
+
     # Sessions
     _sessions: t.ClassVar[dict[Hashable, ServerSession]] = {}
     _session_key_funcs: t.ClassVar[dict[str, Callable[[t.Any], t.Any]]] = {}
+    _session_pools: t.ClassVar[dict[ApplicationContext, SessionPool]] = {}
+
+    # Load monitors of the running servers
+    _load_monitors: t.ClassVar[WeakKeyDictionary[BokehTornado, LoadMonitor]] = WeakKeyDictionary()
+
+    # Callbacks which blocked the event loop for longer than the
+    # config.slow_callback_threshold
+    _slow_callbacks: t.ClassVar[deque[dict[str, t.Any]]] = deque(maxlen=100)
 
     # Layout editor
     _cell_outputs: t.ClassVar[defaultdict[Hashable, list[t.Any]]] = defaultdict(list)
@@ -452,6 +477,8 @@ class _state(param.Parameterized):
         if session_info.get('rendered') is not None:
             return
         logger.info(LOG_SESSION_RENDERED, id(self.curdoc))
+        if _METRICS.enabled:
+            _METRICS.session_rendered(self.curdoc)
         self.session_info['live'] += 1
         session_info.update({
             'rendered': dt.datetime.now().timestamp()
@@ -639,6 +666,141 @@ class _state(param.Parameterized):
         else:
             self.log(f'Exception of unknown type raised: {exception}', level='error')
 
+    def _track_cache_usage(self, cache_key, value=_Undefined, max_bytes=None) -> bool:
+        """
+        Records an access to a value cached with as_cached. When a new
+        value is provided, room is made for it by evicting values
+        across all caches to stay within max_bytes. Returns False if
+        the value by itself exceeds max_bytes and should not be cached.
+        """
+        from .cache import (
+            _MEMORY_LOCK, _TIME_FN, _cleanup_memory, _sizeof,
+        )
+        with _MEMORY_LOCK:
+            if value is _Undefined:
+                if cache_key not in self._cache_usage:
+                    return True
+                nbytes, _ = self._cache_usage.pop(cache_key)
+            else:
+                nbytes = _sizeof(value)
+                self._cache_usage.pop(cache_key, None)
+                if nbytes > max_bytes:
+                    return False
+                _cleanup_memory(max_bytes-nbytes)
+            self._cache_usage[cache_key] = (nbytes, _TIME_FN())
+        return True
+
+    def _read_shared(self, cache_key, ttl=None) -> tuple[t.Any, float | None]:
+        """
+        Attaches a value cached by any process with the shared backend,
+        returning the value and its expiry or _Undefined if the value
+        does not exist or has expired.
+        """
+        from .cache import _shared_read, _shared_value_path
+        try:
+            ret, written = _shared_read(_shared_value_path(cache_key))
+        except KeyError:
+            return _Undefined, None
+        if not ttl:
+            return ret, None
+        remaining = written + ttl - time.time()
+        if remaining <= 0:
+            return _Undefined, None
+        return ret, time.monotonic() + remaining
+
+    def _write_shared(self, cache_key, value):
+        """
+        Writes a value to the shared cache, returning the memory-mapped
+        copy or the original value if it could not be shared.
+        """
+        from .cache import _shared_value_path, _shared_write
+        if _shared_write(_shared_value_path(cache_key), value):
+            ret, _ = self._read_shared(cache_key)
+            if ret is not _Undefined:
+                return ret
+        return value
+
+    def _cache_value(self, cache_key, fn, kwargs, ttl=None, backend='memory', force=False):
+        """
+        Computes a value for as_cached, or for the shared backend
+        attaches to the value cached by another process unless force
+        is set, and caches it.
+        """
+        from ..config import config
+        ret, new_expiry = _Undefined, time.monotonic() + ttl if ttl else None
+        if backend == 'shared' and not force:
+            ret, expiry = self._read_shared(cache_key, ttl)
+            if ret is not _Undefined:
+                new_expiry = expiry
+        if ret is _Undefined:
+            ret = fn(**kwargs)
+            if backend == 'shared':
+                ret = self._write_shared(cache_key, ret)
+        max_bytes = config.cache_max_bytes
+        if not max_bytes or self._track_cache_usage(cache_key, ret, max_bytes):
+            self.cache[cache_key] = (ret, new_expiry)
+        else:
+            self.cache.pop(cache_key, None)
+        return ret
+
+    def _revalidate(self, cache_key, fn, kwargs, ttl, backend) -> bool:
+        """
+        Refreshes an expired as_cached value in the background, on the
+        thread pool if enabled or otherwise the default executor of the
+        event loop. Returns False if no background execution is possible.
+        """
+        if self._is_pyodide:
+            return False
+        elif self._thread_pool:
+            submit = self._thread_pool.submit
+        else:
+            try:
+                submit = partial(asyncio.get_running_loop().run_in_executor, None)
+            except RuntimeError:
+                return False
+        with self._cache_locks['main']:
+            if cache_key in self._cache_refreshing:
+                return True
+            self._cache_refreshing.add(cache_key)
+
+        def refresh():
+            try:
+                self._cache_value(cache_key, fn, kwargs, ttl, backend)
+            except Exception:
+                _state_logger.exception(
+                    f'Refreshing the value cached under {cache_key[0]!r} '
+                    'failed, the stale value will continue to be served.'
+                )
+            finally:
+                self._cache_refreshing.discard(cache_key)
+
+        submit(refresh)
+        return True
+
+    def _schedule_refresh(self, cache_key, fn, kwargs, ttl, backend):
+        """
+        Schedules a task that recomputes an as_cached value before it
+        expires, until the value is evicted.
+        """
+        name = f'panel.as_cached:{cache_key[0]}:{hash(cache_key)}'
+        if f"{os.getpid()}_{name}" in self._scheduled:
+            return
+
+        def refresh():
+            if cache_key not in self.cache:
+                with suppress(KeyError):
+                    self.cancel_task(name)
+                return
+            self._cache_value(cache_key, fn, kwargs, ttl, backend, force=True)
+
+        # Leave a margin for the recomputation to finish before the
+        # current value expires
+        period = dt.timedelta(seconds=ttl*0.8)
+        self.schedule_task(
+            name, refresh, at=dt.datetime.now()+period, period=period,
+            threaded=bool(self._thread_pool)
+        )
+
     def _register_session_destroyed(self, session_context: SessionContext):
         for cb in self._on_session_destroyed:
             session_context._document.on_session_destroyed(cb)
@@ -647,7 +809,12 @@ class _state(param.Parameterized):
     # Public Methods
     #----------------------------------------------------------------
 
-    def as_cached(self, key: str, fn: Callable[[], T], ttl: int | None = None, **kwargs) -> T:
+    def as_cached(
+        self, key: str, fn: Callable[[], T], ttl: int | None = None,
+        backend: t.Literal['memory', 'shared'] = 'memory',
+        stale_while_revalidate: bool = False, refresh: bool = False,
+        **kwargs
+    ) -> T:
         """
         Caches the return value of a function globally across user sessions, memoizing on the given
         key and supplied keyword arguments.
@@ -674,6 +841,23 @@ class _state(param.Parameterized):
         ttl: (int)
           The number of seconds to keep an item in the cache, or None
           if the cache should not expire. The default is None.
+          If `config.cache_max_bytes` is set, the least recently used
+          values may also be evicted to stay within that budget.
+        backend: (str)
+          Whether to cache the value in the 'memory' of the current
+          process or in a 'shared' file that is memory-mapped by all
+          processes, e.g. the workers of `panel serve --num-procs`,
+          so NumPy and Arrow backed data is only held in memory once.
+          Shared values are read-only and persist until their file is
+          removed from `config.cache_shared_path`.
+        stale_while_revalidate: (bool)
+          Whether to keep returning an expired value while a single
+          background task recomputes it, instead of blocking until
+          the value has been recomputed.
+        refresh: (bool)
+          Whether to schedule a task (see `state.schedule_task`) that
+          recomputes the value in the background before its ttl
+          expires, so it never has to be recomputed on access.
         **kwargs: dict
           Additional keyword arguments to supply to the function,
           which will be memoized over as well.
@@ -684,7 +868,6 @@ class _state(param.Parameterized):
         the cache.
         """
         cache_key = (key,)+tuple((k, v) for k, v in sorted(kwargs.items()))
-        new_expiry = time.monotonic() + ttl if ttl else None
         with self._cache_locks['main']:
             if cache_key in self._cache_locks:
                 lock = self._cache_locks[cache_key]
@@ -696,8 +879,16 @@ class _state(param.Parameterized):
                     ret, expiry = self.cache[cache_key]
                 else:
                     ret, expiry = _Undefined, None
-                if ret is _Undefined or (expiry is not None and expiry < time.monotonic()):
-                    ret, _ = self.cache[cache_key] = (fn(**kwargs), new_expiry)
+                expired = expiry is not None and expiry < time.monotonic()
+                if ret is _Undefined or (expired and not (
+                    stale_while_revalidate and
+                    self._revalidate(cache_key, fn, kwargs, ttl, backend)
+                )):
+                    ret = self._cache_value(cache_key, fn, kwargs, ttl, backend)
+                elif cache_key in self._cache_usage:
+                    self._track_cache_usage(cache_key)
+            if refresh and ttl and cache_key in self.cache:
+                self._schedule_refresh(cache_key, fn, kwargs, ttl, backend)
         finally:
             if not lock.locked() and cache_key in self._cache_locks:
                 del self._cache_locks[cache_key]
@@ -800,7 +991,8 @@ class _state(param.Parameterized):
         for cache in self._memoize_cache.values():
             cache.clear()
             if hasattr(cache, 'directory'):
-                cache.cache.close()
+                if hasattr(cache, 'cache'):
+                    cache.cache.close()
                 try:
                     shutil.rmtree(cache.directory)
                 except OSError:  # Windows wonkiness
@@ -995,6 +1187,8 @@ class _state(param.Parameterized):
         self._connected.clear()
         self._loaded.clear()
         self.cache.clear()
+        self._cache_usage.clear()
+        self._cache_refreshing.clear()
         self._busy_cleanup_scheduled = None
         with edit_readonly(self):
             self._busy_counter = []
@@ -1070,6 +1264,12 @@ class _state(param.Parameterized):
           config.nthreads to be set).
         """
         key = f"{os.getpid()}_{name}"
+        if self._deferred_tasks is not None:
+            self._deferred_tasks.append(partial(
+                self.schedule_task, name, callback, at=at, period=period,
+                cron=cron, threaded=threaded
+            ))
+            return
         if key in self._scheduled:
             if callback is not self._scheduled[key][1]:
                 self.param.warning(
@@ -13,13 +13,16 @@ from collections.abc import (
 
 import param
 
+from bokeh.document.events import MessageSentEvent, ModelChangedEvent
 from bokeh.models import Row as BkRow
 from param.parameterized import iscoroutinefunction, resolve_ref
 
 from ..config import config
 from ..io.document import freeze_doc, hold
 from ..io.resources import CDN_DIST
-from ..models.layout import Column as PnColumn, ScrollToEvent
+from ..models.layout import (
+    ChildrenPatchEvent, Column as PnColumn, ScrollToEvent,
+)
 from ..reactive import Reactive
 from ..util import param_name, param_reprs
 from ..viewable import Children, Viewable
@@ -45,6 +48,57 @@ _row = namedtuple("row", ["children"]) # type: ignore
 _col = namedtuple("col", ["children"]) # type: ignore
 
 
+def diff_children(old: list[Model], new: list[Model]) -> list[tuple] | None:
+    """
+    Computes the operations turning the old into the new list of child
+    models, matching the children by identity.
+
+    The children between the unchanged start and end of the list are
+    removed and the new children inserted in their place, unless a
+    single child was moved. Since models that are already present on
+    the frontend are sent by reference, children that are re-inserted
+    are cheap to send.
+
+    Arguments
+    ---------
+    old: list[Model]
+        The previous list of child models.
+    new: list[Model]
+        The new list of child models.
+
+    Returns
+    -------
+    A list of ('remove', index, count), ('insert', index, children)
+    and ('move', index, target) operations or None if most of the
+    children changed.
+    """
+    nold, nnew = len(old), len(new)
+    start = 0
+    while start < min(nold, nnew) and old[start] is new[start]:
+        start += 1
+    end = 0
+    while end < min(nold, nnew) - start and old[nold-end-1] is new[nnew-end-1]:
+        end += 1
+    removed, inserted = old[start:nold-end], new[start:nnew-end]
+    if len(removed) == len(inserted) > 1:
+        if removed[0] is inserted[-1] and all(
+            o is n for o, n in zip(removed[1:], inserted[:-1], strict=True)
+        ):
+            return [('move', start, start+len(removed)-1)]
+        elif removed[-1] is inserted[0] and all(
+            o is n for o, n in zip(removed[:-1], inserted[1:], strict=True)
+        ):
+            return [('move', start+len(removed)-1, start)]
+    if len(removed) + len(inserted) > max(nold, nnew) // 2:
+        return None
+    ops: list[tuple] = []
+    if removed:
+        ops.append(('remove', start, len(removed)))
+    if inserted:
+        ops.append(('insert', start, inserted))
+    return ops
+
+
 class SizingModeMixin:
     """
     Mixin class to add support for computing sizing modes from the children
@@ -289,7 +343,10 @@ class Panel(Reactive, SizingModeMixin):
 
         obj_key = self._property_mapping['objects']
         update_children = obj_key in msg
+        patch_children = False
         if update_children:
+            patch_children = self._can_patch_children(model, doc, obj_key)
+            old_models = list(getattr(model, obj_key))
             old = events['objects'].old
             children, old_children = self._get_objects(model, old, doc, root, comm)
             msg[obj_key] = children
@@ -313,6 +370,8 @@ class Panel(Reactive, SizingModeMixin):
             try:
                 with freeze_doc(doc, model, msg, force=update_children):
                     super()._update_model(events, msg, root, model, doc, comm)
+                    if patch_children:
+                        self._patch_children(model, doc, obj_key, old_models)
                     if update:
                         return
                     from ..io import state
@@ -322,6 +381,43 @@ class Panel(Reactive, SizingModeMixin):
             finally:
                 Panel._batch_update = update
 
+    def _can_patch_children(self, model: Model, doc: Document, attr: str) -> bool:
+        """
+        Whether a change to the children of the model may be sent as
+        a ChildrenPatchEvent, which requires a model that handles the
+        event and has already been sent to the frontend, and that no
+        other change to the children is pending.
+        """
+        if (not isinstance(model, PnColumn) or model.document is not doc or
+            not doc.callbacks.hold_value or model in doc.models._new_models):
+            return False
+        return not any(
+            isinstance(event, ModelChangedEvent) and event.model is model and event.attr == attr
+            for event in doc.callbacks._held_events
+        )
+
+    def _patch_children(
+        self, model: Model, doc: Document, attr: str, old_models: list[Model]
+    ) -> None:
+        """
+        Replaces the held event setting all the children of the model
+        with a ChildrenPatchEvent applying just the changes.
+        """
+        held = doc.callbacks._held_events
+        for i in range(len(held)-1, -1, -1):
+            event = held[i]
+            if isinstance(event, ModelChangedEvent) and event.model is model and event.attr == attr:
+                break
+        else:
+            return
+        ops = diff_children(old_models, list(getattr(model, attr)))
+        if ops is None:
+            return
+        held[i] = MessageSentEvent(
+            doc, 'bokeh_event', ChildrenPatchEvent(model, ops),
+            callback_invoker=event.callback_invoker
+        )
+
     #----------------------------------------------------------------
     # Model API
     #----------------------------------------------------------------
@@ -337,8 +433,9 @@ class Panel(Reactive, SizingModeMixin):
         from ..pane.base import RerenderError
         new_models, old_models = [], []
 
+        current = {id(obj) for obj in self.objects}
         for obj in old_objects:
-            if obj not in self.objects:
+            if id(obj) not in current:
                 obj._cleanup(root)
 
         current_objects = list(self.objects)
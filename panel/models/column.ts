@@ -5,6 +5,7 @@ import type {Attrs} from "@bokehjs/core/types"
 import type {EventCallback} from "@bokehjs/model"
 import {Column as BkColumn, ColumnView as BkColumnView} from "@bokehjs/models/layouts/column"
 import {LayoutDOMView} from "@bokehjs/models/layouts/layout_dom"
+import type {UIElement} from "@bokehjs/models/ui/ui_element"
 
 export class ScrollButtonClick extends ModelEvent {
   static {
@@ -30,6 +31,26 @@ export class ScrollToEvent extends ModelEvent {
   }
 }
 
+type ChildrenOp = ["remove", number, number] | ["insert", number, UIElement[]] | ["move", number, number]
+
+@server_event("children_patch")
+export class ChildrenPatchEvent extends ModelEvent {
+  constructor(readonly model: Column, readonly ops: ChildrenOp[]) {
+    super()
+    this.ops = ops
+    this.origin = model
+  }
+
+  protected override get event_values(): Attrs {
+    return {model: this.origin, ops: this.ops}
+  }
+
+  static override from_values(values: object) {
+    const {model, ops} = values as {model: Column, ops: ChildrenOp[]}
+    return new ChildrenPatchEvent(model, ops)
+  }
+}
+
 export class ColumnView extends BkColumnView {
   declare model: Column
   _updating: boolean = false
@@ -236,6 +257,29 @@ export class Column extends BkColumn {
 
   static override __module__ = "panel.models.layout"
 
+  override initialize(): void {
+    super.initialize()
+    this.on_event(ChildrenPatchEvent, (event: ChildrenPatchEvent) => this.patch_children(event.ops))
+  }
+
+  patch_children(ops: ChildrenOp[]): void {
+    const children = [...this.children]
+    for (const op of ops) {
+      if (op[0] === "remove") {
+        children.splice(op[1], op[2])
+      } else if (op[0] === "insert") {
+        children.splice(op[1], 0, ...op[2])
+      } else {
+        const [child] = children.splice(op[1], 1)
+        children.splice(op[2], 0, child)
+      }
+    }
+    // The change is applied silently, since it was made on the server,
+    // and the views are notified explicitly
+    this.setv({children}, {silent: true})
+    this.properties.children.change.emit()
+  }
+
   static {
     this.prototype.default_view = ColumnView
 
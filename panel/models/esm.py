@@ -48,6 +48,8 @@ class ReactiveESM(HTMLBox):
 
     esm = bp.String()
 
+    esm_hash = bp.Nullable(bp.String)
+
     events = bp.List(bp.String)
 
     importmap = bp.Dict(bp.String, bp.Dict(bp.String, bp.String))
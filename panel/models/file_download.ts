@@ -190,9 +190,14 @@ export class FileDownloadView extends InputWidgetView {
   }
 
   _update_href(): void {
-    if (this.model.data) {
+    if (!this.model.data) {
+      return
+    } else if (this.model.data.startsWith("data:")) {
       const blob = dataURItoBlob(this.model.data)
       this.anchor_el.href = (URL as any).createObjectURL(blob)
+    } else {
+      // Files served by the server are streamed directly from their URL
+      this.anchor_el.href = this.model.data
     }
   }
 
@@ -28,6 +28,26 @@ class ScrollToEvent(ModelEvent):
         return dict(super().event_values(), index=self.index)
 
 
+class ChildrenPatchEvent(ModelEvent):
+    """
+    Applies a list of operations to the children of a Column, each
+    declared as a tuple of the form:
+
+    - ('remove', index, count): Removes count children at the index
+    - ('insert', index, children): Inserts the children at the index
+    - ('move', index, target): Moves the child at the index to the target
+    """
+
+    event_name = 'children_patch'
+
+    def __init__(self, model, ops=None):
+        self.ops = ops
+        super().__init__(model=model)
+
+    def event_values(self) -> dict[str, t.Any]:
+        return dict(super().event_values(), ops=self.ops)
+
+
 class HTMLBox(LayoutDOM):
     """ """
 
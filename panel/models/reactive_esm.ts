@@ -24,6 +24,24 @@ import esm_css from "styles/models/esm.css"
 
 const MODULE_CACHE = new Map()
 
+// Sources of shared ESM modules keyed by their content hash
+const SOURCE_CACHE: Map<string, Promise<string>> = new Map()
+
+function shared_source(hash: string, url: string): Promise<string> {
+  let source = SOURCE_CACHE.get(hash)
+  if (source === undefined) {
+    source = fetch(url).then((response) => {
+      if (!response.ok) {
+        SOURCE_CACHE.delete(hash)
+        throw new Error(`Could not load ESM module from ${url}: ${response.status}`)
+      }
+      return response.text()
+    })
+    SOURCE_CACHE.set(hash, source)
+  }
+  return source
+}
+
 export class DataEvent extends ModelEvent {
 
   constructor(readonly data: unknown) {
@@ -348,7 +366,7 @@ export class ReactiveESMView extends HTMLBoxView {
 
   render_error(error: SyntaxError): void {
     const error_div = div({class: "error"})
-    error_div.innerHTML = formatError(error, this.model.esm)
+    error_div.innerHTML = formatError(error, this.model.source)
     this.container.appendChild(error_div)
   }
 
@@ -639,6 +657,7 @@ export namespace ReactiveESM {
     data: p.Property<any>
     dev: p.Property<boolean>
     esm: p.Property<string>
+    esm_hash: p.Property<string | null>
     events: p.Property<string[]>
     importmap: p.Property<any>
     render_policy: p.Property<typeof RenderPolicy["__type__"]>
@@ -650,6 +669,7 @@ export interface ReactiveESM extends ReactiveESM.Attrs {}
 export class ReactiveESM extends HTMLBox {
   declare properties: ReactiveESM.Props
   compiled: string | null = null
+  source: string = ""
   compiled_module: Promise<any> | null = null
   compile_error: Error | null = null
   model_proxy: any
@@ -916,7 +936,7 @@ export default {render}`
     let compiled
     try {
       compiled = transform(
-        this.esm, {
+        this.source, {
           transforms: this.sucrase_transforms,
           filePath: "render.tsx",
         },
@@ -939,6 +959,20 @@ export default {render}`
 
   async recompile(): Promise<void> {
     this.compile_error = null
+    if (this.esm_hash != null) {
+      // Shared modules are fetched and imported once per hash
+      this.compiled_module = shared_source(this.esm_hash, this.esm).then((source) => {
+        this.source = source
+        this._load_module()
+        return this.compiled_module
+      })
+    } else {
+      this.source = this.esm
+      this._load_module()
+    }
+  }
+
+  protected _load_module(): void {
     const compiled = this.compile()
     if (compiled === null) {
       this.compiled_module = Promise.resolve(null)
@@ -948,7 +982,7 @@ export default {render}`
     this._declare_importmap()
     let esm_module
     const use_cache = (!this.dev || this.bundle)
-    const cache_key = (this.bundle === "url") ? this.esm : (this.bundle || `${this.class_name}-${this.esm.length}`)
+    const cache_key = (this.bundle === "url") ? this.esm : (this.bundle || this.esm_hash || `${this.class_name}-${this.esm.length}`)
     let resolve: (value: any) => void
     if (use_cache && MODULE_CACHE.has(cache_key)) {
       esm_module = Promise.resolve(MODULE_CACHE.get(cache_key))
@@ -1010,6 +1044,7 @@ export default {render}`
       data:        [ Any                     ],
       dev:         [ Bool,             false ],
       esm:         [ Str,                 "" ],
+      esm_hash:    [ Nullable(Str),     null ],
       events:      [ Array(Str),          [] ],
       importmap:   [ Any,                 {} ],
       render_policy: [ RenderPolicy, "children"],
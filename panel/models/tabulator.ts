@@ -388,6 +388,10 @@ export class DataTabulatorView extends HTMLBoxView {
   _lastVerticalScrollbarTopPosition: number = 0
   _lastHorizontalScrollbarLeftPosition: number = 0
   _applied_styles: boolean = false
+  /** Cell styles merged with any style patches received since the last full update. */
+  _style_data: Map<number, Map<number, any>> | null = null
+  /** Inline style values of cells before cell styles were applied. */
+  _style_defaults: WeakMap<HTMLElement, Map<string, string>> = new WeakMap()
   _building: boolean = false
   _redrawing: boolean = false
   /** Coalesced resize redraw; waits for `this.root.ready` (Bokeh view async chain) before redrawing. */
@@ -461,6 +465,10 @@ export class DataTabulatorView extends HTMLBoxView {
     })
 
     this.on_change(cell_styles, () => {
+      if (this.model.cell_styles.type === "patch") {
+        this.patchStyles()
+        return
+      }
       if (this._applied_styles) {
         this._updating_scroll = true
         this.tabulator.redraw(true)
@@ -1390,38 +1398,97 @@ export class DataTabulatorView extends HTMLBoxView {
     this.tabulator.setSort(this.sorters)
   }
 
+  getStyleData(): Map<number, Map<number, any>> | null {
+    const cell_styles = this.model.cell_styles
+    if (cell_styles.type !== "patch") {
+      this._style_data = cell_styles.data
+    }
+    return this._style_data
+  }
+
   setStyles(): void {
-    const style_data = this.model.cell_styles.data
+    const style_data = this.getStyleData()
     if (this.tabulator == null || this.tabulator.getDataCount() == 0 || style_data == null || !style_data.size) {
       return
     }
     this._applied_styles = false
     for (const r of style_data.keys()) {
-      const row_style = style_data.get(r)
-      const row = this.tabulator.getRow(r)
-      if (!row) {
+      this.setRowStyles(r, style_data.get(r))
+    }
+  }
+
+  patchStyles(): void {
+    // Style patches only contain the rows whose styles changed, so
+    // reset and restyle just those rows
+    const patch = this.model.cell_styles.data
+    if (patch == null) {
+      return
+    }
+    if (this._style_data == null) {
+      this._style_data = new Map()
+    }
+    for (const r of patch.keys()) {
+      const row_style = patch.get(r)
+      if (row_style.size) {
+        this._style_data.set(r, row_style)
+      } else {
+        this._style_data.delete(r)
+      }
+      if (this.tabulator == null || this.tabulator.getDataCount() == 0) {
         continue
       }
-      const cells = row._row.cells
-      for (const c of row_style.keys()) {
-        const style = row_style.get(c)
-        const cell = cells[c]
-        if (cell == null || !style.length) {
+      this.setRowStyles(r, row_style, true)
+    }
+  }
+
+  setRowStyles(r: number, row_style: Map<number, any>, reset: boolean = false): void {
+    const row = this.tabulator.getRow(r)
+    if (!row) {
+      return
+    }
+    const cells = row._row.cells
+    if (reset) {
+      for (const cell of cells) {
+        const defaults = this._style_defaults.get(cell.element)
+        if (defaults == null) {
           continue
         }
-        const element = cell.element
-        for (const s of style) {
-          let prop, value
-          if (isArray(s)) {
-            [prop, value] = s
-          } else if (!s.includes(":")) {
-            continue
+        for (const [prop, value] of defaults) {
+          if (value) {
+            cell.element.style.setProperty(prop, value)
           } else {
-            [prop, value] = s.split(":")
+            cell.element.style.removeProperty(prop)
           }
-          element.style.setProperty(prop, value.trimLeft())
-          this._applied_styles = true
         }
+        this._style_defaults.delete(cell.element)
+      }
+    }
+    for (const c of row_style.keys()) {
+      const style = row_style.get(c)
+      const cell = cells[c]
+      if (cell == null || !style.length) {
+        continue
+      }
+      const element = cell.element
+      let defaults = this._style_defaults.get(element)
+      if (defaults == null) {
+        defaults = new Map()
+        this._style_defaults.set(element, defaults)
+      }
+      for (const s of style) {
+        let prop, value
+        if (isArray(s)) {
+          [prop, value] = s
+        } else if (!s.includes(":")) {
+          continue
+        } else {
+          [prop, value] = s.split(":")
+        }
+        if (!defaults.has(prop)) {
+          defaults.set(prop, element.style.getPropertyValue(prop))
+        }
+        element.style.setProperty(prop, value.trimLeft())
+        this._applied_styles = true
       }
     }
   }
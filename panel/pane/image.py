@@ -15,6 +15,7 @@ from pathlib import PurePath
 
 import param
 
+from ..io.blobs import BlobMixin, data_url
 from ..models import PDF as _BkPDF
 from ..util import _descendents, isfile, isurl
 from .markup import HTMLBasePane
@@ -27,10 +28,12 @@ if t.TYPE_CHECKING:
 _tasks: set = set()
 
 
-class FileBase(HTMLBasePane):
+class FileBase(BlobMixin, HTMLBasePane):
 
     embed: bool = param.Boolean(default=False, doc="""
-        Whether to embed the file as base64.""")  # type: ignore[assignment, ty:invalid-assignment]
+        Whether to embed the file as base64. By default files are
+        served by the server when the pane is rendered in a server
+        session and embedded otherwise.""")  # type: ignore[assignment, ty:invalid-assignment]
 
     filetype: t.ClassVar[str]
 
@@ -85,8 +88,7 @@ class FileBase(HTMLBasePane):
     def _b64(self, data: str | bytes) -> str:
         if not isinstance(data, bytes):
             data = data.encode('utf-8')
-        b64 = base64.b64encode(data).decode("utf-8")
-        return f"data:image/{self.filetype};base64,{b64}"
+        return data_url(data, f'image/{self.filetype}', self, embed=self.embed)
 
     def _data(self, obj: t.Any) -> bytes | None:
         filetype = self.filetype.split('+')[0]
@@ -359,8 +361,7 @@ class ICO(ImageBase):
     def _b64(self, data: str | bytes) -> str:
         if not isinstance(data, bytes):
             data = data.encode('utf-8')
-        b64 = base64.b64encode(data).decode("utf-8")
-        return f"data:image/x-icon;base64,{b64}"
+        return data_url(data, 'image/x-icon', self, embed=self.embed)
 
     @classmethod
     def _imgshape(cls, data):
@@ -522,10 +523,9 @@ class PDF(FileBase):
             data = self._data(obj)
             if not isinstance(data, bytes):
                 data = data.encode('utf-8')
-            b64 = base64.b64encode(data).decode("utf-8")
             if self.embed:
-                return dict(text=b64)
-            obj = f'data:application/pdf;base64,{b64}'
+                return dict(text=base64.b64encode(data).decode("utf-8"))
+            obj = data_url(data, 'application/pdf', self)
 
         w, h = self.width or '100%', self.height or '100%'
         page = f'#page={self.start_page}' if getattr(self, 'start_page', None) else ''
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import functools
 import json
+import re
 import textwrap
 import typing as t
 
@@ -14,6 +15,7 @@ from html import escape
 import param  # type: ignore
 
 from ..config import config
+from ..io.cache import _RENDER_CACHE, _exact_hash
 from ..io.resources import CDN_DIST
 from ..models.markup import HTML as _BkHTML, JSON as _BkJSON, HTMLStreamEvent
 from ..util import HTML_SANITIZER, prefix_length
@@ -27,6 +29,59 @@ if t.TYPE_CHECKING:
     from pyviz_comms import Comm  # type: ignore
 
 
+_FENCE_RE = re.compile(r' {0,3}(`{3,}|~{3,})')
+_HTML_BLOCK_RE = re.compile(r' {0,3}<(script|pre|style|textarea|!--)', re.IGNORECASE)
+_DEFINITION_RE = re.compile(r' {0,3}\[[^\]]+\]:', re.MULTILINE)
+_CONTINUATION_RE = re.compile(r'\s|[-+*:>](\s|$)|\d{1,9}[.)](\s|$)')
+_HEADING_ID_RE = re.compile(r'<h[1-6] id="([^"]*)"')
+
+
+def _complete_blocks(text: str, start: int = 0) -> int | None:
+    """
+    Returns the offset in the markdown text up to which all blocks
+    following the start offset are complete, i.e. the text before the
+    offset renders to the same HTML independently of anything appended
+    to the text. Returns None if the text contains link reference or
+    footnote definitions, which affect the rendering of the whole text.
+
+    A block is complete once it is followed by a blank line and a line
+    which cannot continue it, i.e. is neither indented nor starts a
+    list item, block quote or definition, and it is not inside a
+    fenced code or raw HTML block.
+    """
+    if _DEFINITION_RE.search(text, start):
+        return None
+    end = start
+    fence: str | None = None
+    html_end: str | None = None
+    blank = False
+    offset = start
+    while (newline := text.find('\n', offset)) != -1:
+        line = text[offset:newline]
+        if fence is not None:
+            stripped = line.strip()
+            if stripped.startswith(fence) and not stripped.strip(fence[0]):
+                fence = None
+        elif html_end is not None:
+            if html_end in line.lower():
+                html_end = None
+        elif not line.strip():
+            blank = True
+        else:
+            if blank and not _CONTINUATION_RE.match(line):
+                end = offset
+            blank = False
+            if match := _FENCE_RE.match(line):
+                fence = match.group(1)
+            elif match := _HTML_BLOCK_RE.match(line):
+                tag = match.group(1).lower()
+                html_end = '-->' if tag == '!--' else f'</{tag}>'
+                if html_end in line[match.end():].lower():
+                    html_end = None
+        offset = newline + 1
+    return end
+
+
 class HTMLBasePane(ModelPane):
     """
     Baseclass for Panes which render HTML inside a Bokeh Div.
@@ -36,7 +91,10 @@ class HTMLBasePane(ModelPane):
 
     enable_streaming = param.Boolean(default=False, doc="""
         Whether to enable streaming of text snippets. This is useful
-        when updating a string step by step, e.g. in a chat message.""")
+        when updating a string step by step, e.g. in a chat message.
+        When enabled only the modified tail of the text is sent to the
+        frontend and the Markdown pane only re-renders the blocks that
+        are not yet complete.""")
 
     _bokeh_model: t.ClassVar[type[Model]] = _BkHTML
 
@@ -283,7 +341,11 @@ class DataFrame(HTML):
                 kwargs = {p: getattr(self, p) for p in self._rerender_params
                           if p not in HTMLBasePane.param and p not in ('_object', 'text_align')}
                 kwargs['classes'] = classes
-                html = obj.to_html(**kwargs)
+                render = functools.partial(obj.to_html, **kwargs)
+                if kwargs['float_format'] is None and not kwargs['formatters'] and (digest := _exact_hash(obj)):
+                    html = _RENDER_CACHE.render(('DataFrame', digest, repr(sorted(kwargs.items()))), render)
+                else:
+                    html = render()
         else:
             html = ''
         return dict(object=escape(html))
@@ -403,6 +465,10 @@ class Markdown(HTMLBasePane):
         f'{CDN_DIST}css/markdown.css'
     ]
 
+    def __init__(self, object=None, **params):
+        self._stream_cache: tuple[t.Any, str, str, set[str]] | None = None
+        super().__init__(object, **params)
+
     @classmethod
     def applies(cls, object: t.Any) -> float | bool | None:
         if hasattr(object, '_repr_markdown_'):
@@ -477,7 +543,9 @@ class Markdown(HTMLBasePane):
 
         if self.renderer == 'markdown':
             extensions = self.extensions + ['nl2br'] if self.hard_line_break else self.extensions
-            html = markdown.markdown(
+            key = (obj, 'markdown', tuple(extensions), repr(self.renderer_options))
+            render = functools.partial(
+                markdown.markdown,
                 obj,
                 extensions=extensions,
                 output_format='xhtml',
@@ -487,15 +555,56 @@ class Markdown(HTMLBasePane):
             parser = self._get_parser(
                 self.renderer, tuple(self.plugins), self.hard_line_break, self.disable_anchors, **self.renderer_options
             )
-            try:
-                html = parser.render(obj)
-            except IndexError:
-                # Likely markdown-it mdurl parser error
-                with parser.reset_rules():
-                    parser.disable('link')
-                    html = parser.render(obj)
+            if self.enable_streaming and self.renderer == 'markdown-it':
+                return dict(object=self._render_stream(parser, obj))
+            # Parsers are cached, i.e. the same parser is used for
+            # the same renderer, plugins and options
+            key = (obj, parser)
+            render = functools.partial(self._render, parser, obj)
+        html = render() if self.enable_streaming else _RENDER_CACHE.render(key, render)
         return dict(object=escape(html))
 
+    @classmethod
+    def _render(cls, parser, text: str) -> str:
+        try:
+            return parser.render(text)
+        except IndexError:
+            # Likely markdown-it mdurl parser error
+            with parser.reset_rules():
+                parser.disable('link')
+                return parser.render(text)
+
+    def _render_stream(self, parser, text: str) -> str:
+        """
+        Renders markdown which is being streamed incrementally, caching
+        the escaped HTML of the blocks which are complete so that only
+        the trailing blocks have to be re-rendered as text is appended.
+        Falls back to rendering the whole text if it contains
+        definitions or the incremental rendering would produce
+        duplicate heading anchors.
+        """
+        cache = self._stream_cache
+        if cache is None or cache[0] is not parser or not text.startswith(cache[1]):
+            cache = (parser, '', '', set())
+        _, source, html, ids = cache
+        end = _complete_blocks(text, len(source))
+        if end is None:
+            self._stream_cache = None
+            return escape(self._render(parser, text))
+        if end > len(source):
+            block = self._render(parser, text[len(source):end])
+            block_ids = set(_HEADING_ID_RE.findall(block))
+            if ids & block_ids:
+                self._stream_cache = None
+                return escape(self._render(parser, text))
+            source, html, ids = text[:end], html+escape(block), ids | block_ids
+            self._stream_cache = (parser, source, html, ids)
+        tail = self._render(parser, text[end:])
+        if ids and ids & set(_HEADING_ID_RE.findall(tail)):
+            self._stream_cache = None
+            return escape(self._render(parser, text))
+        return html + escape(tail)
+
     def _process_param_change(self, params):
         if 'css_classes' in params:
             params['css_classes'] = ['markdown'] + params['css_classes']
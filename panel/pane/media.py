@@ -7,12 +7,12 @@ import os
 import pathlib
 import typing as t
 
-from base64 import b64encode
 from io import BytesIO
 
 import numpy as np
 import param
 
+from ..io.blobs import BlobMixin, data_url
 from ..models import Audio as _BkAudio, Video as _BkVideo
 from ..util import isfile, isurl
 from .base import ModelPane
@@ -39,7 +39,7 @@ class TensorLike(metaclass=TensorLikeMeta):
     """A class similar to torch.Tensor. We don't want to make PyTorch a dependency of this project
     """
 
-class _MediaBase(ModelPane):
+class _MediaBase(BlobMixin, ModelPane):
 
     loop = param.Boolean(default=False, doc="""
         Whether the media should loop""")
@@ -130,28 +130,25 @@ class _MediaBase(ModelPane):
             data = b''
         elif isinstance(obj, bytes):
             fmt = self._detect_format(obj)
-            data = b64encode(obj)
+            data = obj
         elif isinstance(obj, (np.ndarray, TensorLike)):
             fmt = 'wav'
             buffer = self._to_buffer(obj)
-            data = b64encode(buffer.getvalue())
+            data = buffer.getvalue()
         elif isinstance(obj, BytesIO):
-            bffr = obj.read()
-            fmt = self._detect_format(bffr)
-            data = b64encode(bffr)
+            data = obj.read()
+            fmt = self._detect_format(data)
         elif os.path.isfile(obj):
             fmt = str(obj).split('.')[-1]
             with open(obj, 'rb') as f:
                 data = f.read()
-            data = b64encode(data)
         elif obj.lower().startswith('http'):
             return dict(object=obj)
         elif not obj or obj == f'data:{self._media_type}/{fmt};base64,':
             data = b''
         else:
             raise ValueError(f'Object should be either path to a {self._media_type} file or numpy array.')
-        b64 = f"data:{self._media_type}/{fmt};base64,{data.decode('utf-8')}"
-        return dict(object=b64)
+        return dict(object=data_url(data, f'{self._media_type}/{fmt}', self))
 
 _VALID_TORCH_DTYPES_FOR_AUDIO = [
     "torch.short", "torch.int16",
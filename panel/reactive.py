@@ -14,6 +14,7 @@ import pathlib
 import re
 import sys
 import textwrap
+import time
 import typing as t
 import uuid
 
@@ -36,6 +37,7 @@ from param.parameterized import (
 )
 
 from .io.document import hold, unlocked
+from .io.metrics import _METRICS
 from .io.notebook import push
 from .io.resources import (
     CDN_DIST, get_dist_path, loading_css, patch_stylesheet, process_raw_css,
@@ -49,6 +51,7 @@ from .util import (
     HTML_SANITIZER, classproperty, edit_readonly, updating,
 )
 from .util.checks import import_available
+from .util.ringbuffer import StreamBuffer
 from .viewable import (
     Child, Children, Layoutable, Renderable, Viewable,
 )
@@ -518,12 +521,15 @@ class Syncable(Renderable):
         self._log('received bokeh event %s', event)
         busy_event_id = f'bokeh-events-{uuid.uuid4().hex}'
         state._add_busy_event(busy_event_id)
+        start = time.perf_counter()
         try:
             with set_curdoc(doc):
                 self._process_event(event)
         finally:
             self._log('finished processing bokeh event %s', event)
             state._remove_busy_event(busy_event_id)
+            if _METRICS.enabled:
+                _METRICS.callback_finished(doc, time.perf_counter()-start)
 
     async def _change_coroutine(self, doc: Document, event_id: str | None = None) -> None:
         if event_id is not None:
@@ -562,8 +568,13 @@ class Syncable(Renderable):
     def _change_event(self, doc: Document) -> None:
         events = self._events
         self._events = {}
-        with set_curdoc(doc):
-            self._process_events(events)
+        start = time.perf_counter()
+        try:
+            with set_curdoc(doc):
+                self._process_events(events)
+        finally:
+            if _METRICS.enabled:
+                _METRICS.callback_finished(doc, time.perf_counter()-start)
 
     def _schedule_change(self, doc: Document, comm: Comm | None) -> None:
         with hold(doc, comm=comm):
@@ -1022,10 +1033,18 @@ class SyncableData(Reactive):
     selection = param.List(default=[], item_type=int, doc="""
         The currently selected rows in the data.""")
 
+    stream_buffer = param.Boolean(default=False, doc="""
+        Whether to hold streamed data in a preallocated columnar
+        buffer, which streamed rows are appended to and rolled over
+        rows discarded from in place, instead of copying all the data
+        on every stream. The data is then a view of the buffer.""")
+
     # Parameters which when changed require an update of the data
     _data_params: t.ClassVar[list[str]] = []
 
-    _rename: t.ClassVar[Mapping[str, str | None]] = {'selection': None}
+    _rename: t.ClassVar[Mapping[str, str | None]] = {
+        'selection': None, 'stream_buffer': None
+    }
 
     __abstract = True
 
@@ -1034,6 +1053,7 @@ class SyncableData(Reactive):
         self._data = None
         self._processed = None
         self._old_value = None
+        self._stream_buffer: StreamBuffer | None = None
         callbacks = [self.param.watch(self._validate, self._data_params)]
         if self._data_params:
             callbacks.append(
@@ -1112,6 +1132,33 @@ class SyncableData(Reactive):
         for ref, (m, _) in self._models.copy().items():
             self._apply_update(named_events, msg, m.source.selected, ref)
 
+    def _append_to_buffer(
+        self, data: t.Any, stream_value: t.Any, rollover: int | None
+    ) -> t.Any | None:
+        """
+        Appends the stream_value to the stream buffer holding the data,
+        returning a view of the buffered data, or None if the stream
+        buffer is disabled or cannot hold the stream_value.
+        """
+        buffer = self._stream_buffer
+        if not self.stream_buffer or buffer is None or not buffer.holds(data):
+            return None
+        elif not buffer.append(stream_value, rollover):
+            self._stream_buffer = None
+            return None
+        return buffer.data
+
+    def _buffer(self, data: t.Any) -> t.Any:
+        """
+        Copies the data into a new stream buffer if the stream buffer
+        is enabled, returning a view of the buffered data.
+        """
+        if self.stream_buffer and StreamBuffer.supports(data):
+            self._stream_buffer = StreamBuffer(data)
+            return self._stream_buffer.data
+        self._stream_buffer = None
+        return data
+
     def _apply_stream(self, ref: str, model: Model, stream: DataDict, rollover: int | None) -> None:
         self._changing[ref] = ['data']
         try:
@@ -1241,9 +1288,12 @@ class SyncableData(Reactive):
                 value_index_start = self._processed.index.max() + 1
                 stream_value = stream_value.reset_index(drop=True)
                 stream_value.index += value_index_start
-            combined = pd.concat([self._processed, stream_value])
-            if rollover is not None:
-                combined = combined.iloc[-rollover:]
+            combined = self._append_to_buffer(self._processed, stream_value, rollover)
+            if combined is None:
+                combined = pd.concat([self._processed, stream_value])
+                if rollover is not None:
+                    combined = combined.iloc[-rollover:]
+                combined = self._buffer(combined)
             with param.discard_events(self):
                 self._update_data(combined)
             try:
@@ -1265,11 +1315,17 @@ class SyncableData(Reactive):
             if isinstance(self._processed, dict):
                 if not all(col in stream_value for col in self._data):
                     raise ValueError("Stream update must append to all columns.")
-                for col, array in stream_value.items():
-                    concatenated = np.concatenate([self._data[col], array])
-                    if rollover is not None:
-                        concatenated = concatenated[-rollover:]
-                    self._update_column(col, concatenated)
+                buffered = self._append_to_buffer(self._data, stream_value, rollover)
+                if buffered is None:
+                    buffered = {}
+                    for col, array in stream_value.items():
+                        concatenated = np.concatenate([self._data[col], array])
+                        if rollover is not None:
+                            concatenated = concatenated[-rollover:]
+                        buffered[col] = concatenated
+                    buffered = self._buffer(buffered)
+                for col, array in buffered.items():
+                    self._update_column(col, array)
                 self._stream(stream_value, rollover)
             else:
                 try:
@@ -1328,6 +1384,8 @@ class SyncableData(Reactive):
         >>> obj.value.to_dict("list")
         {'x': [3, 4], 'y': ['c', 'd']}
         """
+        # Patches may replace the buffered arrays
+        self._stream_buffer = None
         if self._processed is None or isinstance(patch_value, dict):
             self._patch(patch_value)
             return
@@ -1480,6 +1538,7 @@ class ReactiveData(SyncableData):
         # If no columns were updated we don't have to sync data
         if not updated:
             return
+        self._stream_buffer = None
 
         # Ensure we trigger events
         self._updating = True
@@ -164,6 +164,45 @@ def test_serve_num_procs_setup(tmp_path):
         assert pid1 != pid2
 
 
+@unix_only
+def test_serve_num_procs_prefork(tmp_path):
+    app = dedent(
+        '''
+        import os
+        import panel as pn
+        data = pn.state.as_cached('data', lambda: print(f"Load PID {os.getpid()}", flush=True) or 'Hello')
+        pn.panel(data).servable()
+        '''
+    )
+    py = tmp_path / "app.py"
+    py.write_text(app)
+
+    setup_app = dedent(
+        '''
+        import os
+        import panel as pn
+        print(f"Setup PID {os.getpid()}", flush=True)
+        def task():
+            print(f"Task PID {os.getpid()}", flush=True)
+        pn.state.schedule_task('task', task, period='1s')
+        '''
+    )
+    setup_py = tmp_path / "setup.py"
+    setup_py.write_text(setup_app)
+
+    regex = re.compile(r'((?:Setup PID|Load PID|Task PID|process id:) \d+)')
+    args = ["--port", "0", py, "--num-procs", 2, "--prefork", "--setup", setup_py]
+    with run_panel_serve(args, cwd=tmp_path) as p:
+        pids = {}
+        for match in wait_for_regex(p.stdout, regex=regex, count=6):
+            kind, pid = match.rsplit(' ', 1)
+            pids.setdefault(kind, []).append(pid)
+        assert len(pids['Setup PID']) == 1
+        assert pids['Load PID'] == pids['Setup PID']
+        assert len(set(pids['process id:'])) == 2
+        assert sorted(pids['Task PID']) == sorted(pids['process id:'])
+
+
 def test_serve_setup(tmp_path):
     app = "import panel as pn; pn.panel('Hello').servable()"
     py = tmp_path / "app.py"
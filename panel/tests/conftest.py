@@ -556,6 +556,16 @@ def reuse_sessions():
         state._sessions.clear()
         state._session_key_funcs.clear()
 
+@pytest.fixture
+def session_pool(monkeypatch):
+    monkeypatch.setattr('panel.io.session_pool.CONNECT_TIMEOUT', 0)
+    config.session_pool = 2
+    try:
+        yield 2
+    finally:
+        config.session_pool = 0
+        config.session_key_func = None
+
 @pytest.fixture
 def nothreads():
     yield
@@ -0,0 +1,72 @@
+from weakref import ref
+
+from bokeh.document import Document
+
+from panel.io.blobs import (
+    BLOB_PATH, BlobStore, _rendering, blob_store, data_url,
+)
+
+
+def test_blob_store_add():
+    store = BlobStore()
+    doc = Document()
+    key = store.add(b'abc', 'image/png', doc, 'owner')
+
+    assert key in store
+    assert store.get(key) == (b'abc', 'image/png')
+    assert store.nbytes == 3
+    assert store.url(key, doc) == f'{BLOB_PATH}{key}'
+
+
+def test_blob_store_add_same_data_shares_blob():
+    store = BlobStore()
+    doc1, doc2 = Document(), Document()
+    key1 = store.add(b'abc', 'image/png', doc1, 'owner')
+    key2 = store.add(b'abc', 'image/png', doc2, 'owner')
+
+    assert key1 == key2
+    assert len(store) == 1
+
+    store._release_doc(ref(doc1), None)
+    assert key1 in store
+
+    store._release_doc(ref(doc2), None)
+    assert key1 not in store
+
+
+def test_blob_store_add_replaces_owner_blob():
+    store = BlobStore()
+    doc = Document()
+    key1 = store.add(b'abc', 'image/png', doc, 'owner')
+    key2 = store.add(b'def', 'image/png', doc, 'owner')
+
+    assert key1 != key2
+    assert key1 not in store
+    assert key2 in store
+    assert len(store) == 1
+
+
+def test_blob_store_release_doc():
+    store = BlobStore()
+    doc = Document()
+    store.add(b'abc', 'image/png', doc, 'owner1')
+    store.add(b'def', 'image/png', doc, 'owner2')
+
+    assert len(store) == 2
+
+    store._release_doc(ref(doc), None)
+
+    assert len(store) == 0
+    assert store.nbytes == 0
+
+
+def test_data_url_without_session_is_inlined():
+    doc = Document()
+    with _rendering(doc):
+        url = data_url(b'abc', 'image/png', 'owner')
+    assert url == 'data:image/png;base64,YWJj'
+    assert doc not in blob_store._owners
+
+
+def test_data_url_embed_is_inlined():
+    assert data_url(b'abc', 'image/png', 'owner', embed=True) == 'data:image/png;base64,YWJj'
@@ -1,9 +1,16 @@
+import asyncio
 import datetime as dt
+import gc
 import io
+import os
 import pathlib
+import subprocess
+import sys
+import threading
 import time
 
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
@@ -18,7 +25,11 @@ except Exception:
 diskcache_available = pytest.mark.skipif(diskcache is None, reason="requires diskcache")
 
 from panel.config import config
-from panel.io.cache import _generate_hash, cache, is_equal
+from panel.io.cache import (
+    _BUFFER_HASHES, _HASH_BACKEND, _exact_hash, _generate_hash, _HashMemo,
+    _PolicyCache, _RenderCache, _shared_cache_path, _shared_read,
+    _shared_write, _sizeof, cache, compute_hash, is_equal,
+)
 from panel.io.state import set_curdoc, state
 from panel.tests.util import serve_and_wait
 
@@ -156,6 +167,34 @@ def test_series_hash():
     series2.iloc[0] = 3.14
     assert not hashes_equal(series1, series2)
 
+@pytest.mark.parametrize('backend', ['md5', 'xxhash', 'blake3'])
+def test_hash_backend(backend):
+    if backend != 'md5':
+        pytest.importorskip(backend)
+    arr = np.arange(10)
+    with config.set(cache_hash_backend=backend):
+        assert hashes_equal(arr, arr.copy())
+        assert not hashes_equal(arr, arr[::-1])
+    assert hashes_equal(arr, arr.copy())
+
+def test_large_dataframe_hash_detects_change():
+    if not _HASH_BACKEND[1]:
+        pytest.skip('requires a fast hash backend')
+    df1 = pd.DataFrame({'A': np.arange(200_000)})
+    df2 = df1.copy()
+    assert hashes_equal(df1, df2)
+    df2.iloc[12345, 0] = -1
+    assert not hashes_equal(df1, df2)
+
+def test_readonly_buffer_hash_reused():
+    arr = np.arange(1000)
+    arr.flags.writeable = False
+    series1 = pd.Series(arr, copy=False)
+    series2 = pd.Series(arr, copy=False)
+    hits = _BUFFER_HASHES.hits
+    assert hashes_equal(series1, series2)
+    assert _BUFFER_HASHES.hits > hits
+
 def test_polars_dataframe_hash():
     pl = pytest.importorskip("polars")
     data = {
@@ -196,6 +235,117 @@ def test_module_hash():
     assert hashes_equal(np, np)
     assert not hashes_equal(np, io)
 
+def test_sizeof_bytes():
+    assert _sizeof(bytes(1000)) >= 1000
+
+def test_sizeof_ndarray():
+    assert _sizeof(np.zeros(1000)) == 8000
+
+def test_sizeof_dataframe():
+    df = pd.DataFrame({'a': np.zeros(1000), 'b': np.ones(1000, dtype='int32')})
+    assert _sizeof(df) >= 12000
+
+def test_sizeof_dataframe_object_column():
+    df = pd.DataFrame({'a': ['a'*100]*1000}, dtype=object)
+    assert _sizeof(df) >= 100_000
+
+def test_sizeof_list():
+    assert _sizeof([np.zeros(100), np.zeros(100)]) > 1600
+
+def test_sizeof_recursive():
+    l = [0]
+    l.append(l)
+    assert _sizeof(l) > 0
+
+def test_compute_hash_memoizes_readonly_arrays():
+    from panel.io.cache import _HASH_MAP
+    arr = np.arange(1000)
+    arr.flags.writeable = False
+    hits = _HASH_MAP.hits
+    h1 = compute_hash(function_with_args, {}, (arr,), {})
+    h2 = compute_hash(function_with_args, {}, (arr,), {})
+    assert h1 == h2
+    assert _HASH_MAP.hits == hits + 1
+
+def test_compute_hash_array_modified_in_place():
+    arr = np.arange(1000)
+    h1 = compute_hash(function_with_args, {}, (arr,), {})
+    arr[0] = 100
+    assert compute_hash(function_with_args, {}, (arr,), {}) != h1
+
+def test_compute_hash_readonly_view_of_writeable_array():
+    arr = np.arange(1000)
+    view = arr[:]
+    view.flags.writeable = False
+    h1 = compute_hash(function_with_args, {}, (view,), {})
+    arr[0] = 100
+    assert compute_hash(function_with_args, {}, (view,), {}) != h1
+
+def test_cache_dataframe_modified_in_place():
+    df = pd.DataFrame({'a': [1, 2, 3]})
+
+    @cache
+    def column_sum(df):
+        return df.a.sum()
+
+    assert column_sum(df) == 6
+    df.loc[0, 'a'] = 100
+    assert column_sum(df) == 105
+
+def test_hash_memo_drops_collected_objects():
+    memo = _HashMemo()
+    arr = np.arange(10)
+    key = ('__id', id(arr))
+    memo.set(key, 'hash', 0, [arr])
+    assert memo.get(key) == 'hash'
+    del arr
+    gc.collect()
+    assert memo.get(key) is None
+    assert len(memo) == 0
+
+def test_hash_memo_bounded():
+    memo = _HashMemo(max_items=2)
+    memo.set('a', 'a', 0, [])
+    memo.set('b', 'b', 0, [])
+    memo.get('a')
+    memo.set('c', 'c', 0, [])
+    assert memo.get('b') is None
+    assert memo.get('a') == 'a'
+    assert memo.stats()['size'] == 2
+
+def test_render_cache_bounded():
+    render_cache = _RenderCache(max_items=2)
+    assert render_cache.render('a', lambda: 'A') == 'A'
+    render_cache.render('b', lambda: 'B')
+    assert render_cache.render('a', lambda: 'other') == 'A'
+    render_cache.render('c', lambda: 'C')
+    assert render_cache.render('b', lambda: 'other') == 'other'
+    assert render_cache.stats() == {
+        'hits': 1, 'misses': 4, 'size': 2, 'max_items': 2, 'nbytes': 8, 'max_bytes': 64 * 2**20
+    }
+
+def test_render_cache_bounded_bytes():
+    render_cache = _RenderCache(max_bytes=10)
+    render_cache.render(('a',), lambda: 'A'*5)
+    render_cache.render(('b',), lambda: 'B'*5)
+    assert len(render_cache) == 1
+    assert render_cache.nbytes == 6
+    render_cache.render(('c',), lambda: 'C'*20)
+    assert len(render_cache) == 1
+
+def test_render_cache_unhashable_key():
+    render_cache = _RenderCache()
+    assert render_cache.render(('a', []), lambda: 'A') == 'A'
+    assert len(render_cache) == 0
+
+def test_exact_hash_dataframe():
+    df = pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']})
+    assert _exact_hash(df) == _exact_hash(df.copy())
+    assert _exact_hash(df) != _exact_hash(df.assign(a=[1, 3]))
+    assert _exact_hash(df) != _exact_hash(df.rename_axis('index'))
+    assert _exact_hash(df.a) != _exact_hash(df.a.rename('c'))
+    assert _exact_hash(df.to_numpy()) is None
+
 ################
 # Test caching #
 ################
@@ -352,6 +502,83 @@ def test_cache_lru(to_disk, tmp_path):
     assert fn(0, 0) == 0
     assert fn(0, 1) == 2
 
+@pytest.mark.parametrize('policy', ('FIFO', 'LRU', 'LFU'))
+def test_policy_cache_victim(policy):
+    store = _PolicyCache({}, policy)
+    store['a'] = (0, 0, 0, 0)
+    store['b'] = (1, 1, 0, 1)
+    store['c'] = (2, 2, 0, 2)
+    store['a'] = (0, 0, 1, 3)
+    store['c'] = (2, 2, 1, 4)
+    store['c'] = (2, 2, 2, 5)
+    assert store.victim() == {'FIFO': 'a', 'LRU': 'b', 'LFU': 'b'}[policy]
+    del store['b']
+    assert store.victim() == {'FIFO': 'a', 'LRU': 'a', 'LFU': 'a'}[policy]
+    store.clear()
+    assert len(store) == 0
+
+@pytest.mark.parametrize('policy', ('FIFO', 'LRU', 'LFU'))
+def test_policy_cache_restores_order(policy):
+    store = {
+        'a': (0, 0, 3, 5),
+        'b': (1, 1, 1, 3),
+        'c': (2, 2, 2, 1),
+    }
+    assert _PolicyCache(store, policy).victim() == {'FIFO': 'a', 'LRU': 'c', 'LFU': 'b'}[policy]
+
+def test_policy_cache_expired():
+    store = _PolicyCache({}, 'LRU')
+    store['a'] = (0, 0, 0, 0)
+    store['b'] = (1, 1, 0, 1)
+    store['c'] = (2, 2, 0, 2)
+    assert store.expired(0.5, 2) == ['a', 'b']
+
+@pytest.mark.parametrize('to_disk', (True, False))
+def test_cache_max_bytes(to_disk, tmp_path):
+    if to_disk and diskcache is None:
+        pytest.skip('requires diskcache')
+    calls = []
+
+    @cache(max_bytes=2500, to_disk=to_disk, cache_path=tmp_path)
+    def load(n):
+        calls.append(n)
+        return np.zeros(n, dtype='uint8')
+
+    load(1000)
+    load(1001)
+    load(1000)
+    load(1002) # 1001 should be evicted
+    load(1000)
+    load(1001)
+    assert calls == [1000, 1001, 1002, 1001]
+
+    load(5000) # Too large to cache
+    load(5000)
+    assert calls[-2:] == [5000, 5000]
+
+def test_cache_global_max_bytes():
+    calls = []
+
+    with config.set(cache_max_bytes=2500):
+        @cache
+        def load_a(n):
+            calls.append(('a', n))
+            return np.zeros(n, dtype='uint8')
+
+        @cache
+        def load_b(n):
+            calls.append(('b', n))
+            return np.zeros(n, dtype='uint8')
+
+        load_a(1000)
+        load_b(1000)
+        load_a(1000)
+        load_b(1001) # load_b(1000) should be evicted
+        load_a(1000)
+        load_b(1000)
+
+    assert calls == [('a', 1000), ('b', 1000), ('b', 1001), ('b', 1000)]
+
 @pytest.mark.parametrize('to_disk', (True, False))
 def test_cache_ttl(to_disk, tmp_path):
     if to_disk and diskcache is None:
@@ -363,6 +590,241 @@ def test_cache_ttl(to_disk, tmp_path):
     time.sleep(0.2)
     assert fn(0, 0) == 1
 
+def test_shared_write_read_dataframe(tmp_path):
+    df = pd.DataFrame({
+        'int': np.arange(1000), 'float': np.random.rand(1000),
+        'str': ['a', 'b']*500, 'cat': pd.Categorical(['a', 'b']*500)
+    })
+    path = str(tmp_path / 'value')
+    assert _shared_write(path, df, str(tmp_path))
+    value, written = _shared_read(path, str(tmp_path))
+    pd.testing.assert_frame_equal(value, df)
+    assert not value['float'].to_numpy().flags.writeable
+    assert written <= time.time()
+
+def test_shared_read_written_by_other_process(tmp_path):
+    path = str(tmp_path / 'value')
+    code = (
+        "import sys, numpy as np; from panel.io.cache import _shared_write; "
+        "_shared_write(sys.argv[1], np.arange(100_000), sys.argv[2])"
+    )
+    subprocess.run([sys.executable, '-c', code, path, str(tmp_path)], check=True)
+    value, _ = _shared_read(path, str(tmp_path))
+    np.testing.assert_array_equal(value, np.arange(100_000))
+    assert not value.flags.writeable
+
+def test_shared_read_missing(tmp_path):
+    with pytest.raises(KeyError):
+        _shared_read(str(tmp_path / 'missing'), str(tmp_path))
+
+@pytest.mark.skipif(not hasattr(os, 'getuid'), reason='requires POSIX permissions')
+def test_shared_write_creates_private_directories(tmp_path):
+    root = tmp_path / 'cache'
+    path = str(root / 'as_cached' / 'value')
+    assert _shared_write(path, 1, str(root))
+    assert os.stat(root).st_mode & 0o777 == 0o700
+    assert os.stat(root / 'as_cached').st_mode & 0o777 == 0o700
+    assert os.stat(path).st_mode & 0o777 == 0o600
+
+@pytest.mark.skipif(not hasattr(os, 'getuid'), reason='requires POSIX permissions')
+def test_shared_refuses_directory_writable_by_others(tmp_path):
+    root = tmp_path / 'cache'
+    path = str(root / 'as_cached' / 'value')
+    assert _shared_write(path, 1, str(root))
+    os.chmod(root / 'as_cached', 0o777)
+    with pytest.raises(KeyError):
+        _shared_read(path, str(root))
+    assert not _shared_write(path, 2, str(root))
+
+@pytest.mark.skipif(not hasattr(os, 'getuid'), reason='requires POSIX permissions')
+def test_shared_cache_default_path_per_user():
+    assert _shared_cache_path().endswith(f'panel-cache-{os.getuid()}')
+
+def test_shared_cache(tmp_path):
+    global OFFSET
+    OFFSET.clear()
+    fn = cache(function_with_args, backend='shared', cache_path=tmp_path)
+    assert fn(0, 0) == 0
+    assert len(list(tmp_path.glob('*/*'))) == 1
+    # Emulate another process attaching to the shared cache
+    state._memoize_cache.clear()
+    assert fn(0, 0) == 0
+    assert fn(0, 1) == 1
+    assert len(list(tmp_path.glob('*/*'))) == 2
+    fn.clear()
+    assert not list(tmp_path.glob('*/*'))
+    assert fn(0, 0) == 1
+
+def test_shared_cache_dataframe_readonly(tmp_path):
+    calls = []
+
+    @cache(backend='shared', cache_path=tmp_path)
+    def load(n):
+        calls.append(n)
+        return pd.DataFrame({'a': np.arange(n)})
+
+    df = load(10)
+    state._memoize_cache.clear()
+    shared = load(10)
+    assert calls == [10]
+    pd.testing.assert_frame_equal(df, shared)
+    assert not shared['a'].to_numpy().flags.writeable
+
+def test_shared_cache_unpicklable(tmp_path):
+    calls = []
+
+    @cache(backend='shared', cache_path=tmp_path)
+    def make(n):
+        calls.append(n)
+        return lambda: n
+
+    assert make(1) is make(1)
+    assert calls == [1]
+    assert not list(tmp_path.glob('*/*'))
+
+def test_shared_cache_max_items(tmp_path):
+    global OFFSET
+    OFFSET.clear()
+    fn = cache(function_with_args, max_items=2, policy='fifo', backend='shared', cache_path=tmp_path)
+    assert fn(0, 0) == 0
+    assert fn(0, 1) == 1
+    assert fn(0, 2) == 2 # (0, 0) should be evicted
+    assert len(list(tmp_path.glob('*/*'))) == 2
+    assert fn(0, 0) == 1
+
+def test_shared_cache_ttl(tmp_path):
+    global OFFSET
+    OFFSET.clear()
+    fn = cache(function_with_args, ttl=0.1, backend='shared', cache_path=tmp_path)
+    assert fn(0, 0) == 0
+    time.sleep(0.2)
+    state._memoize_cache.clear()
+    assert fn(0, 0) == 1
+
+def test_cache_invalid_backend():
+    with pytest.raises(ValueError):
+        cache(function_with_args, backend='foo')
+
+def test_cache_single_flight():
+    calls = []
+    release = threading.Event()
+
+    @cache(single_flight=True)
+    def load(a):
+        calls.append(a)
+        release.wait(5)
+        return a * 2
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(load, 1) for _ in range(4)]
+        while load.stats()['coalesced'] < 3:
+            time.sleep(0.01)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert results == [2, 2, 2, 2]
+    assert calls == [1]
+    assert load.stats() == {'hits': 0, 'misses': 1, 'coalesced': 3, 'in_flight': 0}
+    assert load(1) == 2
+    assert load.stats()['hits'] == 1
+
+def test_cache_single_flight_error():
+    release = threading.Event()
+
+    @cache(single_flight=True)
+    def load(a):
+        release.wait(5)
+        raise ValueError('Failed')
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(load, 1) for _ in range(2)]
+        while load.stats()['coalesced'] < 1:
+            time.sleep(0.01)
+        release.set()
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result()
+
+    assert load.stats()['in_flight'] == 0
+
+async def test_async_cache_single_flight():
+    calls = []
+
+    @cache(single_flight=True)
+    async def load(a):
+        calls.append(a)
+        await asyncio.sleep(0.1)
+        return a * 2
+
+    results = await asyncio.gather(*(load(1) for _ in range(4)))
+
+    assert results == [2, 2, 2, 2]
+    assert calls == [1]
+    assert load.stats()['coalesced'] == 3
+
+async def test_async_cache_single_flight_owner_cancelled():
+    calls = []
+
+    @cache(single_flight=True)
+    async def load(a):
+        calls.append(a)
+        await asyncio.sleep(0.2)
+        return a * 2
+
+    owner = asyncio.ensure_future(load(1))
+    await asyncio.sleep(0.05)
+    waiter = asyncio.ensure_future(load(1))
+    await asyncio.sleep(0.05)
+    assert load.stats()['coalesced'] == 1
+    owner.cancel()
+
+    assert await waiter == 2
+    assert owner.cancelled()
+    assert calls == [1, 1]
+    assert load.stats()['in_flight'] == 0
+
+async def test_async_cache_single_flight_waiter_cancelled():
+    @cache(single_flight=True)
+    async def load(a):
+        await asyncio.sleep(0.2)
+        return a * 2
+
+    owner = asyncio.ensure_future(load(1))
+    await asyncio.sleep(0.05)
+    waiter = asyncio.ensure_future(load(1))
+    await asyncio.sleep(0.05)
+    waiter.cancel()
+
+    assert await owner == 2
+    assert waiter.cancelled()
+
+def test_cache_single_flight_owner_interrupted():
+    calls = []
+    release = threading.Event()
+
+    @cache(single_flight=True)
+    def load(a):
+        calls.append(a)
+        if len(calls) == 1:
+            release.wait(5)
+            raise KeyboardInterrupt
+        return a * 2
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        owner = executor.submit(load, 1)
+        while not calls:
+            time.sleep(0.01)
+        waiter = executor.submit(load, 1)
+        while load.stats()['coalesced'] < 1:
+            time.sleep(0.01)
+        release.set()
+        with pytest.raises(KeyboardInterrupt):
+            owner.result()
+        assert waiter.result() == 2
+
+    assert calls == [1, 1]
+    assert load.stats()['in_flight'] == 0
+
 def test_cache_on_undecorated_parameterized_method():
     class Model(param.Parameterized):
         data = param.Parameter(default=1)
@@ -10,14 +10,17 @@ import pytest
 import tornado.locks
 
 from bokeh.document import Document
-from bokeh.document.events import MessageSentEvent
+from bokeh.document.events import MessageSentEvent, ModelChangedEvent
+from bokeh.models import Div
 
 import panel as pn
 
+from panel.config import config
 from panel.io.document import (
-    _UNCONNECTED_EVENTS, _WRITE_BLOCK, _cleanup_doc, _destroy_document,
-    _write_tasks, extra_socket_handlers, hold, schedule_write_events, unlocked,
-    write_events,
+    _DROPPED_UPDATES, _THROTTLED_EVENTS, _UNCONNECTED_EVENTS, _WRITE_BLOCK,
+    _WRITE_EVENTS, _cleanup_doc, _destroy_document, _flush_throttled_events,
+    _throttle_events, _write_tasks, extra_socket_handlers, hold,
+    schedule_write_events, unlocked, write_events,
 )
 from panel.io.state import _state, set_curdoc, state
 from panel.tests.util import serve_and_request, wait_until
@@ -405,3 +408,62 @@ async def test_dispatch_msgs_terminates_on_document_destroy():
         assert ref() is None
     finally:
         extra_socket_handlers.pop(_FakeSocket, None)
+
+
+class _FakeSession:
+    def __init__(self, connections):
+        self._subscribed_connections = connections
+
+
+def test_throttle_events_coalesces_property_updates():
+    doc = Document()
+    div = Div()
+    doc.add_root(div)
+    doc.models.flush_synced()
+    session = _FakeSession([_FakeConn(lock_held=False)])
+
+    def change(attr, value):
+        return ModelChangedEvent(doc, div, attr, value)
+
+    with config.set(max_update_rate=1):
+        first = [change('text', 'A')]
+        assert _throttle_events(doc, session, first) == first
+
+        # Updates within the interval are deferred and coalesced
+        text_b, width, text_c = change('text', 'B'), change('width', 100), change('text', 'C')
+        assert _throttle_events(doc, session, [text_b, width]) == []
+        assert _throttle_events(doc, session, [text_c]) == []
+        pending = _THROTTLED_EVENTS[doc]
+        assert pending == [width, text_c]
+        assert _DROPPED_UPDATES[doc] == 1
+
+        # Other events flush the pending updates ahead of them
+        msg = MessageSentEvent(doc, 'bokeh_event', {})
+        assert _throttle_events(doc, session, [msg]) == [width, text_c, msg]
+        assert doc not in _THROTTLED_EVENTS
+
+    # A stale flush must not write the updates again
+    _flush_throttled_events(doc, session, pending)
+    assert doc not in _WRITE_EVENTS
+
+
+def test_flush_throttled_events_schedules_write():
+    doc = Document()
+    div = Div()
+    doc.add_root(div)
+    doc.models.flush_synced()
+    conn = _FakeConn(lock_held=False)
+    session = _FakeSession([conn])
+
+    with config.set(max_update_rate=1):
+        _throttle_events(doc, session, [ModelChangedEvent(doc, div, 'text', 'A')])
+        event = ModelChangedEvent(doc, div, 'text', 'B')
+        assert _throttle_events(doc, session, [event]) == []
+
+    try:
+        _flush_throttled_events(doc, session, _THROTTLED_EVENTS[doc])
+        assert doc not in _THROTTLED_EVENTS
+        assert _WRITE_EVENTS[doc] == [([conn], [event])]
+    finally:
+        _WRITE_EVENTS.pop(doc, None)
+        _WRITE_BLOCK.pop(doc, None)
@@ -0,0 +1,107 @@
+from io import BytesIO, StringIO
+from weakref import ref
+
+import pytest
+
+from bokeh.document import Document
+
+from panel.io import downloads
+from panel.io.downloads import (
+    CHUNK_SIZE, DOWNLOAD_PATH, Download, DownloadStore, parse_range,
+)
+
+
+@pytest.mark.parametrize(('header', 'expected'), [
+    ('bytes=0-9', (0, 10)),
+    ('bytes=10-', (10, 100)),
+    ('bytes=-10', (90, 100)),
+    ('bytes=90-200', (90, 100)),
+    ('bytes=-200', (0, 100)),
+    ('bytes=100-', None),
+    ('bytes=-0', None),
+    ('bytes=-', (0, 100)),
+    ('bytes=0-1,5-6', (0, 100)),
+    ('items=0-9', (0, 100)),
+])
+def test_parse_range(header, expected):
+    assert parse_range(header, 100) == expected
+
+
+def test_download_path(tmp_path):
+    path = tmp_path / 'data.bin'
+    data = bytes(range(256)) * (CHUNK_SIZE // 128)
+    path.write_bytes(data)
+    download = Download(path, 'data.bin', 'application/octet-stream')
+
+    assert download.size == len(data)
+    assert b''.join(download.iter_chunks()) == data
+    assert b''.join(download.iter_chunks(10, CHUNK_SIZE + 20)) == data[10:CHUNK_SIZE+20]
+
+
+def test_download_file_like():
+    download = Download(BytesIO(b'abcdef'), 'data.bin', 'application/octet-stream')
+
+    assert download.size == 6
+    assert b''.join(download.iter_chunks(2, 4)) == b'cd'
+    assert b''.join(download.iter_chunks(0, 6)) == b'abcdef'
+
+
+def test_download_text_file_like():
+    download = Download(StringIO('abc'), 'data.txt', 'text/plain')
+
+    assert download.size is None
+    assert b''.join(download.iter_chunks()) == b'abc'
+
+
+def test_download_iterator():
+    download = Download((c for c in [b'abc', 'def']), 'data.bin', 'application/octet-stream')
+
+    assert download.size is None
+    assert not download.consumed
+    assert b''.join(download.iter_chunks()) == b'abcdef'
+    assert download.consumed
+
+
+def test_download_store_add():
+    store = DownloadStore()
+    doc = Document()
+    token = store.add(b'abc', 'data.bin', 'application/octet-stream', doc, 'owner')
+
+    assert token in store
+    assert store.get(token).filename == 'data.bin'
+    assert store.url(token, doc) == f'{DOWNLOAD_PATH}{token}'
+
+
+def test_download_store_add_replaces_owner_download():
+    store = DownloadStore()
+    doc = Document()
+    token1 = store.add(b'abc', 'data.bin', 'application/octet-stream', doc, 'owner')
+    token2 = store.add(b'def', 'data.bin', 'application/octet-stream', doc, 'owner')
+
+    assert token1 != token2
+    assert token1 not in store
+    assert token2 in store
+
+
+def test_download_store_expires(monkeypatch):
+    store = DownloadStore()
+    token = store.add(b'abc', 'data.bin', 'application/octet-stream', Document(), 'owner')
+
+    monkeypatch.setattr(downloads, 'DOWNLOAD_TTL', -1)
+    store.get(token)
+
+    assert store.get(token) is None
+    assert token not in store
+
+
+def test_download_store_release_doc():
+    store = DownloadStore()
+    doc = Document()
+    store.add(b'abc', 'data.bin', 'application/octet-stream', doc, 'owner1')
+    store.add(b'def', 'data.bin', 'application/octet-stream', doc, 'owner2')
+
+    assert len(store) == 2
+
+    store._release_doc(ref(doc), None)
+
+    assert len(store) == 0
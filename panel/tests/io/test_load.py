@@ -0,0 +1,49 @@
+import asyncio
+import time
+
+from panel.io.load import (
+    LAG_INTERVAL, LoadMonitor, LoopWatchdog, memory_usage,
+)
+from panel.io.state import state
+from panel.widgets import Button
+
+
+def test_memory_usage():
+    memory = memory_usage()
+    assert memory is None or memory > 0
+
+
+async def test_load_monitor_lag():
+    monitor = LoadMonitor(asyncio.get_running_loop())
+    monitor.start()
+    try:
+        await asyncio.sleep(LAG_INTERVAL * 0.5)
+        time.sleep(LAG_INTERVAL + 0.2)
+        await asyncio.sleep(0.05)
+        assert monitor.lag >= 0.1
+    finally:
+        monitor.stop()
+    assert monitor.lag == 0
+
+
+async def test_loop_watchdog_records_slow_callback():
+    def slow_click(event):
+        time.sleep(0.5)
+
+    button = Button(label='Slow')
+    button.on_click(slow_click)
+
+    watchdog = LoopWatchdog(asyncio.get_running_loop(), 0.1)
+    watchdog.start()
+    try:
+        await asyncio.sleep(0.2)
+        button.clicks += 1
+        await asyncio.sleep(0.3)
+    finally:
+        watchdog.stop()
+
+    stall = state._slow_callbacks.pop()
+    assert stall['callback'] == 'slow_click'
+    assert stall['session'] is None
+    assert stall['duration'] >= 0.4
+    assert 'time.sleep(0.5)' in stall['stack']
@@ -0,0 +1,65 @@
+import gc
+
+from panel.io.metrics import (
+    Counter, Gauge, Histogram, Metrics,
+)
+
+
+def test_counter_expose():
+    counter = Counter('test_total', 'A test counter.', ('app',))
+    counter.inc('/a')
+    counter.inc('/a', value=2)
+    counter.inc('/b')
+
+    assert counter.expose() == [
+        '# HELP test_total A test counter.',
+        '# TYPE test_total counter',
+        'test_total{app="/a"} 3',
+        'test_total{app="/b"} 1',
+    ]
+
+
+def test_gauge_expose_escapes_labels():
+    gauge = Gauge('test', 'A test gauge.', ('app',))
+    gauge.set(4, 'a"b')
+
+    assert gauge.expose()[-1] == 'test{app="a\\"b"} 4'
+
+
+def test_histogram_expose():
+    histogram = Histogram('test_seconds', 'A test histogram.', buckets=(0.1, 1))
+    histogram.observe(0.05)
+    histogram.observe(0.1)
+    histogram.observe(5)
+
+    assert histogram.expose()[2:] == [
+        'test_seconds_bucket{le="0.1"} 2',
+        'test_seconds_bucket{le="1"} 2',
+        'test_seconds_bucket{le="+Inf"} 3',
+        'test_seconds_sum 5.15',
+        'test_seconds_count 3',
+    ]
+
+
+def test_metrics_records_gc_pauses():
+    metrics = Metrics()
+    metrics.enable()
+    try:
+        gc.collect()
+    finally:
+        metrics.disable()
+
+    exposed = metrics.expose({})
+    assert 'panel_gc_duration_seconds_count{generation="2"} 1' in exposed
+    assert '# TYPE panel_sessions_live gauge' in exposed
+
+
+def test_metrics_callback_and_messages():
+    metrics = Metrics()
+    metrics.callback_finished(None, 0.2)
+    metrics.message_written(None, 100, 2)
+
+    exposed = metrics.expose({})
+    assert 'panel_callback_duration_seconds_count{app=""} 1' in exposed
+    assert 'panel_patch_messages_total{app=""} 2' in exposed
+    assert 'panel_patch_message_bytes_total{app=""} 200' in exposed
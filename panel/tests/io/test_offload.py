@@ -0,0 +1,110 @@
+import asyncio
+import sys
+
+from collections import OrderedDict
+from weakref import ref
+
+import numpy as np
+import pytest
+
+from bokeh.document import Document
+
+from panel.io.offload import (
+    _FUTURES, SHARED_MEMORY_THRESHOLD, _cached_function, _cancel_doc,
+    _dumps_function, _loads_function, _release, _share, _SharedArray,
+    _shutdown_pool, _unshare, offload, run_in_process,
+)
+from panel.io.state import set_curdoc
+
+
+def add(a, b):
+    return a + b
+
+
+def scale(array, factor=1):
+    return {'result': array * factor, 'size': array.size}
+
+
+def wait(seconds):
+    import time
+    time.sleep(seconds)
+    return seconds
+
+
+@offload
+def offloaded_add(a, b):
+    return a + b
+
+
+@pytest.fixture(scope='module', autouse=True)
+def process_pool():
+    yield
+    _shutdown_pool()
+
+
+def test_share_large_arrays():
+    array = np.arange(SHARED_MEMORY_THRESHOLD // 8, dtype='float64')
+    small = np.arange(10)
+    blocks = []
+    shared = _share({'a': (array, small), 'b': 1}, blocks)
+
+    assert isinstance(shared['a'][0], _SharedArray)
+    assert shared['a'][1] is small
+    assert shared['b'] == 1
+    assert len(blocks) == 1
+
+    views = []
+    unshared = _unshare(shared, views, copy=True)
+    np.testing.assert_array_equal(unshared['a'][0], array)
+    _release(views)
+    _release(blocks, unlink=True)
+
+
+def test_dumps_decorated_function():
+    func = _loads_function(_dumps_function(offloaded_add.__wrapped__))
+    assert func(1, 2) == 3
+
+
+def test_cached_function_evicts_least_recently_used(monkeypatch):
+    # panel.io.offload resolves to the offload decorator
+    module = sys.modules[_cached_function.__module__]
+    cached = OrderedDict()
+    monkeypatch.setattr(module, 'MAX_FUNCTIONS', 2)
+    monkeypatch.setattr(module, '_FUNCTIONS', cached)
+
+    closures = [_dumps_function(lambda x, i=i: x + i) for i in range(3)]
+    assert _cached_function(closures[0])(1) == 1
+    assert _cached_function(closures[1])(1) == 2
+    first = _cached_function(closures[0])
+    assert _cached_function(closures[2])(1) == 3
+
+    assert len(cached) == 2
+    assert _cached_function(closures[0]) is first
+    assert all(len(key) == 32 for key in cached)
+
+
+async def test_run_in_process():
+    assert await run_in_process(add, 1, b=2) == 3
+
+
+async def test_run_in_process_shared_memory():
+    array = np.random.rand(SHARED_MEMORY_THRESHOLD // 4)
+    result = await run_in_process(scale, array, factor=2)
+
+    np.testing.assert_array_equal(result['result'], array * 2)
+    assert result['size'] == array.size
+
+
+async def test_offload_decorator():
+    assert await offloaded_add(1, 2) == 3
+
+
+async def test_run_in_process_cancelled_on_session_destroyed():
+    doc = Document()
+    with set_curdoc(doc):
+        task = asyncio.create_task(run_in_process(wait, 1))
+    while doc not in _FUTURES or not _FUTURES[doc]:
+        await asyncio.sleep(0.01)
+    _cancel_doc(ref(doc), None)
+    with pytest.raises(asyncio.CancelledError):
+        await task
@@ -2,7 +2,12 @@ import time
 
 from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
+import pytest
+
+from panel.config import config
 from panel.io.state import state
+from panel.tests.util import async_wait_until, wait_until
 
 
 def test_as_cached_key_only():
@@ -46,3 +51,83 @@ def test_as_cached_ttl():
     assert state.as_cached('test', test_fn, ttl=0.1) == 1
     time.sleep(0.11)
     assert state.as_cached('test', test_fn, ttl=0.1) == 2
+
+def test_as_cached_shared(tmp_path):
+    calls = []
+
+    def test_fn(n):
+        calls.append(n)
+        return np.arange(n)
+
+    with config.set(cache_shared_path=str(tmp_path)):
+        value = state.as_cached('shared', test_fn, backend='shared', n=10)
+        np.testing.assert_array_equal(value, np.arange(10))
+        assert not value.flags.writeable
+        # Emulate another process attaching to the shared value
+        state.cache.clear()
+        value = state.as_cached('shared', test_fn, backend='shared', n=10)
+        np.testing.assert_array_equal(value, np.arange(10))
+    assert calls == [10]
+    assert len(list(tmp_path.glob('as_cached/*'))) == 1
+
+def test_as_cached_stale_while_revalidate(threads):
+    calls = []
+
+    def test_fn():
+        calls.append(len(calls)+1)
+        time.sleep(0.1)
+        return calls[-1]
+
+    assert state.as_cached('test', test_fn, ttl=0.1, stale_while_revalidate=True) == 1
+    time.sleep(0.15)
+    start = time.monotonic()
+    for _ in range(3):
+        # The stale value is returned while a single refresh runs
+        assert state.as_cached('test', test_fn, ttl=0.1, stale_while_revalidate=True) == 1
+    assert time.monotonic() - start < 0.1
+    wait_until(lambda: state.as_cached('test', test_fn, ttl=0.1, stale_while_revalidate=True) == 2)
+    assert calls == [1, 2]
+
+def test_as_cached_stale_while_revalidate_without_executor():
+    def test_fn(i=[0]):
+        i[0] += 1
+        return i[0]
+
+    assert state.as_cached('test', test_fn, ttl=0.1, stale_while_revalidate=True) == 1
+    time.sleep(0.11)
+    assert state.as_cached('test', test_fn, ttl=0.1, stale_while_revalidate=True) == 2
+
+@pytest.mark.asyncio
+async def test_as_cached_refresh():
+    calls = []
+
+    def test_fn():
+        calls.append(len(calls)+1)
+        return calls[-1]
+
+    assert state.as_cached('test', test_fn, ttl=0.2, refresh=True) == 1
+    await async_wait_until(lambda: len(calls) > 2)
+    # The value is refreshed before it expires so it is never recomputed on access
+    assert state.cache[('test',)][1] > time.monotonic()
+    state.cache.clear()
+    await async_wait_until(lambda: not any('panel.as_cached:test' in k for k in state._scheduled))
+
+def test_as_cached_max_bytes():
+    def test_fn(n, i=[0]):
+        i[0] += 1
+        return bytes(n)
+
+    with config.set(cache_max_bytes=2500):
+        state.as_cached('a', test_fn, n=1000)
+        state.as_cached('b', test_fn, n=1000)
+        state.as_cached('a', test_fn, n=1000)
+        state.as_cached('c', test_fn, n=1000)
+        # Least recently used value is evicted
+        assert ('b', ('n', 1000)) not in state.cache
+        assert ('a', ('n', 1000)) in state.cache
+        assert ('c', ('n', 1000)) in state.cache
+
+        # Values exceeding the budget are not cached
+        state.as_cached('d', test_fn, n=5000)
+        assert ('d', ('n', 5000)) not in state.cache
+
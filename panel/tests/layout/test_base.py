@@ -4,6 +4,7 @@ import typing as t
 import param
 import pytest
 
+from bokeh.document.events import MessageSentEvent, ModelChangedEvent
 from bokeh.models import Column as BkColumn, Div, Row as BkRow
 
 from panel.chat import ChatInterface
@@ -11,7 +12,8 @@ from panel.config import config
 from panel.layout import (
     Accordion, Card, Column, FlexBox, Row, Spacer, Tabs, WidgetBox,
 )
-from panel.layout.base import ListPanel, NamedListPanel
+from panel.layout.base import ListPanel, NamedListPanel, diff_children
+from panel.models.layout import ChildrenPatchEvent
 from panel.pane import Bokeh, Markdown
 from panel.param import Param
 from panel.tests.util import check_layoutable_properties
@@ -800,3 +802,64 @@ def test_compute_sizing_mode_inference_downgrade_does_not_warn(document, comm, c
 
     assert root.sizing_mode == 'stretch_both'
     assert 'being overridden' not in caplog.text
+
+
+@pytest.mark.parametrize('op, expected', [
+    (lambda l: l.append('X'), [('insert', 10, ['X'])]),
+    (lambda l: l.insert(2, 'X'), [('insert', 2, ['X'])]),
+    (lambda l: l.pop(0), [('remove', 0, 1)]),
+    (lambda l: l.__setitem__(slice(1, 3), ['X', 'Y', 'Z']), [('remove', 1, 2), ('insert', 1, ['X', 'Y', 'Z'])]),
+    (lambda l: l.insert(8, l.pop(1)), [('move', 1, 8)]),
+    (lambda l: l.insert(0, l.pop(9)), [('move', 9, 0)]),
+    (lambda l: l.reverse(), None),
+])
+def test_diff_children(op, expected):
+    old = list('ABCDEFGHIJ')
+    new = list(old)
+    op(new)
+    ops = diff_children(old, new)
+    assert ops == expected
+    if ops is None:
+        return
+    for name, index, value in ops:
+        if name == 'remove':
+            del old[index:index+value]
+        elif name == 'insert':
+            old[index:index] = value
+        else:
+            old.insert(value, old.pop(index))
+    assert old == new
+
+def test_column_append_sends_children_patch(document):
+    divs = [Div() for _ in range(10)]
+    layout = Column(*divs)
+    model = layout.get_root(document)
+    document.add_root(model)
+    document.models.flush_synced()
+
+    document.hold()
+    new_div = Div()
+    layout.append(new_div)
+
+    assert model.children == divs + [new_div]
+    events = document.callbacks._held_events
+    assert not any(isinstance(e, ModelChangedEvent) and e.attr == 'children' for e in events)
+    patches = [
+        e.msg_data for e in events
+        if isinstance(e, MessageSentEvent) and isinstance(e.msg_data, ChildrenPatchEvent)
+    ]
+    assert len(patches) == 1
+    assert patches[0].ops == [('insert', 10, [new_div])]
+
+def test_column_replace_objects_sends_children(document):
+    layout = Column(*[Div() for _ in range(10)])
+    model = layout.get_root(document)
+    document.add_root(model)
+    document.models.flush_synced()
+
+    document.hold()
+    layout.objects = [Div() for _ in range(10)]
+
+    events = document.callbacks._held_events
+    assert any(isinstance(e, ModelChangedEvent) and e.attr == 'children' for e in events)
+    assert not any(isinstance(e, MessageSentEvent) for e in events)
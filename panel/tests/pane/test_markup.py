@@ -10,6 +10,7 @@ import pandas as pd
 import pytest
 
 from panel import config
+from panel.io.cache import _RENDER_CACHE
 from panel.pane import (
     HTML, JSON, DataFrame, Markdown, PaneBase, Str,
 )
@@ -39,6 +40,19 @@ async def streamz_df():
         await asyncio.sleep(0.1)
     sdf.loop.asyncio_loop.close()
 
+def test_dataframe_pane_render_cache():
+    df = pd.DataFrame({"A": [1, 2, 3]})
+    html = DataFrame(df)._transform_object(df)
+    hits = _RENDER_CACHE.hits
+
+    assert DataFrame(df.copy())._transform_object(df.copy()) == html
+    assert _RENDER_CACHE.hits == hits + 1
+
+    modified = df.assign(A=[1, 2, 4])
+    assert DataFrame(modified)._transform_object(modified) != html
+    assert DataFrame(df, index=False)._transform_object(df) != html
+    assert _RENDER_CACHE.hits == hits + 1
+
 @not_windows
 @streamz_available
 def test_get_streamz_dataframe_pane_type(streamz_df):
@@ -200,6 +214,82 @@ def test_markdown_pane_markdown_it_renderer_partial_links(document, comm):
     pane.object = "[Test](http://google.com)"
     assert model.text == '&lt;p&gt;&lt;a href=&quot;http://google.com&quot;&gt;Test&lt;/a&gt;&lt;/p&gt;\n'
 
+STREAMED_MARKDOWN = """# Title
+
+Some *text* that
+continues.
+
+- item 1
+- item 2
+
+  nested paragraph
+
+```python
+x = 1
+
+y = 2
+```
+
+<!-- comment
+
+continued -->
+
+Term
+
+: definition
+
+    indented code
+
+    more code
+
+# Title
+
+Final paragraph.
+"""
+
+@pytest.mark.parametrize('step', [1, 5])
+def test_markdown_pane_streaming_renders_incrementally(step):
+    pane = Markdown(enable_streaming=True)
+    reference = Markdown()
+
+    for i in range(0, len(STREAMED_MARKDOWN)+step, step):
+        text = STREAMED_MARKDOWN[:i]
+        assert pane._transform_object(text) == reference._transform_object(text)
+
+def test_markdown_pane_streaming_caches_complete_blocks():
+    pane = Markdown(enable_streaming=True)
+
+    pane._transform_object("# Title\n\nParagraph\n\n- item\n\nText\n\n```\na\n\nb")
+
+    assert pane._stream_cache[1] == "# Title\n\nParagraph\n\n- item\n\nText\n\n"
+
+def test_markdown_pane_streaming_with_definitions():
+    text = "Text with a footnote[^1].\n\n[^1]: The note.\n\nMore text.\n"
+    pane = Markdown(enable_streaming=True)
+
+    assert pane._transform_object(text) == Markdown()._transform_object(text)
+    assert pane._stream_cache is None
+
+@pytest.mark.parametrize('renderer', ['markdown-it', 'markdown'])
+def test_markdown_pane_render_cache(renderer):
+    text = "# Shared render cache\n\nSome *text*"
+    html = Markdown(text, renderer=renderer)._transform_object(text)
+    hits = _RENDER_CACHE.hits
+
+    assert Markdown(text, renderer=renderer)._transform_object(text) == html
+    assert _RENDER_CACHE.hits == hits + 1
+
+    Markdown(text, renderer=renderer, hard_line_break=True)._transform_object(text)
+    assert _RENDER_CACHE.hits == hits + 1
+
+def test_markdown_pane_markdown_it_render_cache_skips_parsing():
+    text = "Text parsed *once*"
+    Markdown(text)._transform_object(text)
+    parser = Markdown._get_parser('markdown-it', (), False, False)
+
+    with patch.object(parser, 'render', side_effect=AssertionError):
+        Markdown(text)._transform_object(text)
+
 def test_markdown_pane_extensions(document, comm):
     pane = Markdown("""
     ```python
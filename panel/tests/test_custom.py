@@ -1,3 +1,5 @@
+from weakref import ref
+
 import numpy as np
 import pandas as pd
 import param
@@ -5,6 +7,7 @@ import param
 from bokeh.plotting import figure
 
 from panel.custom import PyComponent, ReactiveESM
+from panel.io.blobs import BLOB_PATH, blob_store
 from panel.io.state import set_curdoc, state
 from panel.layout import Row
 from panel.pane import Bokeh, Markdown
@@ -278,3 +281,35 @@ def test_esm_python_update_different_from_frontend_is_applied(document, comm):
 
     # The model must reflect the Python update since 'C' != 'B'
     assert model.data.value == 'C'
+
+
+class SharedESM(ReactiveESM):
+
+    _esm = """
+    export function render() {
+      return 'Shared'
+    }
+    """
+
+
+def test_reactive_esm_module_inlined_without_server(document, comm):
+    model = SharedESM().get_root(document, comm)
+
+    assert model.esm == SharedESM._render_esm()
+    assert model.esm_hash is None
+
+
+def test_reactive_esm_module_shared_on_server(server_document, comm, monkeypatch):
+    monkeypatch.setattr(blob_store, 'serving', True)
+    models = [SharedESM().get_root(server_document, comm) for _ in range(3)]
+
+    key = models[0].esm_hash
+    assert key is not None
+    assert all(model.esm_hash == key for model in models)
+    assert all(model.esm == f'{BLOB_PATH}{key}' for model in models)
+    assert blob_store.get(key) == (SharedESM._render_esm().encode('utf-8'), 'text/javascript')
+    assert len(blob_store._owners[server_document]) == 1
+
+    blob_store._release_doc(ref(server_document), None)
+    assert key not in blob_store
+
@@ -3,6 +3,7 @@ import datetime as dt
 import logging
 import os
 import pathlib
+import re
 import time
 import weakref
 
@@ -12,12 +13,15 @@ import param
 import pytest
 import requests
 
+from bokeh.document import Document
 from bokeh.events import ButtonClick
 from packaging.version import Version
 
 from panel.config import config
 from panel.io import state
 from panel.io.application import Application
+from panel.io.downloads import download_store
+from panel.io.metrics import _METRICS
 from panel.io.resources import DIST_DIR, JS_VERSION
 from panel.io.server import (
     _MAX_APP_PATH_CHARS, _MAX_ROUTE_PARAM_VALUE_CHARS, INDEX_HTML, RootHandler,
@@ -27,7 +31,7 @@ from panel.io.server import (
 from panel.layout import Row
 from panel.models import HTML as BkHTML
 from panel.models.tabulator import TableEditEvent
-from panel.pane import Markdown
+from panel.pane import PNG, Markdown
 from panel.param import ParamFunction
 from panel.reactive import ReactiveHTML
 from panel.template import BootstrapTemplate
@@ -705,6 +709,191 @@ def test_server_reuse_sessions(reuse_sessions):
     assert session.token in r1.content.decode('utf-8')
     assert session.token not in r2.content.decode('utf-8')
 
+@pytest.mark.xdist_group(name="server")
+def test_server_session_pool(session_pool):
+    counts = []
+    def app():
+        counts.append(state.curdoc)
+        return '# Pooled'
+
+    port = serve_and_wait(app)
+
+    pool, = state._session_pools.values()
+    key = ('/', (), None)
+    wait_until(lambda: len(pool._sessions.get(key, [])) == 2)
+    pooled = list(pool._sessions[key])
+
+    assert len(counts) == 2
+
+    r = requests.get(f"http://localhost:{port}/")
+
+    assert pool.hits == 1
+    assert pooled[0].token in r.content.decode('utf-8')
+    assert not pooled[0].expiration_blocked
+    wait_until(lambda: len(pool._sessions[key]) == 2)
+    assert len(counts) == 3
+
+
+@pytest.mark.xdist_group(name="server")
+def test_server_session_pool_keyed_by_args(session_pool):
+    args = {}
+    def app():
+        args[state.curdoc] = state.session_args.get('arg', [b''])[0]
+        return '# Pooled'
+
+    port = serve_and_wait(app)
+
+    pool, = state._session_pools.values()
+    key = ('/', (('arg', (b'foo',)),), None)
+
+    requests.get(f"http://localhost:{port}/?arg=foo")
+
+    assert pool.misses == 1
+    wait_until(lambda: len(pool._sessions.get(key, [])) == 2)
+    session = pool._sessions[key][0]
+
+    r = requests.get(f"http://localhost:{port}/?arg=foo")
+
+    assert pool.hits == 1
+    assert pool.hit_rate == 0.5
+    assert session.token in r.content.decode('utf-8')
+    assert args[session.document] == b'foo'
+
+
+@pytest.mark.xdist_group(name="server")
+def test_server_session_pool_omits_request_headers(session_pool):
+    rendered = {}
+    def app():
+        rendered[state.curdoc] = (state.cookies.get('user'), state.headers.get('X-Forwarded-User'))
+        return '# Pooled'
+
+    port = serve_and_wait(app)
+
+    pool, = state._session_pools.values()
+    key = ('/', (('arg', (b'foo',)),), None)
+
+    requests.get(
+        f"http://localhost:{port}/?arg=foo", cookies={'user': 'A'},
+        headers={'X-Forwarded-User': 'A'}
+    )
+
+    wait_until(lambda: len(pool._sessions.get(key, [])) == 2)
+    session = pool._sessions[key][0]
+
+    assert rendered[session.document] == (None, None)
+
+    requests.get(
+        f"http://localhost:{port}/?arg=foo", cookies={'user': 'B'},
+        headers={'X-Forwarded-User': 'B'}
+    )
+
+    assert pool.hits == 1
+    request = session.document.session_context.request
+    assert request.cookies['user'] == 'B'
+    assert request.headers['X-Forwarded-User'] == 'B'
+
+
+@pytest.mark.xdist_group(name="server")
+def test_server_max_sessions_refused():
+    port = serve_and_wait(Markdown('# Admitted'))
+
+    with config.set(max_sessions=0):
+        r = requests.get(f"http://localhost:{port}/")
+
+    assert r.status_code == 503
+    assert r.headers['Retry-After'] == '5'
+    assert 'Admitted' not in r.content.decode('utf-8')
+
+
+@pytest.mark.xdist_group(name="server")
+def test_server_max_sessions_waiting_room():
+    port = serve_and_wait(Markdown('# Admitted'))
+
+    with config.set(max_sessions=0, waiting_room=True):
+        r = requests.get(f"http://localhost:{port}/")
+
+    assert r.status_code == 503
+    assert 'http-equiv="refresh"' in r.content.decode('utf-8')
+    assert 'Server Busy' in r.content.decode('utf-8')
+
+
+@pytest.mark.xdist_group(name="server")
+def test_server_max_sessions_excludes_pooled_sessions(session_pool):
+    port = serve_and_wait(Markdown('# Admitted'))
+
+    pool, = state._session_pools.values()
+    key = ('/', (), None)
+    wait_until(lambda: len(pool._sessions.get(key, [])) == 2)
+
+    with config.set(max_sessions=1):
+        r = requests.get(f"http://localhost:{port}/")
+
+        assert r.status_code == 200
+        assert pool.hits == 1
+        wait_until(lambda: len(pool._sessions[key]) == 2)
+
+        r = requests.get(f"http://localhost:{port}/")
+
+    assert r.status_code == 503
+    assert pool.hits == 1
+
+
+@pytest.mark.xdist_group(name="server")
+def test_server_liveness_reports_load():
+    port = serve_and_wait(Markdown('# Admitted'))
+
+    r = requests.get(f"http://localhost:{port}/liveness")
+    assert r.status_code == 200
+    response = r.json()
+    assert response['ready']
+    assert set(response['load']) == {'sessions', 'loop_lag', 'thread_queue', 'memory'}
+
+    with config.set(max_sessions=0):
+        assert not requests.get(f"http://localhost:{port}/liveness").json()['ready']
+        r = requests.get(f"http://localhost:{port}/liveness?ready")
+
+    assert r.status_code == 503
+
+
+@pytest.mark.xdist_group(name="server")
+def test_server_slow_callback_recorded():
+    docs = []
+
+    def slow_periodic():
+        time.sleep(0.5)
+
+    def app():
+        docs.append(state.curdoc)
+        state.add_periodic_callback(slow_periodic, period=100, count=1)
+        return Markdown('# Slow')
+
+    with config.set(slow_callback_threshold=0.1):
+        serve_and_request(app)
+
+        wait_until(lambda: any(
+            stall['callback'] == 'slow_periodic' for stall in state._slow_callbacks
+        ))
+
+    stall = state._slow_callbacks.pop()
+    assert stall['session'] == id(docs[0])
+    assert stall['duration'] >= 0.4
+
+
+@pytest.mark.xdist_group(name="server")
+def test_server_metrics():
+    try:
+        port = serve_and_wait({'metrics_app': Markdown('# Metrics')}, metrics=True)
+        requests.get(f"http://localhost:{port}/metrics_app")
+        r = requests.get(f"http://localhost:{port}/metrics")
+    finally:
+        _METRICS.disable()
+
+    assert r.status_code == 200
+    assert r.headers['Content-Type'].startswith('text/plain; version=0.0.4')
+    assert 'panel_sessions_created_total{app="/metrics_app"} 1' in r.text
+    assert 'panel_sessions_live{app="/metrics_app"} 1' in r.text
+
+
 def test_server_session_args(port, server_implementation):
     session_args = []
     def app():
@@ -1665,6 +1854,75 @@ def test_server_component_custom_resources(port):
         assert f.read() == r.content.decode('utf-8').replace('\r\n', '\n')
 
 
+def test_server_image_blob(port):
+    png = PNG(pathlib.Path(__file__).parent / 'test_data' / 'logo.png')
+
+    r = serve_and_request(png, port=port)
+
+    wait_until(lambda: len(png._models) == 1)
+    (model, _), = png._models.values()
+    match = re.search(r'blobs/([0-9a-f]+)', model.text)
+    assert match is not None
+    key = match.group(1)
+
+    r = requests.get(f"http://localhost:{port}/blobs/{key}")
+    assert r.status_code == 200
+    assert r.headers['Content-Type'] == 'image/png'
+    assert 'immutable' in r.headers['Cache-Control']
+    assert r.content == png._data(png.object)
+
+    r = requests.get(f"http://localhost:{port}/blobs/{key}", headers={'If-None-Match': f'"{key}"'})
+    assert r.status_code == 304
+
+    r = requests.get(f"http://localhost:{port}/blobs/{'0'*32}")
+    assert r.status_code == 404
+
+
+def test_server_download(port, tmp_path):
+    path = tmp_path / 'data.bin'
+    data = bytes(range(256)) * 100
+    path.write_bytes(data)
+
+    serve_and_wait(Markdown('Download'), port=port)
+
+    token = download_store.add(path, 'data.bin', 'application/octet-stream', Document(), 'owner')
+    url = f"http://localhost:{port}/downloads/{token}"
+
+    r = requests.get(url)
+    assert r.status_code == 200
+    assert r.content == data
+    assert r.headers['Content-Length'] == str(len(data))
+    assert r.headers['Accept-Ranges'] == 'bytes'
+    assert r.headers['Content-Disposition'] == "attachment; filename*=UTF-8''data.bin"
+
+    r = requests.get(url, headers={'Range': 'bytes=100-199'})
+    assert r.status_code == 206
+    assert r.content == data[100:200]
+    assert r.headers['Content-Range'] == f'bytes 100-199/{len(data)}'
+
+    r = requests.get(url, headers={'Range': f'bytes={len(data)}-'})
+    assert r.status_code == 416
+
+    r = requests.get(f"http://localhost:{port}/downloads/unknown")
+    assert r.status_code == 404
+
+
+def test_server_download_iterator(port):
+    serve_and_wait(Markdown('Download'), port=port)
+
+    chunks = (bytes([i]) * 10 for i in range(10))
+    token = download_store.add(chunks, 'data.bin', 'application/octet-stream', Document(), 'owner')
+    url = f"http://localhost:{port}/downloads/{token}"
+
+    r = requests.get(url)
+    assert r.status_code == 200
+    assert r.content == b''.join(bytes([i]) * 10 for i in range(10))
+    assert r.headers['Transfer-Encoding'] == 'chunked'
+
+    r = requests.get(url)
+    assert r.status_code == 404
+
+
 def test_server_component_custom_resources_with_prefix(port):
     component = CustomComponent()
 
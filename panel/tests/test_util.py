@@ -1,5 +1,7 @@
 from collections import OrderedDict
 
+import numpy as np
+import pandas as pd
 import param
 
 from bokeh.models import Div
@@ -12,6 +14,7 @@ from panel.util import (
     abbreviated_repr, extract_dependencies, get_method_owner, parse_query,
     styler_update,
 )
+from panel.util.ringbuffer import StreamBuffer
 
 
 def test_get_method_owner_class():
@@ -126,3 +129,40 @@ def test_styler_update(dataframe):
         (2, 0): [('background-color', '#67000d'), ('color', '#f1f1f1')],
         (2, 1): [('background-color', '#67000d'), ('color', '#f1f1f1')]
     }
+
+
+def test_stream_buffer_dataframe_rollover():
+    df = pd.DataFrame({'x': [0., 1, 2], 'y': ['a', 'b', 'c']})
+    buffer = StreamBuffer(df)
+    expected = df
+    for i in range(3, 30):
+        chunk = pd.DataFrame({'x': [float(i)], 'y': [str(i)]}, index=[i])
+        assert buffer.append(chunk, rollover=5)
+        expected = pd.concat([expected, chunk]).iloc[-5:]
+        pd.testing.assert_frame_equal(buffer.data, expected, check_index_type=False)
+
+
+def test_stream_buffer_dataframe_is_view():
+    df = pd.DataFrame({'x': np.arange(10.)})
+    buffer = StreamBuffer(df)
+    buffer.append(pd.DataFrame({'x': [10.]}, index=[10]), rollover=10)
+    assert len(buffer) == 10
+    assert np.shares_memory(buffer.data['x'].to_numpy(), buffer._arrays[0])
+
+
+def test_stream_buffer_previous_view_unchanged():
+    buffer = StreamBuffer({'x': np.arange(3)})
+    views = []
+    for i in range(3, 50):
+        views.append((i, buffer.data))
+        assert buffer.append({'x': [i]}, rollover=4)
+    for i, view in views:
+        np.testing.assert_array_equal(view['x'], np.arange(max(i-4, 0), i))
+
+
+def test_stream_buffer_incompatible_chunk():
+    buffer = StreamBuffer(pd.DataFrame({'x': [0, 1]}))
+    assert not buffer.append(pd.DataFrame({'x': [0.5]}, index=[2]))
+    assert not buffer.append(pd.DataFrame({'y': [2]}, index=[2]))
+    assert buffer.append(pd.DataFrame({'x': [2]}, index=[2]))
+    assert buffer.data['x'].tolist() == [0, 1, 2]
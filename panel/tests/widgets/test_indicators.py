@@ -1,7 +1,8 @@
+import numpy as np
 import pytest
 
 from panel.widgets.indicators import (
-    Dial, Gauge, Number, Tqdm,
+    Dial, Gauge, Number, Tqdm, Trend,
 )
 
 
@@ -170,3 +171,16 @@ def test_tqdm_color():
     for _ in tqdm(range(2)):
         pass
     assert tqdm.text_pane.styles["color"]=="green"
+
+
+def test_trend_stream_buffer(document, comm):
+    trend = Trend(data={'x': np.arange(5), 'y': np.arange(5.)}, stream_buffer=True)
+
+    model = trend.get_root(document, comm)
+
+    for i in range(5, 40):
+        trend.stream({'x': [i], 'y': [float(i)]}, rollover=10)
+
+    np.testing.assert_array_equal(trend.data['x'], np.arange(30, 40))
+    np.testing.assert_array_equal(model.source.data['y'], np.arange(30., 40))
+    assert model.value == 39
@@ -8,10 +8,12 @@ import pytest
 from bokeh.models.widgets import FileInput as BkFileInput
 
 from panel import config
+from panel.models.file_dropper import DeleteEvent, UploadEvent
 from panel.widgets import (
     ArrayInput, Checkbox, DatePicker, DateRangePicker, DatetimeInput,
-    DatetimePicker, DatetimeRangeInput, DatetimeRangePicker, FileInput,
-    FloatInput, IntInput, LiteralInput, StaticText, TextInput, TimePicker,
+    DatetimePicker, DatetimeRangeInput, DatetimeRangePicker, FileDropper,
+    FileInput, FloatInput, IntInput, LiteralInput, StaticText, TextInput,
+    TimePicker,
 )
 
 
@@ -484,6 +486,50 @@ def test_file_input_save_one_file(document, comm, tmpdir):
     content = fpath.read_text()
     assert content == 'Some text\n'
 
+def _upload_events(name, chunks, mime_type='application/octet-stream'):
+    return [
+        UploadEvent(model=None, data={
+            'name': name, 'type': mime_type, 'data': chunk,
+            'chunk': i, 'total_chunks': len(chunks)
+        }) for i, chunk in enumerate(chunks, start=1)
+    ]
+
+def test_file_dropper_upload():
+    file_dropper = FileDropper()
+
+    for event in _upload_events('test.txt', [b'Some ', b'text'], 'text/plain'):
+        file_dropper._process_event(event)
+
+    assert file_dropper.value == {'test.txt': 'Some text'}
+    assert file_dropper.mime_type == {'test.txt': 'text/plain'}
+
+def test_file_dropper_upload_spooled():
+    file_dropper = FileDropper(spool_size=4)
+
+    for event in _upload_events('test.bin', [b'abc', b'def']):
+        file_dropper._process_event(event)
+
+    file = file_dropper.value['test.bin']
+    assert file.read() == b'abcdef'
+    assert file._rolled
+    assert file_dropper._file_buffer == {}
+
+    file_dropper._process_event(DeleteEvent(model=None, data={'name': 'test.bin'}))
+    assert file.closed
+    assert file_dropper.value == {}
+
+def test_file_dropper_on_chunk():
+    file_dropper = FileDropper()
+    chunks = []
+    file_dropper.on_chunk(lambda event: chunks.append(event.data['data']))
+
+    for event in _upload_events('test.bin', [b'abc', b'def']):
+        file_dropper._process_event(event)
+
+    assert chunks == [b'abc', b'def']
+    assert file_dropper.value == {'test.bin': None}
+    assert file_dropper._file_buffer == {}
+
 def test_int_input_placeholder(document, comm):
 
     int_input = IntInput(placeholder='Foo', label='IntInput')
@@ -2,9 +2,11 @@ import asyncio
 
 from io import StringIO
 from pathlib import Path
+from weakref import ref
 
 import pytest
 
+from panel.io.downloads import DOWNLOAD_PATH, download_store
 from panel.widgets import FileDownload, Progress, __file__ as wfile
 
 
@@ -118,6 +120,34 @@ async def test_file_download_async_callback():
 
     assert file_download.data == "data:application/octet-stream;base64,ZGF0YQ=="
 
+def test_file_download_served(server_document, monkeypatch):
+    monkeypatch.setattr(download_store, 'serving', True)
+    file_download = FileDownload(__file__)
+
+    file_download._clicks += 1
+
+    assert file_download.data.startswith(DOWNLOAD_PATH)
+    token = file_download.data.split('/')[-1]
+    download = download_store.get(token)
+    assert download.source == Path(__file__)
+    assert download.filename == Path(__file__).name
+
+    file_download.embed = True
+    assert file_download.data.startswith('data:')
+
+    download_store._release_doc(ref(server_document), None)
+    assert token not in download_store
+
+def test_file_download_generator_callback():
+    def cb():
+        yield b'da'
+        yield 'ta'
+
+    file_download = FileDownload(callback=cb, filename="abc.py")
+    file_download._clicks += 1
+
+    assert file_download.data == "data:application/octet-stream;base64,ZGF0YQ=="
+
 def test_file_download_transfers():
     file_download = FileDownload(__file__, embed=True)
     assert file_download._transfers == 1
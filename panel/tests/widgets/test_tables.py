@@ -21,7 +21,9 @@ from packaging.version import Version
 
 from panel.depends import bind
 from panel.io.state import set_curdoc
-from panel.models.tabulator import CellClickEvent, TableEditEvent
+from panel.models.tabulator import (
+    CellClickEvent, SelectionEvent, TableEditEvent,
+)
 from panel.tests.util import (
     async_wait_until, mpl_available, serve_and_request, wait_until,
 )
@@ -1356,6 +1358,221 @@ def test_tabulator_pagination_selectable_rows(document, comm):
 
     assert model.selectable_rows == [3]
 
+def test_tabulator_pagination_remote_caches_view(document, comm):
+    df = pd.DataFrame({'x': np.arange(10) % 3, 'y': np.arange(10)})
+    table = Tabulator(df, pagination='remote', page_size=2, sorters=[{'field': 'x', 'dir': 'desc'}])
+    table.add_filter((1, 2), 'x')
+
+    model = table.get_root(document, comm)
+
+    view = table._processed
+    expected = df[df.x >= 1].sort_values('x', ascending=False, kind='stable')
+    pd.testing.assert_frame_equal(view, expected, check_column_type=False)
+
+    table.page = 2
+
+    assert table._processed is view
+    np.testing.assert_array_equal(model.source.data['y'], expected.y.values[2:4])
+
+    table.sorters = [{'field': 'y', 'dir': 'desc'}]
+
+    assert table._processed is not view
+    np.testing.assert_array_equal(table._processed.y, [8, 7, 5, 4, 2, 1])
+
+def test_tabulator_pagination_remote_sort_ties_keep_order(document, comm):
+    df = pd.DataFrame({'x': ['b', 'A', 'a', 'B'] * 5, 'y': np.arange(20)})
+    table = Tabulator(df, pagination='remote', page_size=5, sorters=[{'field': 'x', 'dir': 'asc'}])
+
+    table.get_root(document, comm)
+
+    np.testing.assert_array_equal(
+        table.current_view.y, [1, 2, 5, 6, 9, 10, 13, 14, 17, 18, 0, 3, 4, 7, 8, 11, 12, 15, 16, 19]
+    )
+
+def test_tabulator_pagination_remote_edit_updates_view(document, comm):
+    df = pd.DataFrame({'x': np.arange(10), 'y': np.arange(10)})
+    table = Tabulator(df, pagination='remote', page_size=2, sorters=[{'field': 'x', 'dir': 'desc'}])
+
+    model = table.get_root(document, comm)
+
+    view = table._processed
+    model.source.data = dict(model.source.data, y=np.array([-1, 8]))
+    table.page = 2
+
+    assert table._processed is view
+    assert table.value.y[9] == -1
+    assert view.y.iloc[0] == -1
+
+def test_tabulator_pagination_remote_inplace_change_invalidates_view(document, comm):
+    df = pd.DataFrame({'x': np.arange(10), 'y': np.arange(10)})
+    table = Tabulator(df, pagination='remote', page_size=2, sorters=[{'field': 'x', 'dir': 'desc'}])
+
+    table.get_root(document, comm)
+
+    table.value.loc[0, 'x'] = 20
+    table.param.trigger('value')
+
+    assert table._processed.index[0] == 0
+
+@pytest.mark.parametrize('sorters', [[], [{'field': 'x', 'dir': 'desc'}]])
+@pytest.mark.parametrize('rollover', [None, 6])
+def test_tabulator_pagination_remote_stream_updates_view(sorters, rollover, document, comm):
+    df = pd.DataFrame({'x': [3, 1, 2, 0], 'y': np.arange(4)})
+    table = Tabulator(df, pagination='remote', page_size=2, sorters=sorters)
+    table.add_filter((1, None), 'x')
+
+    table.get_root(document, comm)
+
+    calls = []
+    compute = table._compute_view
+    table._compute_view = lambda df, rows=None: calls.append(rows) or compute(df, rows)
+    table.stream(pd.DataFrame({'x': [4, 0, 1], 'y': [4, 5, 6]}), rollover=rollover)
+
+    # Only the streamed rows were filtered
+    assert len(calls) == 1
+    np.testing.assert_array_equal(calls[0], np.arange(len(table.value)-3, len(table.value)))
+
+    expected = table.value[table.value.x >= 1]
+    if sorters:
+        expected = expected.sort_values('x', ascending=False, kind='stable')
+    pd.testing.assert_frame_equal(table._processed, expected, check_column_type=False)
+
+LAZY_DF = pd.DataFrame({
+    'x': np.arange(50) % 7,
+    'y': np.arange(50),
+    's': [f'S{i}' if i % 2 else f's{i}' for i in range(50)]
+})
+
+@pytest.fixture(params=['narwhals', 'polars', 'duckdb'])
+def lazy_frame(request):
+    if request.param == 'narwhals':
+        import narwhals.stable.v2 as nw
+        return nw.from_native(LAZY_DF).lazy()
+    elif request.param == 'polars':
+        pl = pytest.importorskip('polars')
+        return pl.LazyFrame(LAZY_DF.to_dict('list'))
+    duckdb = pytest.importorskip('duckdb')
+    return duckdb.from_df(LAZY_DF)
+
+def test_tabulator_lazy_frame(lazy_frame, document, comm):
+    table = Tabulator(lazy_frame, page_size=5)
+
+    model = table.get_root(document, comm)
+
+    assert table.pagination == 'remote'
+    assert table.indexes == []
+    assert model.max_page == 10
+    assert not model.editable
+    assert 'index' in model.hidden_columns
+    assert [c.field for c in model.columns] == ['x', 'y', 's']
+    assert len(table._processed) == 5
+    np.testing.assert_array_equal(model.source.data['y'], np.arange(5))
+
+    table.page = 3
+
+    np.testing.assert_array_equal(model.source.data['y'], np.arange(10, 15))
+
+def test_tabulator_lazy_frame_filters_and_sorters(lazy_frame, document, comm):
+    table = Tabulator(lazy_frame, page_size=4, sorters=[{'field': 's', 'dir': 'desc'}])
+    table.add_filter((2, 4), 'x')
+    table.add_filter([1, 2, 3, 9, 10, 11, 44, 45, 46], 'y')
+
+    model = table.get_root(document, comm)
+
+    expected = LAZY_DF[LAZY_DF.x.between(2, 4) & LAZY_DF.y.isin([1, 2, 3, 9, 10, 11, 44, 45, 46])]
+    expected = expected.sort_values('s', ascending=False, key=lambda s: s.str.lower())
+    assert table._length == len(expected) == 8
+    assert model.max_page == 2
+    assert list(model.source.data['s']) == list(expected.s[:4])
+
+    table.page = 2
+
+    assert list(model.source.data['s']) == list(expected.s[4:])
+
+    table.page = 1
+    table.filters = [{'field': 'y', 'type': '>=', 'value': '10'}]
+
+    assert table._length == 5
+    assert list(model.source.data['y']) == [46, 45, 44, 11]
+
+def test_tabulator_lazy_frame_header_filter_like(lazy_frame, document, comm):
+    table = Tabulator(lazy_frame, page_size=10, header_filters=True)
+
+    model = table.get_root(document, comm)
+
+    table.filters = [{'field': 's', 'type': 'like', 'value': 's4'}]
+
+    assert table._length == 11
+    assert list(model.source.data['y']) == [4] + list(range(40, 49))
+
+def test_tabulator_lazy_frame_caches_view(lazy_frame, document, comm):
+    table = Tabulator(lazy_frame, page_size=5)
+    lazy = table._get_lazy()
+    counts = []
+    count = lazy.count
+    lazy.count = lambda frame: counts.append(frame) or count(frame)
+    table.add_filter(3, 'x')
+
+    table.get_root(document, comm)
+    table.page = 2
+
+    assert len(counts) == 1
+    assert table._length == 7
+
+    table.sorters = [{'field': 'y', 'dir': 'desc'}]
+
+    assert len(counts) == 2
+    assert list(table._processed.y) == [10, 3]
+
+def test_tabulator_lazy_frame_selection(lazy_frame, document, comm):
+    table = Tabulator(lazy_frame, page_size=5, sorters=[{'field': 'y', 'dir': 'desc'}])
+
+    model = table.get_root(document, comm)
+
+    table.selection = [1, 7]
+
+    assert model.source.selected.indices == [1]
+    assert list(table.selected_dataframe.y) == [48, 42]
+
+    table.page = 2
+    table._process_event(
+        SelectionEvent(model=model, indices=[0], selected=True, flush=False)
+    )
+
+    assert table.selection == [1, 7, 5]
+    assert list(table.selected_dataframe.y) == [48, 42, 44]
+
+def test_tabulator_lazy_frame_current_view(lazy_frame, document, comm):
+    table = Tabulator(lazy_frame, page_size=5)
+    table.add_filter(3, 'x')
+
+    view = table.current_view
+
+    assert type(view) is type(lazy_frame)
+
+def test_tabulator_lazy_frame_click_event(lazy_frame, document, comm):
+    table = Tabulator(lazy_frame, page_size=5)
+    events = []
+    table.on_click(events.append)
+
+    model = table.get_root(document, comm)
+    table.page = 2
+    table._process_event(CellClickEvent(model=model, column='s', row=1))
+
+    assert len(events) == 1
+    assert events[0].row == 6
+    assert events[0].value == 's6'
+
+def test_tabulator_lazy_frame_stream_not_supported(lazy_frame):
+    table = Tabulator(lazy_frame)
+
+    with pytest.raises(ValueError, match='Streaming to a lazy DataFrame'):
+        table.stream({'x': [1], 'y': [1], 's': ['a']})
+
+def test_tabulator_lazy_frame_requires_remote_pagination(lazy_frame):
+    with pytest.raises(ValueError, match="pagination='remote'"):
+        Tabulator(lazy_frame, pagination='local')
+
 @pd_old
 def test_tabulator_styling(document, comm):
     df = makeMixedDataFrame()
@@ -1528,6 +1745,45 @@ def test_tabulator_stream_dict_rollover(document, comm):
         np.testing.assert_array_equal(values, expected[col])
 
 
+@pytest.mark.parametrize('rollover', [None, 4, 7])
+def test_tabulator_stream_buffer(rollover, document, comm):
+    table = Tabulator(makeMixedDataFrame())
+    buffered = Tabulator(makeMixedDataFrame(), stream_buffer=True)
+
+    model = table.get_root(document, comm)
+    buffered_model = buffered.get_root(document, comm)
+
+    for i in range(10):
+        for t in (table, buffered):
+            t.stream(pd.DataFrame({
+                'A': [float(i)], 'B': [1.], 'C': [f'bar{i}'],
+                'D': [pd.Timestamp('2010-01-01')+pd.Timedelta(days=i)]
+            }), rollover=rollover)
+            t.stream(pd.Series({
+                'A': 10.+i, 'B': 0., 'C': 'series', 'D': pd.Timestamp('2011-01-01')
+            }), rollover=rollover)
+            t.stream({
+                'A': [20.+i], 'B': [0.], 'C': ['dict'], 'D': [pd.Timestamp('2012-01-01')]
+            }, rollover=rollover)
+
+    assert buffered._stream_buffer is not None
+    assert buffered._stream_buffer.holds(buffered.value)
+    pd.testing.assert_frame_equal(buffered.value, table.value, check_index_type=False)
+    for col, values in model.source.data.items():
+        np.testing.assert_array_equal(buffered_model.source.data[col], values)
+
+def test_tabulator_stream_buffer_patch(document, comm):
+    table = Tabulator(makeMixedDataFrame(), stream_buffer=True)
+
+    model = table.get_root(document, comm)
+
+    table.stream({'A': [5.], 'B': [1.], 'C': ['foo6'], 'D': [pd.Timestamp('2009-01-08')]}, rollover=5)
+    table.patch({'C': [(5, 'patched')]})
+    table.stream({'A': [6.], 'B': [0.], 'C': ['foo7'], 'D': [pd.Timestamp('2009-01-09')]}, rollover=5)
+
+    assert table.value['C'].tolist() == ['foo3', 'foo4', 'foo5', 'patched', 'foo7']
+    assert list(model.source.data['C']) == ['foo3', 'foo4', 'foo5', 'patched', 'foo7']
+
 def test_tabulator_patch_scalars(document, comm):
     df = makeMixedDataFrame()
     table = Tabulator(df)
@@ -3056,6 +3312,78 @@ def test_tabulator_styled_df_with_background_gradient(document, comm):
 
     assert list(model.cell_styles['data'][0]) == [2, 4, 5]
 
+def test_tabulator_style_patch_sends_style_diff(document, comm):
+    df = pd.DataFrame({'A': [1, 5, 2, 8], 'B': ['a', 'b', 'c', 'd']})
+    table = Tabulator(df)
+    table.style.map(lambda v: 'color: red' if v > 4 else None, subset=['A'])
+
+    model = table.get_root(document, comm)
+
+    assert model.cell_styles['data'] == {
+        1: {2: [('color', 'red')]},
+        3: {2: [('color', 'red')]}
+    }
+
+    table.patch({'A': [(0, 10), (1, 0)]})
+
+    assert model.cell_styles['type'] == 'patch'
+    assert model.cell_styles['data'] == {
+        0: {2: [('color', 'red')]},
+        1: {}
+    }
+
+def test_tabulator_style_stream_sends_style_diff(document, comm):
+    df = pd.DataFrame({'A': [1, 5, 2, 8], 'B': ['a', 'b', 'c', 'd']})
+    table = Tabulator(df)
+    table.style.map(lambda v: 'color: red' if v > 4 else None, subset=['A'])
+
+    model = table.get_root(document, comm)
+
+    table.stream({'A': [7, 1], 'B': ['e', 'f']})
+
+    assert model.cell_styles['type'] == 'patch'
+    assert model.cell_styles['data'] == {4: {2: [('color', 'red')]}}
+
+def test_tabulator_style_matches_styler(document, comm):
+    df = pd.DataFrame({'A': [1., 5, np.nan, 8], 'B': [3., 1, 2, 4], 'C': list('abcd')})
+    table = Tabulator(df)
+    table.style.map(
+        lambda v: 'color: red' if v > 4 else None, subset=['A']
+    ).apply(
+        lambda row: ['font-weight: bold' if row.A > row.B else '']*len(row), axis=1
+    ).highlight_max(subset=['A', 'B']).bar(subset=['B'])
+
+    model = table.get_root(document, comm)
+
+    styler = df.style
+    styler._todo = table.style._todo
+    styler._compute()
+    expected = {}
+    for (r, c), style in styler.ctx.items():
+        expected.setdefault(r, {})[c+2] = style
+    assert model.cell_styles['data'] == expected
+
+def test_tabulator_style_remote_pagination_only_styles_page(document, comm):
+    calls = []
+    def style(value):
+        calls.append(value)
+        return 'color: red'
+
+    df = pd.DataFrame({'A': np.arange(100)})
+    table = Tabulator(df, pagination='remote', page_size=10)
+    table.style.map(style)
+
+    model = table.get_root(document, comm)
+
+    assert sorted(calls) == list(range(10))
+    assert list(model.cell_styles['data']) == list(range(10))
+
+    calls.clear()
+    table.page = 3
+
+    assert sorted(calls) == list(range(20, 30))
+    assert list(model.cell_styles['data']) == list(range(10))
+
 def test_tabulator_editor_property_change(dataframe, document, comm):
     editor = SelectEditor(options=['A', 'B', 'C'])
     table = Tabulator(dataframe, editors={'str': editor})
@@ -0,0 +1,203 @@
+"""
+A columnar ring buffer which allows components to stream data with
+a rollover without copying all the existing data on every stream.
+"""
+from __future__ import annotations
+
+import sys
+import typing as t
+
+import numpy as np
+
+if t.TYPE_CHECKING:
+    import pandas as pd
+
+    from ..models.reactive_html import DataDict
+
+
+def _capacity(length: int, rollover: int | None) -> int:
+    return 2 * max(length, rollover or 0, 8)
+
+
+class StreamBuffer:
+    """
+    A columnar buffer holding a DataFrame or dictionary of arrays,
+    which streamed chunks are appended to in place.
+
+    Each column is stored in a preallocated array with room for at
+    least as many rows again as are retained. Appending a chunk copies
+    just the chunk into the free space at the end of the arrays and
+    discards rolled over rows by advancing the start of the retained
+    rows, which are therefore always a contiguous slice of the arrays.
+    This allows the buffered data to be a view of the arrays, which
+    is constructed without copying any data. Only once the arrays are
+    full are the retained rows copied into newly allocated arrays,
+    amortizing the cost of each stream to the size of the chunk.
+
+    Rows are only ever written past the end of the retained rows, so
+    previously returned views of the data are never modified.
+    """
+
+    def __init__(self, data: pd.DataFrame | DataDict):
+        self._frame = not isinstance(data, dict)
+        if self._frame:
+            df = t.cast('pd.DataFrame', data)
+            self._columns = df.columns
+            self._dtypes = list(df.dtypes)
+            arrays = [self._to_numpy(column) for _, column in df.items()]
+            self._index_name = df.index.name
+            self._index_dtype = df.index.dtype
+        else:
+            self._columns = list(data)
+            arrays = [np.asarray(data[col]) for col in self._columns]
+        length = len(df) if self._frame else len(arrays[0])
+        self._capacity = _capacity(length, None)
+        self._arrays = [self._allocate(array, length) for array in arrays]
+        if self._frame:
+            self._index = self._allocate(df.index.to_numpy(), length)
+        self._start, self._end = 0, length
+        self._data = self._view()
+
+    @classmethod
+    def supports(cls, data: t.Any) -> bool:
+        """
+        Whether the data can be held by a StreamBuffer.
+        """
+        if isinstance(data, dict):
+            return bool(data) and all(
+                isinstance(v, np.ndarray) and v.ndim == 1 for v in data.values()
+            ) and len({len(v) for v in data.values()}) == 1
+        if 'pandas' not in sys.modules:
+            return False
+        import pandas as pd
+        return (
+            isinstance(data, pd.DataFrame) and
+            not isinstance(data.index, pd.MultiIndex) and
+            isinstance(data.index.dtype, np.dtype)
+        )
+
+    @property
+    def data(self) -> pd.DataFrame | DataDict:
+        """
+        A view of the rows currently held by the buffer.
+        """
+        return self._data
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def _to_numpy(self, series: pd.Series) -> np.ndarray:
+        # Columns with an extension dtype are held as object arrays
+        if isinstance(series.dtype, np.dtype):
+            return series.to_numpy()
+        return series.to_numpy(dtype=object)
+
+    def _allocate(self, array: np.ndarray, length: int, dtype: np.dtype | None = None) -> np.ndarray:
+        buffer = np.empty(self._capacity, dtype=array.dtype if dtype is None else dtype)
+        buffer[:length] = array[len(array)-length:]
+        return buffer
+
+    def _view(self) -> pd.DataFrame | DataDict:
+        start, end = self._start, self._end
+        if not self._frame:
+            return {
+                col: array[start:end] for col, array in zip(self._columns, self._arrays, strict=True)
+            }
+        import pandas as pd
+        columns = {}
+        for i, (array, dtype) in enumerate(zip(self._arrays, self._dtypes, strict=True)):
+            values = array[start:end]
+            columns[i] = values if isinstance(dtype, np.dtype) else pd.array(values, dtype=dtype)
+        index = pd.Index(
+            self._index[start:end], dtype=self._index_dtype, name=self._index_name, copy=False
+        )
+        df = pd.DataFrame(columns, index=index, copy=False)
+        df.columns = self._columns
+        return df
+
+    def _compatible(self, array: np.ndarray, buffer: np.ndarray, dtype: t.Any = None) -> bool:
+        if array.ndim != 1:
+            return False
+        elif dtype is not None and not isinstance(dtype, np.dtype):
+            return True
+        return buffer.dtype.kind == 'O' or np.can_cast(array.dtype, buffer.dtype, 'safe')
+
+    def holds(self, data: t.Any) -> bool:
+        """
+        Whether the data is the current view of the buffer.
+        """
+        if self._frame or not isinstance(data, dict):
+            return data is self._data
+        return list(data) == self._columns and all(
+            data[col] is self._data[col] for col in self._columns
+        )
+
+    def append(self, chunk: pd.DataFrame | DataDict, rollover: int | None = None) -> bool:
+        """
+        Appends the chunk to the buffer, retaining at most `rollover`
+        rows.
+
+        Arguments
+        ---------
+        chunk: pd.DataFrame | dict
+          The rows to append, which must have the same columns as the
+          buffered data.
+        rollover: int | None
+          The maximum number of rows to retain.
+
+        Returns
+        -------
+        Whether the chunk was appended; chunks with other columns or
+        dtypes which cannot be safely cast to the dtypes of the buffer
+        are not appended.
+        """
+        if self._frame:
+            if isinstance(chunk, dict) or not chunk.columns.equals(self._columns):
+                return False
+            if any(
+                not isinstance(old, np.dtype) and new != old
+                for new, old in zip(chunk.dtypes, self._dtypes, strict=True)
+            ):
+                return False
+            arrays = [self._to_numpy(column) for _, column in chunk.items()]
+            index = chunk.index.to_numpy()
+            if not self._compatible(index, self._index):
+                return False
+            dtypes = self._dtypes
+        else:
+            if not isinstance(chunk, dict) or set(chunk) != set(self._columns):
+                return False
+            arrays = [np.asarray(chunk[col]) for col in self._columns]
+            index, dtypes = arrays[0], [None] * len(arrays)
+        if not all(
+            self._compatible(array, buffer, dtype)
+            for array, buffer, dtype in zip(arrays, self._arrays, dtypes, strict=True)
+        ) or len({len(array) for array in arrays}) > 1:
+            return False
+
+        nchunk = len(index)
+        total = len(self) + nchunk
+        keep = min(total, rollover) if rollover else total
+        if self._end + nchunk <= self._capacity:
+            end = self._end + nchunk
+            for buffer, array in zip(self._arrays, arrays, strict=True):
+                buffer[self._end:end] = array
+            if self._frame:
+                self._index[self._end:end] = index
+            self._start, self._end = end - keep, end
+        else:
+            # Copy the retained rows into newly allocated arrays
+            nold = max(keep - nchunk, 0)
+            self._capacity = _capacity(keep, rollover)
+            old = slice(self._end - nold, self._end)
+            new = []
+            for buffer, array in zip(self._arrays, arrays, strict=True):
+                new.append(self._allocate(np.concatenate([buffer[old], array]), keep, buffer.dtype))
+            self._arrays = new
+            if self._frame:
+                self._index = self._allocate(
+                    np.concatenate([self._index[old], index]), keep, self._index.dtype
+                )
+            self._start, self._end = 0, keep
+        self._data = self._view()
+        return True
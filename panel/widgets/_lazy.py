@@ -0,0 +1,305 @@
+"""
+Support for displaying lazy DataFrames, e.g. DuckDB relations, Polars
+LazyFrames or pyarrow Datasets, in a Tabulator by pushing filters,
+sorters and the page slice down to the underlying query engine so
+only the rows that are displayed are ever materialized.
+"""
+from __future__ import annotations
+
+import sys
+import typing as t
+
+import numpy as np
+
+if t.TYPE_CHECKING:
+    import narwhals.stable.v2 as nw
+    import pandas as pd
+
+
+def _is_arrow_dataset(obj: t.Any) -> bool:
+    if 'pyarrow.dataset' not in sys.modules:
+        return False
+    return isinstance(obj, sys.modules['pyarrow.dataset'].Dataset)
+
+
+def _scan_arrow_dataset(dataset: t.Any) -> t.Any:
+    try:
+        import polars as pl
+        return pl.scan_pyarrow_dataset(dataset)
+    except ImportError:
+        pass
+    try:
+        import duckdb
+        return duckdb.from_arrow(dataset)
+    except ImportError:
+        pass
+    raise ImportError(
+        'Displaying a pyarrow Dataset requires either polars or duckdb '
+        'to be installed to query the Dataset.'
+    )
+
+
+def is_lazy_frame(obj: t.Any) -> bool:
+    """
+    Whether the object is a lazy DataFrame supported by narwhals
+    (e.g. a DuckDB relation or Polars LazyFrame) or a pyarrow Dataset.
+    """
+    if obj is None or isinstance(obj, (dict, list)):
+        return False
+    module = type(obj).__module__
+    if module.startswith('pandas'):
+        return False
+    elif _is_arrow_dataset(obj):
+        return True
+    import narwhals as nw_main
+    import narwhals.stable.v2 as nw
+    if isinstance(obj, nw_main.LazyFrame):
+        return True
+    return isinstance(nw.from_native(obj, pass_through=True), nw.LazyFrame)
+
+
+class LazyFrameData:
+    """
+    Wraps a lazy DataFrame and builds queries against it.
+
+    Filters and sorters are translated into narwhals expressions,
+    which are evaluated by the query engine of the DataFrame, and only
+    the requested slice of rows is collected into a pandas DataFrame.
+    """
+
+    def __init__(self, obj: t.Any):
+        import narwhals as nw_main
+        import narwhals.stable.v2 as nw
+
+        self.obj = obj
+        self._narwhals = isinstance(obj, nw_main.LazyFrame)
+        if self._narwhals:
+            native = obj.to_native()
+        elif _is_arrow_dataset(obj):
+            native = _scan_arrow_dataset(obj)
+        else:
+            native = obj
+        frame = nw.from_native(native)
+        if isinstance(frame, nw.DataFrame):
+            frame = frame.lazy()
+        self.frame: nw.LazyFrame = frame
+        self.dtypes = frame.collect_schema()
+        # An empty DataFrame describing the columns and their dtypes
+        self.schema: pd.DataFrame = self._collect(frame.head(0))
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self.dtypes)
+
+    def _collect(self, frame: nw.LazyFrame) -> pd.DataFrame:
+        return frame.collect(backend='pandas').to_native()
+
+    def _convert_value(self, column: str, value: t.Any) -> t.Any:
+        import pandas as pd
+        dtype = self.schema[column].dtype
+        if dtype.kind == 'O' or isinstance(value, (list, tuple, set)):
+            return value
+        elif dtype.kind == 'M':
+            return pd.Timestamp(value).to_pydatetime()
+        value = dtype.type(value)
+        return value.item() if isinstance(value, np.generic) else value
+
+    def to_native(self, frame: nw.LazyFrame) -> t.Any:
+        """
+        Returns the native lazy DataFrame, or the narwhals LazyFrame
+        if a narwhals LazyFrame was wrapped.
+        """
+        return frame if self._narwhals else frame.to_native()
+
+    def filter(
+        self,
+        frame: nw.LazyFrame,
+        column: str | None,
+        value: t.Any
+    ) -> nw.LazyFrame:
+        """
+        Applies a filter declared with `Tabulator.add_filter`, i.e.
+        a scalar, tuple range, list of values or a function.
+
+        Functions are given the (native) lazy DataFrame and may
+        return a filtered lazy DataFrame or a predicate accepted by
+        the filter method of the DataFrame.
+        """
+        import narwhals as nw_main
+        import narwhals.stable.v2 as nw
+
+        if callable(value):
+            native = self.to_native(frame)
+            result = value(native)
+            if isinstance(result, nw_main.LazyFrame):
+                result = result.to_native()
+            elif isinstance(result, nw_main.Expr):
+                return frame.filter(result)
+            converted = nw.from_native(result, pass_through=True)
+            if isinstance(converted, nw.DataFrame):
+                return converted.lazy()
+            elif isinstance(converted, nw.LazyFrame):
+                return converted
+            native = frame.to_native()
+            if frame.implementation.is_pandas_like():
+                return nw.from_native(native[result]).lazy()
+            return nw.from_native(native.filter(result))
+        col = nw.col(column)
+        if value is None:
+            return frame
+        elif np.isscalar(value):
+            expr = col == self._convert_value(column, value)
+        elif isinstance(value, (list, set)):
+            if not value:
+                return frame
+            expr = col.is_in([self._convert_value(column, v) for v in value])
+        elif isinstance(value, tuple):
+            start, end = value
+            if start is None and end is None:
+                return frame
+            elif start is None:
+                expr = col <= self._convert_value(column, end)
+            elif end is None:
+                expr = col >= self._convert_value(column, start)
+            else:
+                expr = col.is_between(
+                    self._convert_value(column, start), self._convert_value(column, end)
+                )
+        else:
+            raise ValueError(f"'{column} filter value not "
+                             "understood. Must be either a scalar, "
+                             "tuple or list.")
+        return frame.filter(expr)
+
+    def header_filter(
+        self,
+        frame: nw.LazyFrame,
+        filt: dict[str, t.Any],
+        definition: dict[str, t.Any]
+    ) -> nw.LazyFrame:
+        """
+        Applies a filter set on the frontend, declared as a dictionary
+        containing 'field', 'type' and 'value' keys.
+        """
+        import narwhals.stable.v2 as nw
+
+        column, op, val = filt['field'], filt['type'], filt['value']
+        if column not in self.dtypes:
+            return frame
+
+        # Sometimes Tabulator will provide a zero/single element list
+        if isinstance(val, list):
+            if len(val) == 1:
+                val = val[0]
+            elif not val:
+                return frame
+
+        col = nw.col(column)
+        if op in ('like', 'starts', 'ends', 'keywords'):
+            col = col.cast(nw.String).str.to_lowercase()
+            val = str(val).lower()
+        else:
+            val = self._convert_value(column, val)
+        if op == '=':
+            expr = col == val
+        elif op == '!=':
+            expr = col != val
+        elif op == '<':
+            expr = col < val
+        elif op == '>':
+            expr = col > val
+        elif op == '>=':
+            expr = col >= val
+        elif op == '<=':
+            expr = col <= val
+        elif op == 'in':
+            expr = col.is_in(list(val) if isinstance(val, (list, np.ndarray)) else [val])
+        elif op == 'like':
+            expr = col.str.contains(val, literal=True)
+        elif op == 'starts':
+            expr = col.str.starts_with(val)
+        elif op == 'ends':
+            expr = col.str.ends_with(val)
+        elif op == 'keywords':
+            matches = [col.str.contains(m, literal=True) for m in val.split(definition.get('separator', ' '))]
+            if definition.get('matchAll', False):
+                expr = nw.all_horizontal(*matches, ignore_nulls=True)
+            else:
+                expr = nw.any_horizontal(*matches, ignore_nulls=True)
+        elif op == 'regex':
+            raise ValueError("Regex filtering not supported.")
+        else:
+            raise ValueError(f"Filter type {op!r} not recognized.")
+        return frame.filter(expr)
+
+    def sort(self, frame: nw.LazyFrame, sorters: list[dict[str, t.Any]]) -> nw.LazyFrame:
+        """
+        Sorts the frame by the sorters, like the Tabulator frontend
+        strings are compared case-insensitively.
+        """
+        import narwhals.stable.v2 as nw
+
+        keys, descending, temporary = [], [], []
+        for i, sorter in enumerate(sorters):
+            field = sorter['field']
+            if field not in self.dtypes:
+                continue
+            if self.dtypes[field] == nw.String:
+                key = f'__panel_sort_{i}__'
+                temporary.append(key)
+                frame = frame.with_columns(
+                    nw.col(field).fill_null('').str.to_lowercase().alias(key)
+                )
+            else:
+                key = field
+            keys.append(key)
+            descending.append(sorter['dir'] == 'desc')
+        if not keys:
+            return frame
+        frame = frame.sort(keys, descending=descending, nulls_last=True)
+        return frame.drop(*temporary) if temporary else frame
+
+    def count(self, frame: nw.LazyFrame) -> int:
+        """
+        Returns the number of rows in the frame.
+        """
+        import narwhals.stable.v2 as nw
+        return int(frame.select(nw.len()).collect().item())
+
+    def page(self, frame: nw.LazyFrame, start: int, length: int) -> pd.DataFrame:
+        """
+        Collects `length` rows starting at `start` into a pandas
+        DataFrame indexed by the position of the rows in the frame.
+        """
+        import narwhals.stable.v2 as nw
+        import pandas as pd
+
+        impl = frame.implementation
+        if impl.is_polars():
+            df = self._collect(nw.from_native(frame.to_native().slice(start, length)))
+        elif impl.is_duckdb():
+            df = self._collect(nw.from_native(frame.to_native().limit(length, offset=start)))
+        else:
+            df = self._collect(frame.head(start+length)).iloc[start:]
+        df.index = pd.RangeIndex(start, start+len(df))
+        return df
+
+    def take(self, frame: nw.LazyFrame, positions: list[int]) -> pd.DataFrame:
+        """
+        Collects the rows at the given positions, fetching each
+        contiguous run of positions as a single slice.
+        """
+        import pandas as pd
+
+        if not positions:
+            return self.schema
+        ordered = sorted(set(positions))
+        runs, run_start, prev = [], ordered[0], ordered[0]
+        for pos in ordered[1:]:
+            if pos != prev + 1:
+                runs.append((run_start, prev))
+                run_start = pos
+            prev = pos
+        runs.append((run_start, prev))
+        df = pd.concat([self.page(frame, s, e-s+1) for s, e in runs])
+        return df.loc[[p for p in positions if p in df.index]]
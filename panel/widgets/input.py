@@ -6,11 +6,13 @@ from __future__ import annotations
 
 import ast
 import json
+import tempfile
 import typing as t
 
 from base64 import b64decode
-from collections.abc import Iterable, Mapping
+from collections.abc import Callable, Iterable, Mapping
 from datetime import date, datetime, time as dt_time
+from functools import partial
 from html import escape
 
 import numpy as np
@@ -28,6 +30,7 @@ from bokeh.models.widgets.inputs import ClearInput
 from pyviz_comms import JupyterComm
 
 from ..config import config
+from ..io.state import state
 from ..layout import Column
 from ..models import (
     DatetimePicker as _bkDatetimePicker, TextAreaInput as _bkTextAreaInput,
@@ -374,20 +377,31 @@ class FileDropper(Widget):
         - image: Adds support for image previews.
         - pdf: Adds support for PDF previews.""")
 
+    spool_size = param.Integer(default=None, bounds=(0, None), doc="""
+        If set, uploaded chunks are written to a SpooledTemporaryFile,
+        which is held in memory up to the given number of bytes and
+        rolled over to a temporary file on disk beyond that. The value
+        then holds the file objects (rewound to the start) instead of
+        the contents of the files.""")
+
     value = param.Dict(default={}, doc="""
         A dictionary containing the uploaded file(s) as bytes or string
         objects indexed by the filename. Files that have a text/* mimetype
-        will automatically be decoded as utf-8.""")
+        will automatically be decoded as utf-8. If a spool_size is set the
+        files are file objects instead and if chunk callbacks are
+        registered with on_chunk but no spool_size is set the files are
+        None, since the contents are not retained.""")
 
     width = param.Integer(default=300, allow_None=True, doc="""
       Width of this component. If sizing_mode is set to stretch
       or scale mode this will merely be used as a suggestion.""")
 
-    _rename = {'value': None}
+    _rename = {'spool_size': None, 'value': None}
 
     def __init__(self, **params):
         super().__init__(**params)
         self._file_buffer = {}
+        self._on_chunk_callbacks = []
 
     def _get_model(
         self, doc: Document, root: Model | None = None,
@@ -401,6 +415,11 @@ class FileDropper(Widget):
         self._register_events('delete_event', 'upload_event', model=model, doc=doc, comm=comm)
         return model
 
+    def _close_file(self, name: str) -> None:
+        file = self.value.get(name)
+        if isinstance(file, tempfile.SpooledTemporaryFile):
+            file.close()
+
     def _process_event(self, event: DeleteEvent | UploadEvent):
         data = event.data
         name = data['name']
@@ -408,27 +427,66 @@ class FileDropper(Widget):
             if name in self.mime_type:
                 del self.mime_type[name]
             if name in self.value:
+                self._close_file(name)
                 del self.value[name]
             self.param.trigger('mime_type', 'value')
             return
 
+        for cb in self._on_chunk_callbacks:
+            state.execute(partial(cb, event), schedule=False)
         if data['chunk'] == 1:
-            self._file_buffer[name] = []
-        self._file_buffer[name].append(data['data'])
+            buffer = self._file_buffer.pop(name, None)
+            if isinstance(buffer, tempfile.SpooledTemporaryFile):
+                buffer.close()
+            if self.spool_size is not None:
+                self._file_buffer[name] = tempfile.SpooledTemporaryFile(max_size=self.spool_size)
+            elif not self._on_chunk_callbacks:
+                self._file_buffer[name] = []
+        buffer = self._file_buffer.get(name)
+        if isinstance(buffer, list):
+            buffer.append(data['data'])
+        elif buffer is not None:
+            buffer.write(data['data'])
         if data['chunk'] != data['total_chunks']:
             return
 
-        buffers = self._file_buffer.pop(name)
-        file_buffer: bytes | str = b''.join(buffers)
-        if data['type'].startswith('text/') and isinstance(file_buffer, bytes):
-            try:
-                file_buffer = file_buffer.decode('utf-8')
-            except UnicodeDecodeError:
-                pass
+        buffer = self._file_buffer.pop(name, None)
+        file_buffer: bytes | str | t.IO[bytes] | None
+        if isinstance(buffer, list):
+            file_buffer = b''.join(buffer)
+            if data['type'].startswith('text/'):
+                try:
+                    file_buffer = file_buffer.decode('utf-8')
+                except UnicodeDecodeError:
+                    pass
+        else:
+            file_buffer = buffer
+            if file_buffer is not None:
+                file_buffer.seek(0)
+        self._close_file(name)
         self.value[name] = file_buffer
         self.mime_type[name] = data['type']
         self.param.trigger('mime_type', 'value')
 
+    def on_chunk(self, callback: Callable[[UploadEvent], None]):
+        """
+        Register a callback to be executed whenever a chunk of a file
+        is received. The callback is given an UploadEvent whose data
+        contains the 'name' and 'type' of the file, the 'chunk' index
+        (starting at 1), the number of 'total_chunks' and the chunk
+        'data' itself.
+
+        Once a callback is registered the uploaded files are no longer
+        buffered in memory unless a spool_size is set, allowing large
+        uploads to be streamed to their destination chunk by chunk.
+
+        Parameters
+        ----------
+        callback: (callable)
+            The callback to run on each chunk.
+        """
+        self._on_chunk_callbacks.append(callback)
+
 
 class StaticText(Widget):
     """
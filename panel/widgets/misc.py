@@ -6,6 +6,7 @@ from __future__ import annotations
 import typing as t
 
 from base64 import b64encode
+from collections.abc import Iterator
 from pathlib import Path
 
 import param
@@ -13,6 +14,7 @@ import param
 from param.parameterized import eval_function_with_deps, iscoroutinefunction
 from pyviz_comms import JupyterComm
 
+from ..io.downloads import download_store
 from ..io.notebook import push
 from ..io.resources import CDN_DIST
 from ..io.state import state
@@ -121,10 +123,12 @@ class FileDownload(IconMixin):
         'outline').""")  # type: ignore[assignment, ty:invalid-assignment]
 
     callback = param.Callable(default=None, allow_refs=False, doc="""
-        A callable that returns the file path or file-like object.""")
+        A callable that returns the file path, file-like object or an
+        iterator of chunks of the file (e.g. a generator).""")
 
     data = param.String(default=None, doc="""
-        The data being transferred.""")
+        The data being transferred, either as a base64 encoded data URI
+        or, when served, the URL the file is streamed from.""")
 
     embed = param.Boolean(default=False, doc="""
         Whether to embed the file on initialization.""")  # type: ignore[assignment, ty:invalid-assignment]
@@ -253,17 +257,9 @@ class FileDownload(IconMixin):
             fileobj = Path(fileobj)
             if not fileobj.exists():
                 raise FileNotFoundError(f'File "{fileobj}" not found.')
-            with open(fileobj, 'rb') as f:
-                b64 = b64encode(f.read()).decode("utf-8")
             if filename is None:
                 filename = fileobj.name
-        elif hasattr(fileobj, 'read'):
-            if hasattr(fileobj, 'seek'):
-                fileobj.seek(0)
-            bdata = fileobj.read()
-            if not isinstance(bdata, bytes):
-                bdata = bdata.encode("utf-8")
-            b64 = b64encode(bdata).decode("utf-8")
+        elif hasattr(fileobj, 'read') or isinstance(fileobj, Iterator):
             if filename is None:
                 raise ValueError('Must provide filename if file-like '
                                  'object is provided.')
@@ -282,7 +278,28 @@ class FileDownload(IconMixin):
         else:
             mime = f'{mtype}/{stype}'
 
-        data = f"data:{mime};base64,{b64}"
+        doc = state.curdoc
+        if not self.embed and download_store.enabled(doc):
+            # Stream the file over HTTP instead of sending it over the websocket
+            token = download_store.add(fileobj, filename, mime, doc, self)
+            data = download_store.url(token, doc)
+        else:
+            if isinstance(fileobj, Path):
+                with open(fileobj, 'rb') as f:
+                    bdata = f.read()
+            elif hasattr(fileobj, 'read'):
+                if hasattr(fileobj, 'seek'):
+                    fileobj.seek(0)
+                bdata = fileobj.read()
+            else:
+                bdata = b''.join(
+                    chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+                    for chunk in fileobj
+                )
+            if not isinstance(bdata, bytes):
+                bdata = bdata.encode("utf-8")
+            b64 = b64encode(bdata).decode("utf-8")
+            data = f"data:{mime};base64,{b64}"
         self._synced = True
         self.param.update(data=data, filename=filename)
         self._update_label()
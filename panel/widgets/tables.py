@@ -35,11 +35,13 @@ from ..util import (
     styler_update, updating,
 )
 from ..util.warnings import warn
+from ._lazy import LazyFrameData, is_lazy_frame
 from .base import Widget
 from .button import Button
 from .input import TextInput
 
 if t.TYPE_CHECKING:
+    import narwhals.stable.v2 as nw
     import pandas as pd
 
     from bokeh.document import Document
@@ -108,6 +110,110 @@ def _stringdtype_error(df: pd.DataFrame, column: str, array):
             ) from None
         raise
 
+
+class _StyleOp(t.NamedTuple):
+    """
+    A style operation recorded by a pandas Styler, i.e. a call to
+    `Styler.map` (axis='cells') or `Styler.apply`.
+    """
+
+    func: Callable
+    axis: int | str | None
+    subset: t.Any
+    kwargs: dict[str, t.Any]
+
+    @property
+    def row_local(self) -> bool:
+        """
+        Whether the styles of a row only depend on the row itself.
+        """
+        return self.axis in ('cells', 1)
+
+
+class _AttrName:
+    """
+    Returns the name of any attribute that is accessed.
+    """
+
+    def __getattr__(self, name: str) -> str:
+        return name
+
+
+def _styler_ops(todo: list[t.Any]) -> list[_StyleOp] | None:
+    """
+    Converts the todo list of a pandas Styler into style operations,
+    returning None if it contains operations other than `map` and
+    `apply`.
+    """
+    ops = []
+    for item in todo:
+        if not (isinstance(item, tuple) and len(item) == 3 and callable(item[0])):
+            return None
+        getter, args, kwargs = item
+        try:
+            method = getter(_AttrName())
+        except Exception:
+            return None
+        if method in ('_map', '_applymap'):
+            func, subset = args
+            axis: int | str | None = 'cells'
+        elif method == '_apply':
+            func, axis, subset = args
+            if axis is not None:
+                axis = 1 if axis in (1, 'columns') else 0
+        else:
+            return None
+        ops.append(_StyleOp(func, axis, subset, kwargs))
+    return ops
+
+
+def _map_styles(data: pd.DataFrame, func: Callable, kwargs: dict[str, t.Any]) -> pd.DataFrame:
+    """
+    Vectorized equivalent of `data.map(func)`, which evaluates the
+    function only once for each unique value in a column.
+    """
+    import pandas as pd
+    func = partial(func, **kwargs)
+    columns = {}
+    for i in range(data.shape[1]):
+        column = data.iloc[:, i]
+        try:
+            codes, uniques = pd.factorize(column, use_na_sentinel=True)
+        except TypeError:
+            columns[i] = column.map(func).to_numpy(dtype=object)
+            continue
+        styles = np.array([func(v) for v in uniques] + [None], dtype=object)
+        if (codes == -1).any():
+            styles[-1] = func(column[codes == -1].iloc[0])
+        columns[i] = styles[codes]
+    return pd.DataFrame(
+        {i: columns[i] for i in range(data.shape[1])}, index=data.index
+    ).set_axis(data.columns, axis=1)
+
+
+def _evaluate_style_op(op: _StyleOp, data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Evaluates a style operation on the data like `Styler._apply`
+    and `Styler._map`, returning a DataFrame of CSS strings.
+    """
+    import pandas as pd
+    if data.empty:
+        return pd.DataFrame()
+    elif op.axis == 'cells':
+        return _map_styles(data, op.func, op.kwargs)
+    elif op.axis is None:
+        result = op.func(data, **op.kwargs)
+        if not isinstance(result, pd.DataFrame):
+            result = pd.DataFrame(result, index=data.index, columns=data.columns)
+    elif op.axis == 0:
+        result = data.apply(op.func, axis=0, **op.kwargs)
+    else:
+        result = data.T.apply(op.func, axis=0, **op.kwargs).T
+    if not isinstance(result, pd.DataFrame):
+        raise ValueError(f'Function {op.func!r} did not return a style for each cell.')
+    return result
+
+
 class BaseTable(ReactiveData, Widget):
 
     aggregators = param.Dict(default={}, nested_refs=True, doc="""
@@ -222,17 +328,24 @@ class BaseTable(ReactiveData, Widget):
     def _length(self):
         return len(self._processed)
 
+    @property
+    def _schema(self) -> pd.DataFrame | None:
+        """
+        The DataFrame describing the columns, dtypes and index of the value.
+        """
+        return self.value
+
     def _validate(self, *events: param.parameterized.Event):
         if self.value is None:
             return
-        cols = self.value.columns
+        cols = self._schema.columns
         if len(cols) != len(cols.drop_duplicates()):
             raise ValueError('Cannot display a pandas.DataFrame with '
                              'duplicate column names.')
 
     def _get_fields(self) -> list[str]:
         indexes = self.indexes
-        col_names = [] if self.value is None else list(self.value.columns)
+        col_names = [] if self.value is None else list(self._schema.columns)
         if not self.hierarchical or len(indexes) == 1:
             col_names = indexes + col_names
         else:
@@ -245,7 +358,8 @@ class BaseTable(ReactiveData, Widget):
 
         indexes = self.indexes
         fields = self._get_fields()
-        df = self.value.reset_index() if len(indexes) > 1 else self.value
+        schema = self._schema
+        df = schema.reset_index() if len(indexes) > 1 else schema
         return self._get_column_definitions(fields, df)
 
     def _get_column_definitions(self, col_names: list[str], df: pd.DataFrame) -> list[TableColumn]:
@@ -448,28 +562,33 @@ class BaseTable(ReactiveData, Widget):
             else:
                 self._update_columns(event, model)
 
-    def _sort_df(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _sort_positions(self, df: pd.DataFrame, rows: np.ndarray | None = None) -> np.ndarray | None:
+        """
+        Returns the positions which sort the DataFrame (or the given
+        subset of its rows) by the sorters, or None if there are no
+        sorters. Like the Tabulator frontend strings are compared
+        case-insensitively and ties retain the existing row order.
+
+        Only the sorted columns are gathered so the DataFrame itself
+        is never copied.
+        """
         if not self.sorters:
-            return df
-        fields = [self._renamed_cols.get(s['field'], s['field']) for s in self.sorters]
-        ascending = [s['dir'] == 'asc' for s in self.sorters]
+            return None
+        import pandas as pd
 
-        # Making a copy of the DataFrame because it could be a view of the original
-        # dataframe. There could be a better place to do this.
-        df = df.copy()
-        # Temporarily add _index_ column because Tabulator uses internal _index
-        # as additional sorter to break ties
-        df['_index_'] = np.arange(len(df)).astype(str)
-        fields.append('_index_')
-        ascending.append(True)
-
-        # Handle sort on index column if show_index=True
-        if self.show_index:
-            rename = 'index' in fields and df.index.name is None
-            if rename:
-                df.index.name = 'index'
-        else:
-            rename = False
+        keys = {}
+        for i, sorter in enumerate(self.sorters):
+            field = self._renamed_cols.get(sorter['field'], sorter['field'])
+            if field in df.columns:
+                values = df[field].array
+            elif self.show_index and field == 'index' and df.index.nlevels == 1 and df.index.name is None:
+                values = df.index.array
+            elif field in df.index.names:
+                values = df.index.get_level_values(field).array
+            else:
+                raise KeyError(field)
+            keys[i] = values if rows is None else values.take(rows)
+        ascending = [s['dir'] == 'asc' for s in self.sorters]
 
         def tabulator_sorter(col):
             # Tabulator JS defines its own sorting algorithm:
@@ -481,23 +600,34 @@ class BaseTable(ReactiveData, Widget):
             except Exception:
                 return col
 
-        df_sorted = df.sort_values(fields, ascending=ascending, kind='mergesort',
-                                  key=tabulator_sorter)
+        # A stable sort ensures ties are broken by the row order
+        keys_df = pd.DataFrame(keys)
+        sorted_df = keys_df.sort_values(
+            list(keys), ascending=ascending, kind='mergesort', key=tabulator_sorter
+        )
+        return sorted_df.index.to_numpy()
+
+    def _sort_df(self, df: pd.DataFrame) -> pd.DataFrame:
+        positions = self._sort_positions(df)
+        if positions is None:
+            return df
+        return self._take_sorted(df, positions)
 
-        # Revert temporary changes to DataFrames
-        if rename:
-            df_sorted.index.name = None
-        df_sorted.drop(columns=['_index_'], inplace=True)
+    def _take_sorted(self, df: pd.DataFrame, positions: np.ndarray) -> pd.DataFrame:
+        df_sorted = df.iloc[positions]
+        # Sorted views have always been returned with object dtype
+        # column labels (e.g. for DataFrames with integer columns)
+        df_sorted.columns = df_sorted.columns.astype(object)
         return df_sorted
 
-    def _filter_dataframe(
+    def _filter_mask(
         self,
         df: pd.DataFrame,
         header_filters: bool = True,
         internal_filters: bool = True
-    ) -> pd.DataFrame:
+    ) -> tuple[pd.DataFrame, t.Any]:
         """
-        Filter the DataFrame.
+        Computes a boolean mask of the rows matching the filters.
 
         Parameters
         ----------
@@ -507,7 +637,10 @@ class BaseTable(ReactiveData, Widget):
         Returns
         -------
         DataFrame
-            The filtered DataFrame
+            The DataFrame, which filter functions may have replaced
+            with a filtered DataFrame
+        mask
+            The boolean mask to apply to the DataFrame or None
         """
         filters = []
         for col_name, filt in (self._filters if internal_filters else []):
@@ -554,15 +687,37 @@ class BaseTable(ReactiveData, Widget):
         if header_filters:
             filters.extend(self._get_header_filters(df))
 
-        if filters:
-            mask = filters[0]
-            for f in filters:
-                mask &= f
-            if self._edited_indexes:
-                edited_mask = (df.index.isin(self._edited_indexes))
-                mask = mask | edited_mask
-            df = df[mask]
-        return df
+        if not filters:
+            return df, None
+        mask = filters[0]
+        for f in filters:
+            mask &= f
+        if self._edited_indexes:
+            edited_mask = (df.index.isin(self._edited_indexes))
+            mask = mask | edited_mask
+        return df, mask
+
+    def _filter_dataframe(
+        self,
+        df: pd.DataFrame,
+        header_filters: bool = True,
+        internal_filters: bool = True
+    ) -> pd.DataFrame:
+        """
+        Filter the DataFrame.
+
+        Parameters
+        ----------
+        df : DataFrame
+           The DataFrame to filter
+
+        Returns
+        -------
+        DataFrame
+            The filtered DataFrame
+        """
+        df, mask = self._filter_mask(df, header_filters, internal_filters)
+        return df if mask is None else df[mask]
 
     def _get_header_filters(self, df: pd.DataFrame) -> list[pd.Series | np.ndarray]:
         filters = []
@@ -754,16 +909,17 @@ class BaseTable(ReactiveData, Widget):
         import pandas as pd
         if self.value is None or not self.show_index:
             return []
-        elif isinstance(self.value.index, pd.MultiIndex):
+        schema = self._schema
+        if isinstance(schema.index, pd.MultiIndex):
             indexes = [
                 f'level_{i}' if n is None else n
-                for i, n in enumerate(self.value.index.names)
+                for i, n in enumerate(schema.index.names)
             ]
-            if self.value.columns.nlevels > 1:
-                indexes = [i + "_" * (self.value.columns.nlevels - 1) for i in indexes]
+            if schema.columns.nlevels > 1:
+                indexes = [i + "_" * (schema.columns.nlevels - 1) for i in indexes]
             return indexes
-        default_index = ('level_0' if 'index' in self.value.columns else 'index')
-        return [self.value.index.name or default_index]
+        default_index = ('level_0' if 'index' in schema.columns else 'index')
+        return [schema.index.name or default_index]
 
     def stream(self, stream_value, rollover=None, reset_index=True):
         """
@@ -829,18 +985,29 @@ class BaseTable(ReactiveData, Widget):
         else:
             value_index_start = self.value.index.max() + 1
 
+        if isinstance(stream_value, pd.Series) and self.stream_buffer:
+            # Append the row to the stream buffer rather than enlarging the value
+            stream_value = pd.DataFrame(
+                [stream_value.to_list()], columns=stream_value.index,
+                index=[value_index_start]
+            )
+            reset_index = False
+
         if isinstance(stream_value, pd.DataFrame):
             if reset_index:
                 stream_value = stream_value.reset_index(drop=True)
                 stream_value.index += value_index_start
-            if self.value.empty:
-                combined = pd.DataFrame(
-                    stream_value, columns=self.value.columns
-                ).astype(self.value.dtypes)
-            else:
-                combined = pd.concat([self.value, stream_value])
-            if rollover is not None:
-                combined = combined.iloc[-rollover:]
+            combined = self._append_to_buffer(self.value, stream_value, rollover)
+            if combined is None:
+                if self.value.empty:
+                    combined = pd.DataFrame(
+                        stream_value, columns=self.value.columns
+                    ).astype(self.value.dtypes)
+                else:
+                    combined = pd.concat([self.value, stream_value])
+                if rollover is not None:
+                    combined = combined.iloc[-rollover:]
+                combined = self._buffer(combined)
             with param.discard_events(self):
                 self.value = combined
             try:
@@ -936,6 +1103,8 @@ class BaseTable(ReactiveData, Widget):
                 "is not supported. Please provide a DataFrame."
             )
 
+        # Patches may replace the buffered arrays
+        self._stream_buffer = None
         if isinstance(patch_value, pd.DataFrame):
             patch_value_dict = {
                 column: list(patch_value[column].items()) for column in patch_value.columns
@@ -1398,12 +1567,19 @@ class Tabulator(BaseTable):
         configuration = params.pop('configuration', {})
         self.style = None
         self._computed_styler = None
+        self._cell_styles = {}
+        self._style_cache = {}
+        self._style_ops = None
         self._child_panels = {}
         self._indexed_children = {}
         self._explicit_pagination = 'pagination' in params
         self._on_edit_callbacks = []
         self._on_click_callbacks = {}
         self._pending_edits = {}
+        self._view_cache = None
+        self._view_appended = None
+        self._lazy = None
+        self._lazy_view = None
         super().__init__(value=value, **params)
         self._configuration = configuration
         self.param.watch(self._update_children, self._content_params)
@@ -1425,7 +1601,10 @@ class Tabulator(BaseTable):
         if self.value is None or self._explicit_pagination:
             return
         with param.parameterized.discard_events(self):
-            if self.hierarchical:
+            if self._get_lazy() is not None:
+                # Lazy DataFrames are only ever queried one page at a time
+                self.pagination = 'remote'
+            elif self.hierarchical:
                 pass
             elif self._MAX_ROW_LIMITS[0] < len(self.value) <= self._MAX_ROW_LIMITS[1]:
                 self.pagination = 'local'
@@ -1461,6 +1640,48 @@ class Tabulator(BaseTable):
             except Exception:
                 pass
 
+    def _get_lazy(self) -> LazyFrameData | None:
+        """
+        Returns the wrapper used to query the value if it is a lazy
+        DataFrame (e.g. a DuckDB relation, Polars LazyFrame or pyarrow
+        Dataset), otherwise None.
+        """
+        value = self.value
+        if self._lazy is not None and self._lazy.obj is value:
+            return self._lazy
+        self._lazy = LazyFrameData(value) if is_lazy_frame(value) else None
+        self._lazy_view = None
+        return self._lazy
+
+    @property
+    def _schema(self) -> pd.DataFrame | None:
+        lazy = self._get_lazy()
+        return self.value if lazy is None else lazy.schema
+
+    @property
+    def indexes(self):
+        if self._get_lazy() is not None:
+            return []
+        return super().indexes
+
+    @property
+    def _length(self):
+        if self._get_lazy() is not None:
+            return 0 if self._lazy_view is None else self._lazy_view[-1]
+        return super()._length
+
+    def _indexes_changed(self, old, new):
+        if is_lazy_frame(old) or is_lazy_frame(new):
+            return old is not new
+        return super()._indexes_changed(old, new)
+
+    def _reset_selection(self, event):
+        # The selection of a lazy DataFrame refers to positions in the
+        # current view and is cleared when the value changes
+        if is_lazy_frame(event.old) or is_lazy_frame(event.new):
+            return
+        super()._reset_selection(event)
+
     def _cleanup(self, root: Model | None = None) -> None:
         for p in self._child_panels.values():
             p._cleanup(root)
@@ -1484,10 +1705,17 @@ class Tabulator(BaseTable):
             nrows = self.page_size or self.initial_page_size
             event.row = event.row+(self.page-1)*nrows
 
-        idx = self._index_mapping.get(event.row, event.row)
-        iloc = self.value.index.get_loc(idx)
-        self._validate_iloc(idx, iloc)
-        event.row = iloc
+        # Rows of a lazy DataFrame are identified by their position
+        # in the current view and cannot be edited
+        lazy = self._get_lazy() is not None
+        if lazy:
+            if event.event_name == 'table-edit':
+                return
+        else:
+            idx = self._index_mapping.get(event.row, event.row)
+            iloc = self.value.index.get_loc(idx)
+            self._validate_iloc(idx, iloc)
+            event.row = iloc
 
         if event.event_name == 'table-edit':
             if event_col not in self.value.columns or event.value is None:
@@ -1526,7 +1754,10 @@ class Tabulator(BaseTable):
             return
 
         if event_col not in self.buttons:
-            if event_col in self.value.columns:
+            if lazy:
+                if event_col in self._processed.columns:
+                    event.value = self._processed.at[event.row, event_col]
+            elif event_col in self.value.columns:
                 event.value = self.value[event_col].iloc[event.row]
             else:
                 event.value = self.value.index[event.row]
@@ -1538,6 +1769,7 @@ class Tabulator(BaseTable):
     def _fire_pending_edits(self, column: str, index) -> None:
         if not self._pending_edits:
             return
+        edited = []
         for ind in index:
             events = self._pending_edits.pop((column, ind), None)
             if not events:
@@ -1545,7 +1777,10 @@ class Tabulator(BaseTable):
             for event in events:
                 for cb in self._on_edit_callbacks:
                     state.execute(partial(cb, event), schedule=False)
-            self._update_style()
+            edited.append(ind)
+        if edited:
+            rows = self._processed.index.get_indexer(edited)
+            self._update_style(rows=rows[rows >= 0])
 
     def _get_theme(self, theme, resources=None):
         from ..models.tabulator import _TABULATOR_THEMES_MAPPING, THEME_PATH
@@ -1575,6 +1810,9 @@ class Tabulator(BaseTable):
         # front-end filtering - if need be - to be able to correctly make the
         # comparison and update the data held by the backend.
 
+        if self._get_lazy() is not None:
+            # Lazy DataFrames are read-only
+            return
         import pandas as pd
         df = pd.DataFrame(data)
         filters = self._get_header_filters(df) if self.pagination == 'remote' else []
@@ -1591,15 +1829,169 @@ class Tabulator(BaseTable):
         }
         return super()._process_data(data)
 
+    def _view_key(self) -> bytes | None:
+        """
+        Returns a key identifying the filters and sorters applied to
+        the view used for remote pagination.
+        """
+        from ..io.cache import _generate_hash
+        filters = []
+        for column, filt in self._filters:
+            if isinstance(filt, param.Parameter):
+                filt = None if filt.name is None else getattr(filt.owner, filt.name)
+            filters.append((column, filt))
+        try:
+            return _generate_hash((
+                filters, self.filters, self.header_filters, self.sorters, self.show_index
+            ))
+        except ValueError:
+            return None
+
+    def _compute_view(
+        self, df: pd.DataFrame, rows: np.ndarray | None = None
+    ) -> np.ndarray | None | t.Literal[False]:
+        """
+        Returns the positions of the rows of the DataFrame (optionally
+        restricted to a subset of rows) that match the filters, in
+        sorted order, or None if the DataFrame is not filtered or
+        sorted. Returns False if a filter function replaced the
+        DataFrame, in which case the positions cannot be determined.
+        """
+        import pandas as pd
+
+        subset = df if rows is None else df.iloc[rows]
+        filtered, mask = self._filter_mask(subset)
+        if filtered is not subset:
+            return False
+        if mask is not None:
+            if isinstance(mask, pd.Series):
+                # Missing values in nullable masks are treated as False
+                mask = mask.to_numpy(dtype=bool, na_value=False)
+            matched = np.flatnonzero(mask)
+            rows = matched if rows is None else rows[matched]
+        if not self.sorters:
+            return rows
+        order = self._sort_positions(df, rows)
+        return order if rows is None else rows[order]
+
+    def _get_view(self) -> pd.DataFrame:
+        """
+        Returns the filtered and sorted view of the value displayed
+        with remote pagination.
+
+        The view is cached along with the positions of its rows in
+        the value and keyed on the value, filters and sorters, so
+        turning the page only slices the cached view. Edits are
+        applied to the cached view directly and when streaming only
+        the new rows are filtered before the view is re-sorted.
+        """
+        value = self.value
+        key = self._view_key()
+        cache, self._view_cache = self._view_cache, None
+        positions: np.ndarray | None | t.Literal[False] = False
+        if cache is not None and key is not None and cache[0] == key:
+            _, cached, length, cached_positions, view = cache
+            if cached is value and len(value) == length:
+                self._view_cache = cache
+                return view
+            elif cached_positions is not False and self._view_appended is not None:
+                positions = self._stream_view(value, length, cached_positions)
+        if positions is False:
+            positions = self._compute_view(value)
+        if positions is False:
+            view = self._sort_df(self._filter_dataframe(value))
+        elif positions is None:
+            view = value
+        elif self.sorters:
+            view = self._take_sorted(value, positions)
+        else:
+            view = value.iloc[positions]
+        if key is not None:
+            self._view_cache = (key, value, len(value), positions, view)
+        return view
+
+    def _stream_view(
+        self, value: pd.DataFrame, length: int, positions: np.ndarray | None
+    ) -> np.ndarray | None | t.Literal[False]:
+        """
+        Updates the positions of a cached view of a value of the given
+        length after rows were streamed to it, returning False if the
+        view has to be recomputed.
+        """
+        appended = self._view_appended
+        dropped = length + appended - len(value)
+        if not (0 <= dropped <= length):
+            return False
+        new = self._compute_view(value, np.arange(len(value)-appended, len(value)))
+        if new is False:
+            return False
+        elif positions is None:
+            positions = np.arange(length)
+        # Drop rows discarded by the rollover and combine with the new rows
+        positions = positions[positions >= dropped] - dropped
+        positions = np.concatenate([positions, new])
+        if self.sorters:
+            return positions[self._sort_positions(value, positions)]
+        elif len(positions) == len(value):
+            return None
+        return positions
+
+    def _get_lazy_view(self, lazy: LazyFrameData) -> nw.LazyFrame:
+        """
+        Returns the lazy DataFrame with the filters and sorters
+        applied. The query and the number of rows it returns are
+        cached so turning the page only queries the page itself.
+        """
+        key = self._view_key()
+        cache = self._lazy_view
+        if cache is not None and key is not None and cache[0] == key:
+            return cache[1]
+        frame = lazy.frame
+        for column, filt in self._filters:
+            if column is not None and column not in lazy.columns:
+                continue
+            if isinstance(filt, param.Parameter):
+                if filt.name is None:
+                    continue
+                filt = getattr(filt.owner, filt.name)
+            frame = lazy.filter(frame, column, filt)
+        filter_defs = self.header_filters if isinstance(self.header_filters, dict) else {}
+        for filt in self.filters:
+            filt_def = filter_defs.get(filt['field'], {})
+            frame = lazy.header_filter(frame, filt, filt_def if isinstance(filt_def, dict) else {})
+        sorters = [
+            dict(sorter, field=self._renamed_cols.get(sorter['field'], sorter['field']))
+            for sorter in self.sorters
+        ]
+        frame = lazy.sort(frame, sorters)
+        self._lazy_view = (key, frame, lazy.count(frame))
+        return frame
+
+    def _get_lazy_data(self, lazy: LazyFrameData) -> tuple[pd.DataFrame, DataDict]:
+        if self.pagination != 'remote':
+            raise ValueError(
+                f"{type(self).__name__} can only display a lazy DataFrame "
+                f"of type {type(self.value).__name__} with pagination='remote'."
+            )
+        frame = self._get_lazy_view(lazy)
+        nrows = self.page_size or self.initial_page_size
+        start = (self.page-1)*nrows
+        page_df = lazy.page(frame, start, nrows)
+        data = ColumnDataSource.from_df(page_df).items()
+        return page_df, {k if isinstance(k, str) else str(k): self._process_column(v, k, page_df) for k, v in data}
+
     def _get_data(self):
-        if self.pagination != 'remote' or self.value is None:
+        lazy = self._get_lazy()
+        if lazy is not None:
+            return self._get_lazy_data(lazy)
+        elif self.pagination != 'remote' or self.value is None:
+            self._view_cache = None
             return super()._get_data()
 
         # If data is paginated the current view on the frontend
         # and locally are identical and both paginated
         import pandas as pd
-        df = self._filter_dataframe(self.value)
-        df = self._sort_df(df)
+        df = self._get_view()
         nrows = self.page_size or self.initial_page_size
         start = (self.page-1)*nrows
 
@@ -1617,40 +2009,16 @@ class Tabulator(BaseTable):
         data = ColumnDataSource.from_df(page_df).items()
         return df, {k if isinstance(k, str) else str(k): self._process_column(v, k, page_df) for k, v in data}
 
-    def _get_style_data(self, recompute=True):
-        if self.value is None or self.style is None or self.value.empty:
-            return {}
-        df = self._processed
-        if len(self.indexes) > 1:
-            df = df.reset_index()
-        if recompute:
-            try:
-                self._computed_styler = styler = df.style
-            except Exception:
-                self._computed_styler = None
-                return {}
-            if styler is None:
-                return {}
-            styler._todo = styler_update(self.style, df)
-            try:
-                styler._compute()
-            except Exception:
-                styler._todo = []
-        else:
-            styler = self._computed_styler
-        if styler is None:
-            return {}
-
+    def _get_style_columns(self, df: pd.DataFrame) -> tuple[int, dict[int, int]]:
+        """
+        Returns the offset of the data columns in the frontend table and
+        a mapping from the indexes of the columns in the DataFrame to
+        the indexes after frozen_columns are applied.
+        """
         # Compute offsets (not that multi-indexes are reset so don't require an offset)
         offset = 1 + int(len(self.indexes) == 1)  + int(self.selectable in ('checkbox', 'checkbox-single')) + int(bool(self.row_content))
 
-        if self.pagination == 'remote':
-            page_size = self.page_size or self.initial_page_size
-            start = (self.page - 1) * page_size
-            end = start + page_size
-
         # Map column indexes in the data to indexes after frozen_columns are applied
-        column_mapper = {}
         frozen_cols = self.frozen_columns
         column_mapper = {}
         if isinstance(frozen_cols, list):
@@ -1675,32 +2043,178 @@ class Tabulator(BaseTable):
                     column_mapper[i] = len(left_cols) + len(non_frozen) + right_cols.index(col)
                 else:
                     column_mapper[i] = len(left_cols) + non_frozen.index(col)
+        return offset, column_mapper
 
-        styles = {}
-        for (r, c), s in styler.ctx.items():
-            if self.pagination == 'remote':
-                if (r < start or r >= end):
-                    continue
-                else:
-                    r -= start
+    def _compute_styles(
+        self, df: pd.DataFrame, ops: list[_StyleOp], rows: np.ndarray
+    ) -> dict[tuple[int, int], list[tuple[str, str]]]:
+        """
+        Computes the styles of the given rows of the DataFrame.
+
+        Operations which style each cell or row independently are only
+        evaluated on the requested rows, while operations which style
+        whole columns or the whole table are evaluated on the full
+        DataFrame once and cached until the styles are recomputed.
+        """
+        from pandas.io.formats.style_render import (
+            maybe_convert_css_to_tuples, non_reducing_slice,
+        )
+        if not df.index.is_unique or not df.columns.is_unique:
+            raise KeyError('Styles cannot be applied to DataFrames with non-unique index or columns.')
+        index = df.index[rows]
+        subframe = None
+        parsed: dict[str, list[tuple[str, str]]] = {}
+        ctx: dict[tuple[int, int], list[tuple[str, str]]] = {}
+        for i, op in enumerate(ops):
+            subset = non_reducing_slice(slice(None) if op.subset is None else op.subset)
+            if op.row_local:
+                if subframe is None:
+                    subframe = df.iloc[rows]
+                try:
+                    data = subframe.loc[subset]
+                except Exception:
+                    # e.g. a boolean mask subset matching the full DataFrame
+                    data = df.loc[subset]
+                    data = data[data.index.isin(index)]
+                result = _evaluate_style_op(op, data)
+            else:
+                if i not in self._style_cache:
+                    self._style_cache[i] = _evaluate_style_op(op, df.loc[subset])
+                result = self._style_cache[i]
+                if len(index) < len(df):
+                    result = result[result.index.isin(index)]
+            if result.empty:
+                continue
+            row_locs = df.index.get_indexer(result.index)
+            col_locs = df.columns.get_indexer(result.columns)
+            for j, c in enumerate(col_locs):
+                for r, css in zip(row_locs, result.iloc[:, j].to_numpy(dtype=object)):
+                    if not isinstance(css, (str, list)) or not css:
+                        continue
+                    elif isinstance(css, str):
+                        if css not in parsed:
+                            parsed[css] = maybe_convert_css_to_tuples(css)
+                        css_list = parsed[css]
+                    else:
+                        css_list = maybe_convert_css_to_tuples(css)
+                    ctx.setdefault((int(r), int(c)), []).extend(css_list)
+        return ctx
+
+    def _compute_style_data(
+        self, recompute: bool = True, rows: t.Iterable[int] | None = None
+    ) -> tuple[dict[int, dict[int, list]], list[int]] | None:
+        """
+        Computes the styles of the rows displayed on the frontend
+        (or only the requested rows of the displayed rows) keyed by
+        their row and column indexes on the frontend, along with the
+        rows which were computed. Returns None if there is no style.
+        """
+        if self.value is None or self.style is None or self._get_lazy() is not None or self.value.empty:
+            return None
+        df = self._processed
+        if len(self.indexes) > 1:
+            df = df.reset_index()
+
+        start, end = 0, len(df)
+        if self.pagination == 'remote':
+            page_size = self.page_size or self.initial_page_size
+            start = (self.page - 1) * page_size
+            end = min(start + page_size, len(df))
+        visible = np.arange(start, max(start, end))
+
+        ctx: t.Mapping[tuple[int, int], list]
+        if recompute:
+            self._style_cache = {}
+            self._style_ops = _styler_ops(styler_update(self.style, df))
+            self._computed_styler = None
+        if self._style_ops is not None:
+            ops = self._style_ops
+            if rows is not None and all(op.row_local for op in ops):
+                visible = np.array(sorted({r for r in rows if start <= r < end}), dtype=int)
+            try:
+                ctx = self._compute_styles(df, ops, visible)
+            except Exception:
+                ctx = {}
+        else:
+            # Fall back to computing all styles with the pandas Styler
+            if recompute:
+                try:
+                    self._computed_styler = styler = df.style
+                except Exception:
+                    return None
+                if styler is None:
+                    return None
+                styler._todo = styler_update(self.style, df)
+                try:
+                    styler._compute()
+                except Exception:
+                    styler._todo = []
+            elif self._computed_styler is None:
+                return None
+            ctx = self._computed_styler.ctx
+
+        offset, column_mapper = self._get_style_columns(df)
+        styles: dict[int, dict[int, list]] = {}
+        for (r, c), s in ctx.items():
+            if r < start or r >= end:
+                continue
+            r = int(r) - start
             if r not in styles:
-                styles[int(r)] = {}
+                styles[r] = {}
             c = column_mapper.get(int(c), int(c))
-            styles[int(r)][offset+c] = s
+            styles[r][offset+c] = s
+        return styles, [int(r) - start for r in visible]
+
+    def _get_style_data(self, recompute=True):
+        computed = self._compute_style_data(recompute)
+        if computed is None:
+            self._cell_styles = {}
+            return {}
+        self._cell_styles = styles = computed[0]
         return {'id': uuid.uuid4().hex, 'data': styles}
 
+    def _get_style_patch(self, rows: t.Iterable[int]) -> dict[str, t.Any] | None:
+        """
+        Recomputes the styles after the given rows were changed and
+        returns the styles of the rows whose styles changed, keyed by
+        the row index on the frontend, or None if no styles changed.
+        """
+        computed = self._compute_style_data(True, rows)
+        if computed is None:
+            if not self._cell_styles:
+                return None
+            return self._get_style_data()
+        styles, computed_rows = computed
+        patch = {}
+        for r in computed_rows:
+            new = styles.get(r, {})
+            if self._cell_styles.get(r, {}) != new:
+                patch[r] = new
+                if new:
+                    self._cell_styles[r] = new
+                else:
+                    self._cell_styles.pop(r, None)
+        if not patch:
+            return None
+        return {'id': uuid.uuid4().hex, 'data': patch, 'type': 'patch'}
+
     def _get_selectable(self):
         if self.value is None or self.selectable_rows is None:
             return None
         df = self._processed
-        if self.pagination == 'remote':
+        if self.pagination == 'remote' and self._get_lazy() is None:
             nrows = self.page_size or self.initial_page_size
             start = (self.page-1)*nrows
             df = df.iloc[start:(start+nrows)]
         return self.selectable_rows(df)
 
-    def _update_style(self, recompute=True):
-        styles = self._get_style_data(recompute)
+    def _update_style(self, recompute=True, rows=None):
+        if rows is None:
+            styles = self._get_style_data(recompute)
+        else:
+            styles = self._get_style_patch(rows)
+            if styles is None:
+                return
         msg = {'cell_styles': styles}
         for ref, (m, _) in self._models.copy().items():
             self._apply_update([], msg, m, ref)
@@ -1812,15 +2326,35 @@ class Tabulator(BaseTable):
                 return
             self._processed, _ = self._get_data()
             return
+        nrows = 0 if self._processed is None else len(self._processed)
         super()._stream(stream, rollover)
-        self._update_style()
+        # Unless rows were rolled over only the new rows are restyled
+        nstream = len(next(iter(stream.values()), []))
+        if len(self._processed) == nrows + nstream:
+            self._update_style(rows=range(nrows, len(self._processed)))
+        else:
+            self._update_style()
         self._update_selectable()
         self._update_index_mapping()
 
     def stream(self, stream_value, rollover=None, reset_index=True, follow=True):
+        import pandas as pd
+        if self._get_lazy() is not None:
+            raise ValueError(
+                f"Streaming to a lazy DataFrame of type {type(self.value).__name__} "
+                "is not supported."
+            )
         for ref, (model, _) in self._models.copy().items():
             self._apply_update([], {'follow': follow}, model, ref)
-        super().stream(stream_value, rollover, reset_index)
+        # Allows the cached view to be updated with just the new rows
+        if isinstance(stream_value, pd.DataFrame):
+            self._view_appended = len(stream_value)
+        elif isinstance(stream_value, pd.Series):
+            self._view_appended = 1
+        try:
+            super().stream(stream_value, rollover, reset_index)
+        finally:
+            self._view_appended = None
         if follow and self.pagination:
             self._update_max_page()
         if follow and self.pagination:
@@ -1832,6 +2366,7 @@ class Tabulator(BaseTable):
     def _patch(self, patch):
         if self.filters or self._filters or self.sorters:
             self._updating = False
+            self._view_cache = None
             self._update_cds()
             return
         if self.pagination == 'remote':
@@ -1848,7 +2383,16 @@ class Tabulator(BaseTable):
         if not patch:
             return
         super()._patch(patch)
-        self._update_style()
+        rows = set()
+        for values in patch.values():
+            for ind, _ in values:
+                if isinstance(ind, tuple):
+                    ind = ind[0]
+                if isinstance(ind, slice):
+                    rows.update(range(*ind.indices(len(self._processed))))
+                else:
+                    rows.add(int(ind))
+        self._update_style(rows=rows)
         self._update_selectable()
 
     def _update_cds(self, *events):
@@ -1857,6 +2401,10 @@ class Tabulator(BaseTable):
         page_events = ('page', 'page_size', 'sorters')
         if self._updating:
             return
+        elif any(e.name == 'value' or e.obj is not self for e in events):
+            # The value was modified in place or a filter dependency changed
+            self._view_cache = None
+            self._lazy_view = None
         elif events and all(e.name in page_events for e in events) and self.pagination == 'local':
             return
         elif events and all(e.name in page_events for e in events) and not self.pagination:
@@ -1894,7 +2442,11 @@ class Tabulator(BaseTable):
 
     def _update_selected(self, *events: param.parameterized.Event, indices=None):
         kwargs = {}
-        if self.value is not None:
+        if self._get_lazy() is not None:
+            # The selection holds positions in the view, which index the page
+            page = self._processed.index
+            kwargs['indices'] = [page.get_loc(sel) for sel in self.selection if sel in page]
+        elif self.value is not None:
             # Compute integer indexes of the selected rows
             # on the displayed page
             index = self.value.iloc[self.selection].index
@@ -1941,7 +2493,10 @@ class Tabulator(BaseTable):
         self._fire_pending_edits(column, index)
 
     def _map_indexes(self, indexes: list[int], existing: list[int] = [], add: bool = True) -> list[int]:
-        if self.pagination == 'remote':
+        # The page of a lazy DataFrame is indexed by the positions
+        # of its rows in the view, which identify the rows
+        lazy = self._get_lazy() is not None
+        if self.pagination == 'remote' and not lazy:
             nrows = self.page_size or self.initial_page_size
             start = (self.page-1)*nrows
         else:
@@ -1952,11 +2507,14 @@ class Tabulator(BaseTable):
         except IndexError:
             index = self._processed.iloc[[]].index
         for v in index.values:
-            try:
-                iloc = self.value.index.get_loc(v)
-                self._validate_iloc(v, iloc)
-            except KeyError:
-                continue
+            if lazy:
+                iloc = int(v)
+            else:
+                try:
+                    iloc = self.value.index.get_loc(v)
+                    self._validate_iloc(v, iloc)
+                except KeyError:
+                    continue
             if add:
                 ilocs.append(iloc)
             elif iloc in ilocs:
@@ -1966,6 +2524,19 @@ class Tabulator(BaseTable):
     def _update_expanded(self, expanded):
         self.expanded = self._map_indexes(expanded)
 
+    @property
+    def selected_dataframe(self):
+        """
+        Returns a DataFrame of the currently selected rows.
+
+        If the value is a lazy DataFrame only the selected rows are
+        collected into a pandas DataFrame.
+        """
+        lazy = self._get_lazy()
+        if lazy is None:
+            return super().selected_dataframe
+        return lazy.take(self._get_lazy_view(lazy), self.selection)
+
     def _update_selection(self, indices: list[int] | SelectionEvent):
         if isinstance(indices, list):
             selected = True
@@ -2004,7 +2575,9 @@ class Tabulator(BaseTable):
                 ]
         params = Reactive._process_param_change(self, params)
         if 'disabled' in params:
-            params['editable'] = not params.pop('disabled') and len(self.indexes) <= 1
+            params['editable'] = (
+                not params.pop('disabled') and len(self.indexes) <= 1 and self._get_lazy() is None
+            )
         if 'frozen_rows' in params:
             length = self._length
             params['frozen_rows'] = [
@@ -2012,7 +2585,10 @@ class Tabulator(BaseTable):
             ]
         if 'hidden_columns' in params:
             import pandas as pd
-            if not self.show_index and self.value is not None and not isinstance(self.value.index, pd.MultiIndex):
+            if self._get_lazy() is not None:
+                # The index of the page is the position of the rows in the view
+                params['hidden_columns'] = params['hidden_columns'] + ['index']
+            elif not self.show_index and self.value is not None and not isinstance(self.value.index, pd.MultiIndex):
                 params['hidden_columns'] = params['hidden_columns'] + [self.value.index.name or 'index']
         if 'selectable_rows' in params:
             params['selectable_rows'] = self._get_selectable()
@@ -2181,11 +2757,11 @@ class Tabulator(BaseTable):
                 col_dict['titleFormatterParams'] = title_formatter
             if field in self.indexes:
                 if len(self.indexes) == 1:
-                    dtype = self.value.index.dtype
+                    dtype = self._schema.index.dtype
                 else:
-                    dtype = self.value.index.get_level_values(self.indexes.index(field)).dtype
+                    dtype = self._schema.index.get_level_values(self.indexes.index(field)).dtype
             else:
-                dtype = self.value.dtypes[index]
+                dtype = self._schema.dtypes[index]
             if dtype.kind == 'M':
                 col_dict['sorter'] = 'timestamp'
             elif dtype.kind in 'iuf':
@@ -2366,7 +2942,13 @@ class Tabulator(BaseTable):
         """
         Returns the current view of the table after filtering and
         sorting are applied.
+
+        If the value is a lazy DataFrame the view is returned as a
+        lazy DataFrame of the same type.
         """
+        lazy = self._get_lazy()
+        if lazy is not None:
+            return lazy.to_native(self._get_lazy_view(lazy))
         df = self._processed
         if self.pagination == 'remote':
             return df
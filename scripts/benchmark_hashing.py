@@ -0,0 +1,51 @@
+"""
+Benchmarks the hash backends used by pn.cache on large DataFrames.
+
+Usage:
+
+    python scripts/benchmark_hashing.py --rows 10000000 --repeat 3
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from panel.io.cache import _HASH_BACKENDS, _generate_hash, _set_hash_backend
+
+
+def make_frame(rows):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'int': rng.integers(0, 1_000_000, rows),
+        'float': rng.random(rows),
+        'bool': rng.random(rows) > 0.5,
+        'date': pd.date_range('2000-01-01', periods=rows, freq='s'),
+        'category': pd.Categorical(rng.choice(['a', 'b', 'c'], rows)),
+    })
+
+
+def main(rows, repeat):
+    df = make_frame(rows)
+    print(f'Hashing DataFrame with {rows:,} rows ({df.memory_usage().sum() / 1024**2:.0f} MB)')
+    for backend in _HASH_BACKENDS:
+        try:
+            _set_hash_backend(backend)
+        except ImportError:
+            print(f'{backend:>8}: not installed')
+            continue
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            _generate_hash(df)
+            timings.append(time.perf_counter() - start)
+        print(f'{backend:>8}: {min(timings):.3f}s (best of {repeat})')
+    _set_hash_backend('auto')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=10_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    main(args.rows, args.repeat)